@@ -1,10 +1,30 @@
-from src.populate_db.users import PopulateRawDB
+import time
+
+START = time.perf_counter()
+
+import argparse
+
+from src.startup import timeline
 from src.tui.login import ColaboraApp
 
 
-def main():
-    PopulateRawDB().run()
-    ColaboraApp().run()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Colabora APP')
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='imprime a linha do tempo da inicialização ao sair',
+    )
+    args = parser.parse_args(argv)
+
+    timeline.start = START
+    timeline.mark('imports')
+    app = ColaboraApp()
+    timeline.mark('app criado')
+    app.run()
+
+    if args.profile_startup:
+        print(timeline.report())
 
 
 if __name__ == '__main__':
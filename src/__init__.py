@@ -18,3 +18,22 @@ logger.add(
     retention=5,
     format='{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}',  # Formato detalhado
 )
+
+
+def add_slow_query_log(path: str | Path = 'slow_queries.log') -> int:
+    """
+    Grava as queries lentas em `path`; retorna o id do sink. O arquivo só
+    é criado na primeira query lenta.
+    """
+    return logger.add(
+        path,
+        level='WARNING',
+        rotation='10 MB',
+        retention=5,
+        delay=True,
+        filter=lambda record: record['extra'].get('slow_query', False),
+        format='{time:YYYY-MM-DD HH:mm:ss.SSS} | {message}',
+    )
+
+
+slow_query_sink = add_slow_query_log()
@@ -0,0 +1 @@
+from .runner import BENCHMARKS, Benchmark, benchmark, compare, measure, run
@@ -0,0 +1,119 @@
+"""
+Roda os benchmarks de repositórios e casos de uso.
+
+Uso:
+    python -m src.benchmarks --sizes 1000 10000
+    python -m src.benchmarks --sizes 1000 --save-baseline
+    python -m src.benchmarks --only 'ProjectRepository.*' --tolerance 0.3
+    python -m src.benchmarks --suite tui --sizes 100 1000
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from src.benchmarks import runner
+from src.benchmarks.tui import run_tui
+
+
+def _tolerance_item(value: str) -> tuple[str, float]:
+    pattern, _, tolerance = value.rpartition('=')
+    if not pattern:
+        raise argparse.ArgumentTypeError('use o formato PADRÃO=TOLERÂNCIA')
+    return pattern, float(tolerance)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1_000, 10_000]
+    )
+    parser.add_argument('--only', nargs='+', help='padrões de nome (fnmatch)')
+    parser.add_argument('--repeat', type=int, help='execuções por cenário')
+    parser.add_argument(
+        '--suite',
+        choices=['repositories', 'tui'],
+        default='repositories',
+        help='repositórios e casos de uso, ou telas da TUI',
+    )
+    parser.add_argument(
+        '--output', type=Path, help='padrão: .benchmarks/results-SUITE.json'
+    )
+    parser.add_argument(
+        '--baseline', type=Path, help='padrão: .benchmarks/baseline-SUITE.json'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='grava os resultados como nova baseline',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='piora máxima aceita (fração da baseline)',
+    )
+    parser.add_argument(
+        '--tolerance-for',
+        type=_tolerance_item,
+        action='append',
+        default=[],
+        metavar='PADRÃO=TOLERÂNCIA',
+        help='tolerância específica para alguns cenários',
+    )
+    parser.add_argument('--min-delta-ms', type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    # Os logs dos repositórios atrapalhariam a leitura (e a medição)
+    logger.disable('src')
+    try:
+        if args.suite == 'tui':
+            results = asyncio.run(run_tui(args.sizes, args.only, args.repeat))
+            report = runner.build_report(results, args.sizes)
+        else:
+            report = runner.run(args.sizes, args.only, args.repeat)
+    finally:
+        logger.enable('src')
+
+    output = (
+        args.output or runner.BENCHMARKS_PATH / f'results-{args.suite}.json'
+    )
+    baseline_path = (
+        args.baseline or runner.BENCHMARKS_PATH / f'baseline-{args.suite}.json'
+    )
+
+    for key, stats in report['results'].items():
+        widgets = f" {stats['widgets']} widgets" if 'widgets' in stats else ''
+        print(
+            f"{key:<70} {stats['median_ms']:>10.3f} ms "
+            f"(p95 {stats['p95_ms']:.3f}) {stats['queries']:g} queries"
+            f'{widgets}'
+        )
+    runner.save_report(report, output)
+
+    if args.save_baseline:
+        runner.save_report(report, baseline_path)
+        print(f'Baseline gravada em {baseline_path}')
+        return 0
+
+    baseline = runner.load_report(baseline_path)
+    if baseline is None:
+        print('Nenhuma baseline encontrada (use --save-baseline).')
+        return 0
+
+    regressions = runner.compare(
+        report,
+        baseline,
+        args.tolerance,
+        dict(args.tolerance_for),
+        args.min_delta_ms,
+    )
+    for regression in regressions:
+        print(f'REGRESSÃO {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
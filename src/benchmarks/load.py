@@ -0,0 +1,347 @@
+"""
+Simulador de carga concorrente sobre os casos de uso.
+
+Vários workers (threads ou processos) executam login, navegação paginada,
+inscrições e edição de perfil sobre uma cópia da base sintética, cada um
+com a sua conexão SQLite. O relatório traz vazão, percentis de latência e
+quantas vezes o banco estava travado (SQLITE_BUSY), com o tempo perdido
+esperando o lock.
+
+Uso:
+    python -m src.benchmarks.load --users 1000 --workers 8 --duration 10
+    python -m src.benchmarks.load --mode process --mix browse=8,subscribe=2
+"""
+import argparse
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from src.populate_db.synthetic import DEFAULT_PASSWORD, FIRST_NAMES
+from src.repositories import (
+    LoginAttemptRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.database import Database
+from src.repositories.instrumentation import percentile
+from src.security import LoginThrottle, PasswordManager
+from src.use_cases import SubscribeToProjectUseCase, UpdateUserUseCase
+from src.use_cases.login import LoginUseCase
+
+from . import runner
+
+DEFAULT_MIX = {'login': 1, 'browse': 6, 'subscribe': 2, 'update_user': 1}
+
+# Registro de uma operação: (nome, latência ms, BUSYs, espera ms, sucesso)
+OperationRecord = tuple[str, float, int, float, bool]
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Converte 'login=1,browse=6' em pesos por operação.
+
+    >>> parse_mix('login=1,browse=6')
+    {'login': 1.0, 'browse': 6.0}
+    """
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Operação desconhecida: '{name}'")
+        mix[name] = float(weight)
+    return mix
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+class Workload:
+    """Operações de um worker, sobre a conexão da sua thread."""
+
+    def __init__(self, config: dict):
+        self.rng = random.Random(config['seed'])
+        self.max_retries = config['max_retries']
+
+        conn = Database().thread_connection(timeout=config['busy_timeout'])
+        self.user_repo = UserRepository(db_connection=conn)
+        self.project_repo = ProjectRepository(db_connection=conn)
+        throttle = (
+            LoginThrottle(LoginAttemptRepository(db_connection=conn))
+            if config['throttle']
+            else None
+        )
+        self.login_uc = LoginUseCase(
+            self.user_repo, PasswordManager(), throttle
+        )
+        self.update_user_uc = UpdateUserUseCase(self.user_repo)
+        self.subscribe_uc = SubscribeToProjectUseCase(self.user_repo)
+
+        self.users = config['users']
+        self.project_count = config['project_count']
+
+    def login(self) -> None:
+        _, email = self.rng.choice(self.users)
+        self.login_uc.execute(email, DEFAULT_PASSWORD)
+
+    def browse(self) -> None:
+        pages = max(1, self.project_count // 10)
+        self.project_repo.find_all_with_habilities_paginated(
+            self.rng.randint(1, pages), per_page=10
+        )
+
+    def subscribe(self) -> None:
+        """Alterna a inscrição, como na tela de projetos."""
+        user_id, _ = self.rng.choice(self.users)
+        project_id = self.rng.randint(1, self.project_count)
+        if not self.user_repo.unsubscribe(user_id, project_id):
+            self.subscribe_uc.execute(user_id, project_id)
+
+    def update_user(self) -> None:
+        user_id, _ = self.rng.choice(self.users)
+        self.update_user_uc.execute(
+            user_id, first_name=self.rng.choice(FIRST_NAMES)
+        )
+
+    def call(self, name: str) -> OperationRecord:
+        """
+        Executa a operação, repetindo-a enquanto o banco estiver travado.
+        Conta os SQLITE_BUSY e o tempo perdido desde o primeiro deles.
+        """
+        operation = getattr(self, name)
+        busy = 0
+        first_busy = None
+        start = time.perf_counter()
+        while True:
+            try:
+                operation()
+                ok = True
+                break
+            except sqlite3.OperationalError as e:
+                if not _is_busy(e) or busy >= self.max_retries:
+                    ok = False
+                    break
+                busy += 1
+                first_busy = first_busy or time.perf_counter()
+                # Backoff exponencial com jitter
+                time.sleep(self.rng.uniform(0, 0.001 * 2 ** min(busy, 7)))
+            except Exception:
+                ok = False
+                break
+
+        end = time.perf_counter()
+        lock_wait = (end - first_busy) * 1000 if first_busy else 0.0
+        return name, (end - start) * 1000, busy, lock_wait, ok
+
+
+def _run_worker(config: dict) -> list[OperationRecord]:
+    """Roda um worker até acabar o tempo ou o número de operações."""
+    workload = Workload(config)
+    names = list(config['mix'])
+    weights = list(config['mix'].values())
+
+    records = []
+    deadline = time.perf_counter() + config['duration']
+    try:
+        while time.perf_counter() < deadline and (
+            config['operations'] is None or len(records) < config['operations']
+        ):
+            name = workload.rng.choices(names, weights)[0]
+            records.append(workload.call(name))
+    finally:
+        Database().close_thread_connection()
+    return records
+
+
+def _init_process(path: str) -> None:
+    """
+    Cada processo aponta o singleton `Database` para a base da carga e
+    silencia os logs da aplicação (o processo termina com a carga).
+    """
+    logger.disable('src')
+    Database._instance = None
+    Database(connection=sqlite3.connect(path, check_same_thread=False))
+
+
+def summarize(records: list[OperationRecord], elapsed: float) -> dict:
+    """Agrega os registros por operação e no total."""
+    groups: dict[str, list[OperationRecord]] = {'total': records}
+    for record in records:
+        groups.setdefault(record[0], []).append(record)
+
+    summary = {}
+    for name, group in groups.items():
+        latencies = sorted(r[1] for r in group)
+        summary[name] = {
+            'operations': len(group),
+            'errors': sum(not r[4] for r in group),
+            'throughput_per_s': len(group) / elapsed,
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'busy': sum(r[2] for r in group),
+            'lock_wait_ms': sum(r[3] for r in group),
+        }
+    return summary
+
+
+def run_load(
+    size: int = 1_000,
+    workers: int = 8,
+    mode: str = 'thread',
+    duration: float = 10.0,
+    operations: Optional[int] = None,
+    mix: Optional[dict[str, float]] = None,
+    busy_timeout: float = 0.0,
+    max_retries: int = 50,
+    wal: bool = False,
+    throttle: bool = False,
+    seed: int = 42,
+) -> dict:
+    """
+    Roda a carga sobre uma cópia da base sintética de `size` usuários e
+    retorna o relatório.
+
+    `busy_timeout=0` faz o SQLite falhar na hora quando o banco está
+    travado, para que cada SQLITE_BUSY seja contado (e repetido aqui).
+    """
+    mix = mix or DEFAULT_MIX
+    workdir = Path(tempfile.mkdtemp(prefix='colabora-load-'))
+    path = workdir / 'load.sqlite3'
+    shutil.copyfile(runner.dataset_path(size), path)
+
+    connection = sqlite3.connect(path, check_same_thread=False)
+    if wal:
+        connection.execute('PRAGMA journal_mode = WAL')
+    # Lidos antes da carga: durante ela, o banco pode estar travado
+    users = [
+        tuple(row) for row in connection.execute('SELECT id, email FROM User')
+    ]
+    project_count = connection.execute(
+        'SELECT COUNT(*) FROM Project'
+    ).fetchone()[0]
+
+    configs = [
+        {
+            'seed': seed + i,
+            'users': users,
+            'project_count': project_count,
+            'mix': mix,
+            'duration': duration,
+            'operations': operations,
+            'busy_timeout': busy_timeout,
+            'max_retries': max_retries,
+            'throttle': throttle,
+        }
+        for i in range(workers)
+    ]
+
+    # Os logs dos repositórios atrapalhariam a medição (e aumentariam a
+    # disputa pelo lock); são religados ao fim da carga
+    logger.disable('src')
+    try:
+        with runner.using_database(connection):
+            if mode == 'process':
+                executor = ProcessPoolExecutor(
+                    workers, initializer=_init_process, initargs=(str(path),)
+                )
+            else:
+                executor = ThreadPoolExecutor(workers)
+            start = time.perf_counter()
+            with executor:
+                batches = list(executor.map(_run_worker, configs))
+            elapsed = time.perf_counter() - start
+    finally:
+        logger.enable('src')
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    records = [record for batch in batches for record in batch]
+    return {
+        'meta': runner.build_report({}, [size])['meta'],
+        'config': {
+            'size': size,
+            'workers': workers,
+            'mode': mode,
+            'duration': duration,
+            'operations': operations,
+            'mix': mix,
+            'busy_timeout': busy_timeout,
+            'wal': wal,
+            'throttle': throttle,
+        },
+        'elapsed_s': elapsed,
+        'results': summarize(records, elapsed),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(
+        description='Simula vários usuários usando a aplicação ao mesmo tempo.'
+    )
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument(
+        '--mode', choices=['thread', 'process'], default='thread'
+    )
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument(
+        '--operations', type=int, help='limite de operações por worker'
+    )
+    parser.add_argument(
+        '--mix',
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help='pesos das operações, ex.: login=1,browse=6,subscribe=2',
+    )
+    parser.add_argument(
+        '--busy-timeout',
+        type=float,
+        default=0.0,
+        help='espera do SQLite por um lock, em segundos',
+    )
+    parser.add_argument('--wal', action='store_true', help='usa WAL')
+    parser.add_argument(
+        '--throttle', action='store_true', help='ativa o LoginThrottle'
+    )
+    parser.add_argument(
+        '--output', type=Path, default=runner.BENCHMARKS_PATH / 'load.json'
+    )
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        size=args.users,
+        workers=args.workers,
+        mode=args.mode,
+        duration=args.duration,
+        operations=args.operations,
+        mix=args.mix,
+        busy_timeout=args.busy_timeout,
+        wal=args.wal,
+        throttle=args.throttle,
+    )
+
+    print(
+        f"{'operação':<12} {'ops':>7} {'erros':>6} {'ops/s':>9} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9} {'BUSY':>6} {'espera':>10}"
+    )
+    for name, stats in report['results'].items():
+        print(
+            f"{name:<12} {stats['operations']:>7} {stats['errors']:>6} "
+            f"{stats['throughput_per_s']:>9.1f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} "
+            f"{stats['busy']:>6} {stats['lock_wait_ms']:>8.0f}ms"
+        )
+    runner.save_report(report, args.output)
+    return report
+
+
+if __name__ == '__main__':
+    main()
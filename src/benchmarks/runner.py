@@ -0,0 +1,253 @@
+import fnmatch
+import json
+import platform
+import shutil
+import sqlite3
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from src import BASE_PATH
+from src.populate_db.synthetic import SyntheticDataset
+from src.repositories.database import Database
+from src.repositories.instrumentation import percentile
+from src.repositories.query_counter import QueryCounter
+
+# Resultados, baseline e bases sintéticas ficam fora do controle de versão:
+# os tempos dependem da máquina
+BENCHMARKS_PATH = BASE_PATH / '.benchmarks'
+
+
+class Benchmark:
+    """
+    Um cenário medido. `setup(size)` prepara o estado e retorna a função
+    que será cronometrada; `sized=False` indica que o cenário não depende
+    do tamanho da base (roda uma vez só).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[int], Callable[[], object]],
+        repeat: int = 20,
+        sized: bool = True,
+    ):
+        self.name = name
+        self.setup = setup
+        self.repeat = repeat
+        self.sized = sized
+
+    def __repr__(self):
+        return f"<Benchmark(name='{self.name}', repeat={self.repeat})>"
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, repeat: int = 20, sized: bool = True):
+    """Registra um cenário no conjunto de benchmarks."""
+
+    def decorator(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, repeat, sized)
+        return setup
+
+    return decorator
+
+
+def measure(
+    func: Callable[[], object], repeat: int = 20, warmup: int = 1
+) -> dict:
+    """
+    Executa `func` `repeat` vezes e retorna as estatísticas do tempo (ms)
+    e a quantidade de queries por execução.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    with QueryCounter('benchmark') as counter:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples, counter.total / repeat)
+
+
+def summarize(samples: list[float], queries: float, **extra) -> dict:
+    """Estatísticas de uma lista de tempos (ms), no formato do relatório."""
+    samples = sorted(samples)
+    return {
+        'runs': len(samples),
+        'min_ms': samples[0],
+        'median_ms': statistics.median(samples),
+        'p95_ms': percentile(samples, 95),
+        'mean_ms': statistics.fmean(samples),
+        'queries': queries,
+        **extra,
+    }
+
+
+@contextmanager
+def using_database(connection: sqlite3.Connection) -> Iterator[Database]:
+    """
+    Troca temporariamente a conexão do singleton `Database`, para que os
+    repositórios usem a base de benchmark.
+    """
+    previous = Database._instance
+    Database._instance = None
+    try:
+        yield Database(connection=connection)
+    finally:
+        connection.close()
+        Database._instance = previous
+
+
+def dataset_path(size: int, seed: int = 42) -> Path:
+    """
+    Retorna (gerando, se preciso) a base sintética de `size` usuários.
+    A geração é determinística, então a base é reaproveitada entre rodadas.
+    """
+    path = BENCHMARKS_PATH / f'synthetic-{size}-{seed}.sqlite3'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        SyntheticDataset(
+            users=size,
+            organizations=max(2, size // 50),
+            projects=max(10, size // 5),
+            seed=seed,
+        ).generate(path)
+    return path
+
+
+def open_copy(path: Path) -> sqlite3.Connection:
+    """Abre uma cópia em memória da base, para os cenários que escrevem."""
+    source = sqlite3.connect(path)
+    conn = sqlite3.connect(':memory:', check_same_thread=False)
+    source.backup(conn)
+    source.close()
+    return conn
+
+
+def open_file_copy(path: Path, directory: Path) -> sqlite3.Connection:
+    """
+    Abre uma cópia da base em `directory`. Com um arquivo, os workers de
+    thread abrem conexões próprias (`Database.thread_connection`); com
+    uma cópia em memória, voltariam para a thread da interface.
+    """
+    copy = directory / path.name
+    shutil.copyfile(path, copy)
+    return sqlite3.connect(copy, check_same_thread=False)
+
+
+def build_report(results: dict, sizes: list[int]) -> dict:
+    """Monta o relatório gravado em JSON."""
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'machine': platform.machine(),
+            'sizes': sizes,
+        },
+        'results': results,
+    }
+
+
+def run(
+    sizes: list[int],
+    only: Optional[list[str]] = None,
+    repeat: Optional[int] = None,
+) -> dict:
+    """
+    Roda os cenários registrados em cada tamanho de base e retorna o
+    relatório no formato gravado em JSON.
+    """
+    # Importado aqui para registrar os cenários
+    from src.benchmarks import suite  # noqa: F401
+
+    selected = [
+        bench
+        for name, bench in BENCHMARKS.items()
+        if not only or any(fnmatch.fnmatch(name, p) for p in only)
+    ]
+
+    results = {}
+    for bench in selected:
+        for size in sizes if bench.sized else [None]:
+            conn = (
+                open_copy(dataset_path(size))
+                if size
+                else sqlite3.connect(':memory:', check_same_thread=False)
+            )
+            with using_database(conn):
+                func = bench.setup(size)
+                key = bench.name if size is None else f'{bench.name}[{size}]'
+                results[key] = measure(func, repeat or bench.repeat)
+
+    return build_report(results, sizes)
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    tolerance: float = 0.25,
+    tolerances: Optional[dict[str, float]] = None,
+    min_delta_ms: float = 0.05,
+    metric: str = 'median_ms',
+) -> list[str]:
+    """
+    Compara o relatório com a baseline e lista as regressões: cenários cujo
+    `metric` piorou mais que a tolerância (fração, ex.: 0.25 = 25%) ou que
+    passaram a fazer mais queries (ou montar mais widgets).
+    `tolerances` sobrescreve a tolerância por padrão de nome (fnmatch) e
+    diferenças abaixo de `min_delta_ms` são tratadas como ruído.
+
+    >>> base = {'results': {'a[10]': {'median_ms': 1.0, 'queries': 2}}}
+    >>> new = {'results': {'a[10]': {'median_ms': 1.5, 'queries': 2}}}
+    >>> compare(new, base)
+    ['a[10]: median_ms 1.000 -> 1.500 ms (+50%, tolerância 25%)']
+    >>> compare(new, base, tolerances={'a[*': 0.6})
+    []
+    """
+    regressions = []
+    for key, current in report['results'].items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+
+        allowed = tolerance
+        for pattern, value in (tolerances or {}).items():
+            if fnmatch.fnmatch(key, pattern):
+                allowed = value
+
+        before, after = previous[metric], current[metric]
+        if after - before > max(before * allowed, min_delta_ms):
+            regressions.append(
+                f'{key}: {metric} {before:.3f} -> {after:.3f} ms '
+                f'(+{(after / before - 1) * 100:.0f}%, '
+                f'tolerância {allowed * 100:.0f}%)'
+            )
+        for counter in ('queries', 'widgets'):
+            if current.get(counter, 0) > previous.get(counter, 0):
+                regressions.append(
+                    f'{key}: {counter} {previous.get(counter, 0):g} -> '
+                    f'{current[counter]:g}'
+                )
+    return regressions
+
+
+def load_report(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,120 @@
+"""
+Cenários medidos pelo `python -m src.benchmarks`.
+
+Cada cenário recebe o tamanho da base (quantidade de usuários da base
+sintética) e retorna a função cronometrada.
+"""
+import random
+
+from src.populate_db.synthetic import DEFAULT_PASSWORD
+from src.populate_db.users import PopulateRawDB
+from src.repositories import (
+    HabilityRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.database import Database
+from src.security import PasswordManager
+from src.use_cases import SubscribeToProjectUseCase
+from src.use_cases.login import LoginUseCase
+
+from .runner import benchmark
+
+SEED_TABLES = (
+    'User_Habilities',
+    'User_Projects',
+    'Project_Habilities',
+    'Project',
+    'User',
+    'Organization',
+    'Hability',
+    'Metadata',
+)
+
+
+@benchmark('ProjectRepository.find_all_with_habilities_paginated')
+def paginated_projects(size: int):
+    repo = ProjectRepository()
+    # Página do meio: o OFFSET faz o SQLite percorrer metade da tabela
+    page = max(1, repo.count() // 10 // 2)
+    return lambda: repo.find_all_with_habilities_paginated(page, per_page=10)
+
+
+@benchmark('ProjectRepository.find_by_ids_with_all_relations')
+def projects_by_ids(size: int):
+    repo = ProjectRepository()
+    rng = random.Random(size)
+    ids = rng.sample(range(1, repo.count() + 1), k=min(50, repo.count()))
+    return lambda: repo.find_by_ids_with_all_relations(ids)
+
+
+@benchmark('UserRepository.get_by_id_with_all_relations')
+def user_with_relations(size: int):
+    repo = UserRepository()
+    ids = iter(random.Random(size).choices(range(1, size + 1), k=10_000))
+    return lambda: repo.get_by_id_with_all_relations(next(ids))
+
+
+@benchmark('UserRepository.save[large relations]')
+def save_user_with_many_relations(size: int):
+    repo = UserRepository()
+    user = repo.get_by_id(1)
+    user.habilities = HabilityRepository().find_all()
+    user.projects = ProjectRepository().find_paginated(1, per_page=200)
+    return lambda: repo.save(user)
+
+
+@benchmark('SubscribeToProjectUseCase[toggle]')
+def subscription_toggle(size: int):
+    use_case = SubscribeToProjectUseCase(UserRepository())
+    # Um par usuário/projeto que compartilha uma habilidade
+    row = (
+        Database()
+        .connection.execute(
+            """
+        SELECT uh.user_id, ph.project_id FROM User_Habilities uh
+        JOIN Project_Habilities ph ON ph.hability_id = uh.hability_id
+        LIMIT 1
+        """
+        )
+        .fetchone()
+    )
+
+    def toggle():
+        use_case.execute(*row)
+        use_case.cancel(*row)
+
+    return toggle
+
+
+@benchmark('LoginUseCase.execute', repeat=5)
+def login(size: int):
+    # Sem throttle: as tentativas repetidas seriam bloqueadas
+    use_case = LoginUseCase(UserRepository(), PasswordManager())
+    emails = [
+        row['email']
+        for row in Database().connection.execute(
+            'SELECT email FROM User ORDER BY id LIMIT 100'
+        )
+    ]
+    emails = iter(emails * 100)
+    return lambda: use_case.execute(next(emails), DEFAULT_PASSWORD)
+
+
+@benchmark('PopulateRawDB.run[cold]', repeat=3, sized=False)
+def seeding_cold(size: None):
+    conn = Database().connection
+
+    def run():
+        with conn:
+            for table in SEED_TABLES:
+                conn.execute(f'DELETE FROM {table}')
+        PopulateRawDB().run()
+
+    return run
+
+
+@benchmark('PopulateRawDB.run[unchanged]', sized=False)
+def seeding_unchanged(size: None):
+    PopulateRawDB().run()
+    return PopulateRawDB().run
@@ -0,0 +1,239 @@
+"""
+Benchmarks das telas, rodando a TUI sem terminal (`App.run_test`).
+
+Para cada tela e tamanho de base são medidos:
+
+- `mount`: da construção da tela até ela estar montada;
+- `first_paint`: da construção até a primeira renderização da tela;
+- `ready`: da construção até os workers terminarem e a tela ser
+  redesenhada com os dados, com a contagem de widgets;
+- `key:<ação>`: do pressionar de uma tecla até a tela ser redesenhada,
+  incluindo os workers disparados por ela (ex.: dados de uma aba).
+
+A base é uma cópia em arquivo, para que os workers abram conexões
+próprias como no app; as queries contadas são as da thread da interface.
+"""
+import fnmatch
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from textual.app import App
+from textual.pilot import Pilot
+from textual.screen import Screen
+
+from src.container import ServiceContainer
+from src.models import Role
+from src.repositories import UserRepository
+from src.repositories.database import Database
+from src.repositories.query_counter import QueryCounter
+from src.tui.admin import AdminScreen
+from src.tui.login import css_path
+from src.tui.project import ProjectScreen
+from src.tui.user import UserScreen
+
+from .runner import (
+    dataset_path,
+    open_file_copy,
+    summarize,
+    using_database,
+)
+
+
+class Interaction:
+    """Foca o widget `selector` e mede o efeito de pressionar `keys`."""
+
+    def __init__(self, selector: str, *keys: str):
+        self.selector = selector
+        self.keys = keys
+
+
+class TuiScenario:
+    """
+    Uma tela medida. `setup()` constrói a tela (com os repositórios já
+    apontando para a base de benchmark) e `interactions` são executadas em
+    ordem, depois da tela pronta.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Screen],
+        interactions: dict[str, Interaction],
+        repeat: int = 3,
+    ):
+        self.name = name
+        self.setup = setup
+        self.interactions = interactions
+        self.repeat = repeat
+
+
+TUI_SCENARIOS: dict[str, TuiScenario] = {}
+
+
+def tui_benchmark(
+    name: str,
+    interactions: Optional[dict[str, Interaction]] = None,
+    repeat: int = 3,
+):
+    """Registra uma tela no conjunto de benchmarks da TUI."""
+
+    def decorator(setup):
+        TUI_SCENARIOS[name] = TuiScenario(
+            name, setup, interactions or {}, repeat
+        )
+        return setup
+
+    return decorator
+
+
+class HarnessApp(App):
+    """App vazio, com o CSS da aplicação."""
+
+    CSS_PATH = css_path
+
+
+async def _wait_until_ready(pilot: Pilot, screen: Screen) -> float:
+    """
+    Espera os workers terminarem e a fila esvaziar; retorna o instante em
+    que a tela é redesenhada com o resultado.
+    """
+    await screen.workers.wait_for_complete()
+    await pilot.pause()
+    await screen.wait_for_refresh()
+    return time.perf_counter()
+
+
+async def measure_screen(scenario: TuiScenario) -> dict[str, dict]:
+    """Roda uma vez a tela do cenário e retorna tempos (ms) e contagens."""
+    app = HarnessApp()
+    sample = {}
+    async with app.run_test(size=(160, 50)) as pilot:
+        with QueryCounter(scenario.name) as counter:
+            start = time.perf_counter()
+            screen = scenario.setup()
+            await app.push_screen(screen)
+            sample['mount'] = time.perf_counter() - start
+            await screen.wait_for_refresh()
+            sample['first_paint'] = time.perf_counter() - start
+            sample['ready'] = await _wait_until_ready(pilot, screen) - start
+        queries = dict.fromkeys(sample, counter.total)
+        widgets = len(list(screen.walk_children(with_self=False)))
+
+        for action, interaction in scenario.interactions.items():
+            screen.query_one(interaction.selector).focus()
+            await pilot.pause()
+            with QueryCounter(f'{scenario.name}.{action}') as counter:
+                start = time.perf_counter()
+                await pilot.press(*interaction.keys)
+                painted = await _wait_until_ready(pilot, screen)
+            sample[f'key:{action}'] = painted - start
+            queries[f'key:{action}'] = counter.total
+
+    return {
+        metric: {'ms': seconds * 1000, 'queries': queries[metric]}
+        | ({'widgets': widgets} if metric == 'ready' else {})
+        for metric, seconds in sample.items()
+    }
+
+
+async def run_tui(
+    sizes: list[int],
+    only: Optional[list[str]] = None,
+    repeat: Optional[int] = None,
+) -> dict[str, dict]:
+    """Roda as telas registradas em cada tamanho de base."""
+    results = {}
+    for scenario in TUI_SCENARIOS.values():
+        if only and not any(fnmatch.fnmatch(scenario.name, p) for p in only):
+            continue
+        for size in sizes:
+            samples: dict[str, list[dict]] = {}
+            with tempfile.TemporaryDirectory() as tmp, using_database(
+                open_file_copy(dataset_path(size), Path(tmp))
+            ):
+                for _ in range(repeat or scenario.repeat):
+                    for metric, value in (
+                        await measure_screen(scenario)
+                    ).items():
+                        samples.setdefault(metric, []).append(value)
+
+            for metric, values in samples.items():
+                extra = (
+                    {'widgets': values[-1]['widgets']}
+                    if 'widgets' in values[-1]
+                    else {}
+                )
+                results[f'{scenario.name}.{metric}[{size}]'] = summarize(
+                    [v['ms'] for v in values],
+                    values[-1]['queries'],
+                    **extra,
+                )
+    return results
+
+
+def _first_user(role: Optional[str] = None):
+    sql = 'SELECT id FROM User ORDER BY id LIMIT 1'
+    params = ()
+    if role:
+        sql = 'SELECT id FROM User WHERE role = ? ORDER BY id LIMIT 1'
+        params = (role,)
+    row = Database().connection.execute(sql, params).fetchone()
+    return UserRepository().get_by_id(row['id'])
+
+
+@tui_benchmark(
+    'ProjectScreen',
+    {
+        'search': Interaction('#search-project', 'a'),
+        'next_page': Interaction('#next-page', 'enter'),
+    },
+)
+def project_screen() -> Screen:
+    services = ServiceContainer()
+    return ProjectScreen(
+        user=_first_user(),
+        user_repository=services.user_repository,
+        project_repository=services.project_repository,
+        subscribe_use_case=services.subscribe_use_case,
+    )
+
+
+@tui_benchmark(
+    'AdminScreen',
+    {
+        'projects_tab': Interaction('#main-tabs Tabs', 'right'),
+        'projects_edit_tab': Interaction('#proj-crud-tabs Tabs', 'right'),
+        'select_project': Interaction('#proj-edit-list DataTable', 'enter'),
+    },
+)
+def admin_screen() -> Screen:
+    return AdminScreen(
+        user_logged=_first_user(Role.ADMIN), services=ServiceContainer()
+    )
+
+
+@tui_benchmark(
+    'UserScreen',
+    {
+        'expand_domain': Interaction(
+            '.domain-section CollapsibleTitle', 'enter'
+        ),
+        'search': Interaction('#hability-search', 'a'),
+    },
+)
+def user_screen() -> Screen:
+    # Os mesmos dados que o worker do login carrega antes de abrir a tela
+    services = ServiceContainer()
+    return UserScreen(
+        user=services.user_repository.get_by_id_with_all_relations(
+            _first_user().id
+        ),
+        user_repository=services.user_repository,
+        hability_repository=services.hability_repository,
+        update_user_use_case=services.update_user_use_case,
+        replace_password_use_case=services.replace_password_use_case,
+        habilities_data=services.hability_repository.get_dict_by_domain(),
+        services=services,
+    )
@@ -0,0 +1,131 @@
+"""
+Contêiner de serviços da aplicação.
+
+Os repositórios e casos de uso são montados uma vez, na primeira vez em
+que são pedidos, e compartilhados por todas as telas: um único
+`HabilityRepository` serve ao `ProjectRepository`, ao `UserRepository`
+e aos casos de uso, em vez de cada `factory()` ou tela montar o seu.
+"""
+import sqlite3
+from functools import cached_property
+from typing import Optional
+
+from src.events import EventBus, bus
+from src.repositories import (
+    CatalogRepository,
+    HabilityRepository,
+    LoginAttemptRepository,
+    OrganizationRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.security import LoginThrottle, PasswordManager
+from src.use_cases import (
+    LoginUseCase,
+    RegisterUserUseCase,
+    ReplacePasswordUseCase,
+    SubscribeToProjectUseCase,
+    UpdateProjectUseCase,
+    UpdateUserUseCase,
+)
+from src.validators import email_validator, password_validator
+
+
+class ServiceContainer:
+    """
+    Monta e guarda uma instância de cada serviço, sob demanda.
+
+    Todos os repositórios usam a mesma conexão (`db_connection`, ou a do
+    `Database`). Os serviços devem ser pedidos na thread da interface; os
+    workers recebem cópias ligadas à conexão deles, montadas uma vez por
+    conexão (`src.tui.workers.bind_to_connection`).
+    """
+
+    def __init__(
+        self,
+        db_connection: Optional[sqlite3.Connection] = None,
+        events: Optional[EventBus] = None,
+    ):
+        self._db_connection = db_connection
+        self.events = events or bus
+
+    # Repositórios
+
+    @cached_property
+    def hability_repository(self) -> HabilityRepository:
+        return HabilityRepository(self._db_connection)
+
+    @cached_property
+    def organization_repository(self) -> OrganizationRepository:
+        return OrganizationRepository(self._db_connection)
+
+    @cached_property
+    def project_repository(self) -> ProjectRepository:
+        return ProjectRepository(
+            self._db_connection,
+            hability_repo=self.hability_repository,
+            org_repo=self.organization_repository,
+        )
+
+    @cached_property
+    def user_repository(self) -> UserRepository:
+        return UserRepository(
+            self._db_connection,
+            hability_repo=self.hability_repository,
+            project_repo=self.project_repository,
+        )
+
+    @cached_property
+    def catalog_repository(self) -> CatalogRepository:
+        return CatalogRepository(
+            self.project_repository, self.hability_repository
+        )
+
+    @cached_property
+    def login_attempt_repository(self) -> LoginAttemptRepository:
+        return LoginAttemptRepository(self._db_connection)
+
+    # Segurança
+
+    @cached_property
+    def password_manager(self) -> PasswordManager:
+        return PasswordManager()
+
+    @cached_property
+    def login_throttle(self) -> LoginThrottle:
+        return LoginThrottle(self.login_attempt_repository)
+
+    # Casos de uso
+
+    @cached_property
+    def login_use_case(self) -> LoginUseCase:
+        return LoginUseCase(
+            self.user_repository, self.password_manager, self.login_throttle
+        )
+
+    @cached_property
+    def register_user_use_case(self) -> RegisterUserUseCase:
+        return RegisterUserUseCase(
+            self.user_repository,
+            self.password_manager,
+            email_validator,
+            password_validator,
+        )
+
+    @cached_property
+    def replace_password_use_case(self) -> ReplacePasswordUseCase:
+        return ReplacePasswordUseCase(
+            self.user_repository, self.password_manager, password_validator
+        )
+
+    @cached_property
+    def update_user_use_case(self) -> UpdateUserUseCase:
+        return UpdateUserUseCase(self.user_repository, self.events)
+
+    @cached_property
+    def update_project_use_case(self) -> UpdateProjectUseCase:
+        return UpdateProjectUseCase(self.project_repository)
+
+    @cached_property
+    def subscribe_use_case(self) -> SubscribeToProjectUseCase:
+        return SubscribeToProjectUseCase(self.user_repository, self.events)
@@ -0,0 +1,98 @@
+"""
+Eventos de domínio e o barramento em memória que os entrega.
+
+Os casos de uso publicam o que mudou (uma inscrição criada, uma
+habilidade adicionada) e as telas interessadas se inscrevem, em vez de
+reler o usuário do banco para descobrir.
+"""
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class Event:
+    """Base dos eventos de domínio."""
+
+
+@dataclass(frozen=True)
+class HabilityAdded(Event):
+    user_id: int
+    hability_id: int
+
+
+@dataclass(frozen=True)
+class HabilityRemoved(Event):
+    user_id: int
+    hability_id: int
+
+
+@dataclass(frozen=True)
+class SubscriptionCreated(Event):
+    user_id: int
+    project_id: int
+
+
+@dataclass(frozen=True)
+class SubscriptionRemoved(Event):
+    user_id: int
+    project_id: int
+
+
+E = TypeVar('E', bound=Event)
+
+
+class EventBus:
+    """
+    Barramento de eventos do processo.
+
+    `publish` chama os handlers na thread de quem publicou, na ordem em que
+    se inscreveram; um handler inscrito em uma classe recebe também as
+    suas subclasses. Um handler que falha é registrado no log e não impede
+    os demais.
+
+    >>> bus = EventBus()
+    >>> unsubscribe = bus.subscribe(SubscriptionCreated, print)
+    >>> bus.publish(SubscriptionCreated(user_id=1, project_id=2))
+    SubscriptionCreated(user_id=1, project_id=2)
+    >>> unsubscribe()
+    >>> bus.publish(SubscriptionCreated(user_id=1, project_id=2))
+    """
+
+    def __init__(self):
+        self._handlers: dict[type, list[Callable]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self, event_type: type[E], handler: Callable[[E], None]
+    ) -> Callable[[], None]:
+        """Inscreve `handler`; retorna a função que cancela a inscrição."""
+        with self._lock:
+            self._handlers[event_type].append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if handler in self._handlers[event_type]:
+                    self._handlers[event_type].remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event: Event) -> None:
+        with self._lock:
+            handlers = [
+                handler
+                for event_type in type(event).__mro__
+                for handler in self._handlers.get(event_type, ())
+            ]
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception(f'Erro ao tratar o evento {event!r}')
+
+
+# Barramento compartilhado pelos casos de uso e telas da aplicação
+bus = EventBus()
@@ -1,4 +1,5 @@
 from .hability import Hability
+from .login_attempt import LoginAttempt
 from .organizations import Organization
 from .projects import Project
 from .users import Role, User
@@ -0,0 +1,27 @@
+class LoginAttempt:
+    """Estado das tentativas de login falhas de um e-mail."""
+
+    def __init__(
+        self,
+        email: str,
+        failures: int = 0,
+        blocked_until: float = 0.0,
+        id: int = None,
+    ):
+        self.id = id
+        self.email = email
+        self.failures = failures
+        self.blocked_until = blocked_until
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'email': self.email,
+            'failures': self.failures,
+            'blocked_until': self.blocked_until,
+        }
+
+    def __repr__(self):
+        return (
+            f"<LoginAttempt(email='{self.email}', failures={self.failures})>"
+        )
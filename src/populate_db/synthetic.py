@@ -0,0 +1,332 @@
+"""
+Gerador de uma base sintética grande e determinística, usada como fixture
+dos testes de desempenho.
+
+Uso:
+    python -m src.populate_db.synthetic bench.sqlite3 --users 50000
+"""
+import argparse
+import json
+import random
+import sqlite3
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from loguru import logger
+
+from src import SEEDS_PATH
+from src.repositories.migrations import SCHEMA_SCRIPT, migrate
+from src.security import PasswordManager
+
+DEFAULT_PASSWORD = 'SenhaForte123*'
+BATCH_SIZE = 10_000
+FIRST_NAMES = (
+    'Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fábio', 'Gabriela',
+    'Heitor', 'Isabela', 'João', 'Larissa', 'Marcos', 'Natália', 'Otávio',
+    'Paula', 'Rafael', 'Sofia', 'Tiago', 'Vitória', 'William',
+)  # fmt: skip
+LAST_NAMES = (
+    'Almeida', 'Barbosa', 'Cardoso', 'Costa', 'Dias', 'Ferreira', 'Gomes',
+    'Lima', 'Martins', 'Moura', 'Oliveira', 'Pereira', 'Ribeiro', 'Rocha',
+    'Santos', 'Silva', 'Souza', 'Teixeira',
+)  # fmt: skip
+PROJECT_THEMES = (
+    'Horta Comunitária', 'Reforço Escolar', 'Mutirão de Reformas',
+    'Campanha de Doação', 'Oficina de Tecnologia', 'Apoio Jurídico',
+    'Atendimento Psicológico', 'Feira Solidária', 'Biblioteca Itinerante',
+    'Resgate Animal',
+)  # fmt: skip
+
+
+def _batched(rows: Iterable, size: int = BATCH_SIZE) -> Iterator[list]:
+    """Agrupa um iterável em listas de até `size` itens."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class SyntheticDataset:
+    """
+    Gera usuários, organizações, projetos, habilidades e inscrições em um
+    arquivo SQLite novo, com o mesmo schema da aplicação.
+
+    O gerador é determinístico: a mesma `seed` produz sempre os mesmos
+    dados. As habilidades são as das seeds, com popularidade desigual
+    (poucas muito comuns, muitas raras), e as inscrições seguem uma cauda
+    longa. Todos os usuários compartilham um único hash de senha,
+    calculado uma vez só.
+    """
+
+    def __init__(
+        self,
+        users: int = 10_000,
+        organizations: int = 200,
+        projects: int = 2_000,
+        seed: int = 42,
+        password: str = DEFAULT_PASSWORD,
+        password_manager: Optional[PasswordManager] = None,
+        habilities_per_user: int = 4,
+        habilities_per_project: int = 3,
+        subscriptions_per_user: float = 2.0,
+    ):
+        self.users = users
+        self.organizations = organizations
+        self.projects = projects
+        self.seed = seed
+        self.password = password
+        self.password_manager = password_manager or PasswordManager()
+        self.habilities_per_user = habilities_per_user
+        self.habilities_per_project = habilities_per_project
+        self.subscriptions_per_user = subscriptions_per_user
+
+    def generate(self, path: Path | str, overwrite: bool = False) -> dict:
+        """
+        Cria o banco em `path` e retorna a quantidade de linhas por tabela.
+        """
+        path = Path(path)
+        if path.exists():
+            if not overwrite:
+                raise FileExistsError(f"O arquivo '{path}' já existe.")
+            path.unlink()
+
+        start = time.perf_counter()
+        conn = sqlite3.connect(path)
+        try:
+            # Base descartável: durabilidade não importa durante a carga
+            conn.execute('PRAGMA synchronous = OFF')
+            conn.execute('PRAGMA journal_mode = MEMORY')
+            conn.executescript(SCHEMA_SCRIPT)
+            with conn:
+                counts = self._populate(conn)
+            # Índices e demais migrações depois da carga: mais rápido
+            migrate(conn)
+        finally:
+            conn.close()
+
+        logger.info(
+            f"Base sintética '{path}' gerada em "
+            f'{time.perf_counter() - start:.1f}s: {counts}'
+        )
+        return counts
+
+    def _populate(self, conn: sqlite3.Connection) -> dict:
+        rng = random.Random(self.seed)
+
+        hability_ids = self._insert_habilities(conn)
+        # Popularidade em cauda longa: peso 1/posição, ordem sorteada
+        popular = hability_ids[:]
+        rng.shuffle(popular)
+        weights = [1 / rank for rank in range(1, len(popular) + 1)]
+
+        def pick_habilities(k: int) -> set[int]:
+            return set(rng.choices(popular, weights, k=k))
+
+        self._insert_organizations(conn)
+        projects_by_hability = self._insert_projects(
+            conn, rng, pick_habilities
+        )
+        self._insert_users(conn, rng, pick_habilities, projects_by_hability)
+        conn.execute(
+            'INSERT OR REPLACE INTO Metadata (key, value) VALUES (?, ?)',
+            ('synthetic_dataset', json.dumps(self.params())),
+        )
+
+        tables = (
+            'User',
+            'Organization',
+            'Project',
+            'Hability',
+            'User_Habilities',
+            'Project_Habilities',
+            'User_Projects',
+        )
+        return {
+            table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in tables
+        }
+
+    def params(self) -> dict:
+        """Parâmetros usados na geração (gravados na tabela `Metadata`)."""
+        return {
+            'users': self.users,
+            'organizations': self.organizations,
+            'projects': self.projects,
+            'seed': self.seed,
+            'habilities_per_user': self.habilities_per_user,
+            'habilities_per_project': self.habilities_per_project,
+            'subscriptions_per_user': self.subscriptions_per_user,
+        }
+
+    def _insert_habilities(self, conn: sqlite3.Connection) -> list[int]:
+        with open(SEEDS_PATH / 'habilities.json', 'r', encoding='utf-8') as f:
+            habilities_data = json.load(f)
+        rows = [
+            (hability['name'], hability['description'], domain)
+            for domain, habilities in habilities_data.items()
+            for hability in habilities
+        ]
+        conn.executemany(
+            'INSERT INTO Hability (id, name, description, domain) '
+            'VALUES (?, ?, ?, ?)',
+            [(i, *row) for i, row in enumerate(rows, start=1)],
+        )
+        return list(range(1, len(rows) + 1))
+
+    def _insert_organizations(self, conn: sqlite3.Connection) -> None:
+        conn.executemany(
+            """
+            INSERT INTO Organization
+                (id, name, description, contact_email, contact_phone, website)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    i,
+                    f'Organização {i}',
+                    f'Organização sintética número {i}.',
+                    f'contato@org{i}.org',
+                    f'5511{900000000 + i}',
+                    f'https://org{i}.org',
+                )
+                for i in range(1, self.organizations + 1)
+            ),
+        )
+
+    def _insert_projects(
+        self, conn: sqlite3.Connection, rng: random.Random, pick_habilities
+    ) -> dict[int, list[int]]:
+        """Insere os projetos e retorna os projetos de cada habilidade."""
+        # Poucas organizações concentram a maioria dos projetos
+        org_ids = list(range(1, self.organizations + 1))
+        org_weights = [1 / rank for rank in org_ids]
+        projects_by_hability: dict[int, list[int]] = {}
+        links = []
+
+        def projects():
+            for i in range(1, self.projects + 1):
+                theme = PROJECT_THEMES[i % len(PROJECT_THEMES)]
+                org_id = (
+                    rng.choices(org_ids, org_weights)[0] if org_ids else None
+                )
+                for hability_id in pick_habilities(
+                    rng.randint(1, 2 * self.habilities_per_project - 1)
+                ):
+                    links.append((i, hability_id))
+                    projects_by_hability.setdefault(hability_id, []).append(i)
+                yield i, f'{theme} #{i}', f'Projeto sintético {i}.', org_id
+
+        for batch in _batched(projects()):
+            conn.executemany(
+                'INSERT INTO Project (id, name, description, organization_id) '
+                'VALUES (?, ?, ?, ?)',
+                batch,
+            )
+        conn.executemany(
+            'INSERT INTO Project_Habilities (project_id, hability_id) '
+            'VALUES (?, ?)',
+            links,
+        )
+        return projects_by_hability
+
+    def _insert_users(
+        self,
+        conn: sqlite3.Connection,
+        rng: random.Random,
+        pick_habilities,
+        projects_by_hability: dict[int, list[int]],
+    ) -> None:
+        # Um único hash para todos: o scrypt levaria minutos em escala
+        hash_password, salt = self.password_manager.hash_password(
+            self.password
+        )
+        user_habilities = []
+        subscriptions = []
+
+        def users():
+            for i in range(1, self.users + 1):
+                first_name = rng.choice(FIRST_NAMES)
+                last_name = rng.choice(LAST_NAMES)
+                role = 'ADMIN' if rng.random() < 0.01 else 'USER'
+                habilities = sorted(
+                    pick_habilities(
+                        rng.randint(1, 2 * self.habilities_per_user - 1)
+                    )
+                )
+                user_habilities.extend((i, h) for h in habilities)
+
+                # Inscrições em projetos que pedem alguma habilidade do
+                # usuário; a quantidade segue uma cauda longa
+                wanted = int(rng.expovariate(1 / self.subscriptions_per_user))
+                chosen = set()
+                for _ in range(wanted):
+                    candidates = projects_by_hability.get(
+                        rng.choice(habilities)
+                    )
+                    if candidates:
+                        chosen.add(rng.choice(candidates))
+                subscriptions.extend((i, p) for p in sorted(chosen))
+
+                yield (
+                    i,
+                    f'{first_name}.{last_name}.{i}@example.com'.lower(),
+                    hash_password,
+                    salt,
+                    first_name,
+                    last_name,
+                    f'5511{rng.randint(900000000, 999999999)}',
+                    role,
+                )
+
+        for batch in _batched(users()):
+            conn.executemany(
+                """
+                INSERT INTO User (id, email, password, salt, first_name,
+                                  last_name, phone, role)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                batch,
+            )
+            conn.executemany(
+                'INSERT INTO User_Habilities (user_id, hability_id) '
+                'VALUES (?, ?)',
+                user_habilities,
+            )
+            conn.executemany(
+                'INSERT INTO User_Projects (user_id, project_id) '
+                'VALUES (?, ?)',
+                subscriptions,
+            )
+            user_habilities.clear()
+            subscriptions.clear()
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(
+        description='Gera uma base SQLite sintética para testes de escala.'
+    )
+    parser.add_argument('path', type=Path, help='arquivo SQLite de destino')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--organizations', type=int, default=200)
+    parser.add_argument('--projects', type=int, default=2_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument(
+        '--force', action='store_true', help='sobrescreve o arquivo'
+    )
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset(
+        users=args.users,
+        organizations=args.organizations,
+        projects=args.projects,
+        seed=args.seed,
+    )
+    counts = dataset.generate(args.path, overwrite=args.force)
+    for table, count in counts.items():
+        print(f'{table}: {count}')
+    return counts
+
+
+if __name__ == '__main__':
+    main()
@@ -1,118 +1,217 @@
+import hashlib
 import json
+import sqlite3
+from typing import Optional
 
 from loguru import logger
 
 from src import SEEDS_PATH
-from src.models.hability import Hability
-from src.models.organizations import Organization
-from src.models.projects import Project
-from src.repositories.hability import HabilityRepository
-from src.repositories.organization import OrganizationRepository
-from src.repositories.project import ProjectRepository
-from src.repositories.user import UserRepository
+from src.repositories.database import Database
+from src.repositories.instrumentation import InstrumentedCursor
+from src.security import PasswordManager
 
+SEED_FILES = (
+    'habilities.json',
+    'organizations.json',
+    'projects.json',
+    'users.json',
+)
+SEED_FINGERPRINT_KEY = 'seed_fingerprint'
 
-class PopulateRawDB:
-    def __init__(self):
-        self.user_repository = UserRepository()
-        self.organization_repository = OrganizationRepository()
-        self.project_repository = ProjectRepository()
-        self.hability_repository = HabilityRepository()
-
-    def run(self):
-        self.populate_users()
-        self.populate_organizations()
-        self.populate_habilities()
-        self.populate_projects()
-
-    def populate_users(self) -> None:
-        """Popula o banco de dados com usuários do arquivo JSON."""
-
-        if self.user_repository.count() != 0:
-            return
-
-        from src.use_cases.register import RegisterUserUseCase
-
-        logger.info('Populando tabela de Usuários...')
-        file_path = SEEDS_PATH / 'users.json'
-        with open(file_path, 'r', encoding='utf-8') as f:
-            users_data = json.load(f)
-            for user_data in users_data:
-                user, _ = RegisterUserUseCase.factory().execute(
-                    email=user_data['email'], password=user_data['password']
-                )
-                user.first_name = user_data['first_name']
-                user.last_name = user_data['last_name']
-                user.role = user_data['role']
-                self.user_repository.save(user)
 
-        logger.info(
-            f'Tabela de Usuários populada com {self.user_repository.count()} usuários.'
+class PopulateRawDB:
+    """
+    Popula o banco com os dados de `seeds/`.
+
+    Toda a carga roda em uma única transação, com inserts em lote
+    (`executemany`) e mapas nome -> id pré-carregados. Os inserts ignoram
+    registros já existentes, então rodar de novo é seguro. A impressão
+    digital dos arquivos de seed fica na tabela `Metadata`: se nada mudou,
+    a carga é pulada com uma única consulta.
+    """
+
+    def __init__(
+        self,
+        password_manager: PasswordManager = None,
+        connection: Optional[sqlite3.Connection] = None,
+    ):
+        self.db = Database()
+        if connection is None or connection is self.db.connection:
+            self.conn = self.db.connection
+            self.cursor = self.db.cursor
+        else:
+            # Conexão própria (ex.: a de um worker que popula em segundo
+            # plano)
+            connection.row_factory = sqlite3.Row
+            self.conn = connection
+            self.cursor = connection.cursor(InstrumentedCursor)
+        self.password_manager = password_manager or PasswordManager()
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Hash SHA-256 do conteúdo dos arquivos de seed."""
+        digest = hashlib.sha256()
+        for name in SEED_FILES:
+            digest.update(name.encode())
+            digest.update((SEEDS_PATH / name).read_bytes())
+        return digest.hexdigest()
+
+    def _load(self, name: str):
+        with open(SEEDS_PATH / name, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _stored_fingerprint(self) -> str | None:
+        self.cursor.execute(
+            'SELECT value FROM Metadata WHERE key = ?', (SEED_FINGERPRINT_KEY,)
         )
-
-    def populate_organizations(self) -> None:
-        """Popula o banco de dados com organizações do arquivo JSON."""
-        if self.organization_repository.count() != 0:
-            return
-
-        logger.info('Populando tabela de Organizações...')
-        file_path = SEEDS_PATH / 'organizations.json'
-        with open(file_path, 'r', encoding='utf-8') as f:
-            organizations_data = json.load(f)
-            for org_data in organizations_data:
-                organization = Organization(**org_data)
-                self.organization_repository.save(organization)
-        logger.info(
-            f'Tabela de Organizações populada com {self.organization_repository.count()} organizações.'
+        row = self.cursor.fetchone()
+        return row['value'] if row else None
+
+    def run(self) -> bool:
+        """Carrega as seeds; retorna False se elas já estavam no banco."""
+        fingerprint = self.fingerprint()
+        if self._stored_fingerprint() == fingerprint:
+            logger.debug('Seeds inalteradas, população do banco ignorada.')
+            return False
+
+        logger.info('Populando banco de dados a partir das seeds...')
+
+        # O scrypt é a parte lenta: roda em paralelo e antes da transação.
+        # Em threads, e não processos: a carga roda num worker do app, e
+        # criar processos (fork) a partir dele não é seguro
+        users = self._users_to_create(self._load('users.json'))
+        hashes = self.password_manager.hash_passwords(
+            [user['password'] for user in users], processes=False
         )
 
-    def populate_projects(self) -> None:
-        """Popula o banco de dados com projetos do arquivo JSON."""
-
-        if self.project_repository.count() != 0:
-            return
-
-        logger.info('Populando tabela de Projetos...')
-        file_path = SEEDS_PATH / 'projects.json'
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for project_data in data['projects']:
-                habilities_names = project_data.pop('required_habilities', [])
-                project = Project(**project_data)
-                project.habilities = self.hability_repository.find_by_names(
-                    habilities_names
+        try:
+            with self.conn:
+                self.populate_habilities(self._load('habilities.json'))
+                org_ids = self.populate_organizations(
+                    self._load('organizations.json')
                 )
-                self.project_repository.save(project)
-
-        logger.info(
-            f'Tabela de Projetos populada com {self.project_repository.count()} projetos.'
+                self.populate_projects(
+                    self._load('projects.json')['projects'], org_ids
+                )
+                self.populate_users(users, hashes)
+                self.cursor.execute(
+                    'INSERT OR REPLACE INTO Metadata (key, value) VALUES (?, ?)',
+                    (SEED_FINGERPRINT_KEY, fingerprint),
+                )
+        except sqlite3.Error as e:
+            logger.error(f'Erro ao popular o banco de dados: {e}')
+            raise
+
+        logger.info('Banco de dados populado a partir das seeds.')
+        return True
+
+    def _users_to_create(self, users_data: list[dict]) -> list[dict]:
+        """Filtra os usuários das seeds que ainda não existem no banco."""
+        self.cursor.execute(
+            'SELECT email FROM User WHERE email IN (SELECT value FROM json_each(?))',
+            (json.dumps([user['email'] for user in users_data]),),
+        )
+        existing = {row['email'] for row in self.cursor.fetchall()}
+        return [user for user in users_data if user['email'] not in existing]
+
+    def populate_users(
+        self, users_data: list[dict], hashes: list[tuple[str, bytes]]
+    ) -> None:
+        """Insere os usuários (com as senhas já convertidas em hash)."""
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO User
+                (email, password, salt, first_name, last_name, role)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    user['email'],
+                    hash_password,
+                    salt,
+                    user.get('first_name'),
+                    user.get('last_name'),
+                    user.get('role', 'USER'),
+                )
+                for user, (hash_password, salt) in zip(users_data, hashes)
+            ],
         )
 
-    def populate_habilities(self) -> None:
-        """Popula o banco de dados com habilidades do arquivo JSON."""
-
-        if self.hability_repository.count() != 0:
-            return
-
-        logger.info('Populando tabela de Habilidades...')
-        file = SEEDS_PATH / 'habilities.json'
-        populated_data = {}
-
-        with open(file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-            for domain, habilities_list in data.items():
-                populated_data[domain] = []
-                for hability_dict in habilities_list:
-                    hability_obj = Hability(
-                        name=hability_dict['name'],
-                        description=hability_dict['description'],
-                        domain=domain,
-                    )
+    def populate_organizations(self, organizations_data: list[dict]) -> dict:
+        """
+        Insere as organizações e retorna um mapa da posição na seed
+        (1, 2, ...) para o id no banco, usado pelos projetos.
+        """
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO Organization
+                (name, description, contact_email, contact_phone, website)
+            VALUES
+                (:name, :description, :contact_email, :contact_phone, :website)
+            """,
+            organizations_data,
+        )
+        self.cursor.execute('SELECT id, contact_email FROM Organization')
+        ids_by_email = {
+            row['contact_email']: row['id'] for row in self.cursor.fetchall()
+        }
+        return {
+            position: ids_by_email.get(org['contact_email'])
+            for position, org in enumerate(organizations_data, start=1)
+        }
+
+    def populate_habilities(self, habilities_data: dict) -> None:
+        """Insere as habilidades, agrupadas por domínio na seed."""
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO Hability (name, description, domain)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (hability['name'], hability['description'], domain)
+                for domain, habilities in habilities_data.items()
+                for hability in habilities
+            ],
+        )
 
-                    hability_obj = self.hability_repository.save(hability_obj)
+    def populate_projects(self, projects_data: list[dict], org_ids: dict):
+        """Insere os projetos que ainda não existem e suas habilidades."""
+        self.cursor.execute('SELECT id, name FROM Hability')
+        hability_ids = {
+            row['name']: row['id'] for row in self.cursor.fetchall()
+        }
+        self.cursor.execute('SELECT name FROM Project')
+        existing = {row['name'] for row in self.cursor.fetchall()}
+
+        new_projects = [p for p in projects_data if p['name'] not in existing]
+        self.cursor.executemany(
+            """
+            INSERT INTO Project (name, description, organization_id)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (
+                    project['name'],
+                    project['description'],
+                    org_ids.get(project.get('organization_id')),
+                )
+                for project in new_projects
+            ],
+        )
 
-                    populated_data[domain].append(hability_obj)
-        logger.info(
-            f'Banco de dados populado com {self.hability_repository.count()} habilidades.'
+        self.cursor.execute('SELECT id, name FROM Project')
+        project_ids = {
+            row['name']: row['id'] for row in self.cursor.fetchall()
+        }
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO Project_Habilities (project_id, hability_id)
+            VALUES (?, ?)
+            """,
+            [
+                (project_ids[project['name']], hability_ids[name])
+                for project in new_projects
+                for name in project.get('required_habilities', [])
+                if name in hability_ids
+            ],
         )
@@ -1,5 +1,7 @@
 from .base_repository import BaseRepository
+from .catalog import CatalogRepository, CatalogSnapshot
 from .hability import HabilityRepository
+from .login_attempt import LoginAttemptRepository
 from .organization import OrganizationRepository
 from .project import ProjectRepository
 from .user import UserRepository
@@ -1,9 +1,11 @@
+import re
 import sqlite3
 from typing import List, Optional, Type, TypeVar
 
 from loguru import logger
 
 from .database import Database
+from .instrumentation import InstrumentedCursor
 
 T = TypeVar('T')
 
@@ -14,6 +16,9 @@ class BaseRepository:
     linhas do banco para instâncias de modelo.
     """
 
+    # Colunas procuradas por `find_keyset(search=...)`
+    search_columns: tuple[str, ...] = ()
+
     def __init__(
         self,
         table_name: str,
@@ -22,8 +27,14 @@ class BaseRepository:
     ):
         # Se uma conexão for passada, usa-a. Senão, usa o Singleton.
         self.db = Database(connection=db_connection)
-        self.conn = self.db.connection
-        self.cursor = self.db.cursor
+        if db_connection is None or db_connection is self.db.connection:
+            self.conn = self.db.connection
+            self.cursor = self.db.cursor
+        else:
+            # Conexão própria (ex.: uma por thread), com cursor próprio
+            db_connection.row_factory = sqlite3.Row
+            self.conn = db_connection
+            self.cursor = db_connection.cursor(InstrumentedCursor)
         self.table_name = table_name
         self.model_cls = model_cls
 
@@ -123,6 +134,62 @@ class BaseRepository:
         rows = self.cursor.fetchall()
         return [self._map_row_to_model(row) for row in rows]
 
+    @staticmethod
+    def _like_pattern(search: str) -> str:
+        """
+        Padrão LIKE para "contém `search`", com os curingas escapados
+        (use `ESCAPE '\\'`).
+
+        >>> print(BaseRepository._like_pattern('50%_off'))
+        %50\\%\\_off%
+        """
+        return '%' + re.sub(r'([\\%_])', r'\\\1', search) + '%'
+
+    def find_keyset(
+        self,
+        after_id: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> List[T]:
+        """
+        Página de até `limit` registros em ordem de id, logo depois de
+        `after_id` (ou logo antes de `before_id`). A página começa por uma
+        busca na chave primária em vez de um OFFSET, então custa o mesmo
+        em qualquer ponto da tabela. `search` filtra por trecho de
+        `search_columns`.
+        """
+        where, params = [], []
+        if before_id is not None:
+            where.append('id < ?')
+            params.append(before_id)
+        else:
+            where.append('id > ?')
+            params.append(after_id)
+        if search and self.search_columns:
+            pattern = self._like_pattern(search)
+            where.append(
+                '('
+                + ' OR '.join(
+                    f"{column} LIKE ? ESCAPE '\\'"
+                    for column in self.search_columns
+                )
+                + ')'
+            )
+            params += [pattern] * len(self.search_columns)
+
+        order = 'DESC' if before_id is not None else 'ASC'
+        sql = (
+            f'SELECT * FROM {self.table_name} WHERE {" AND ".join(where)} '
+            f'ORDER BY id {order} LIMIT ?'
+        )
+        self.cursor.execute(sql, (*params, limit))
+        rows = self.cursor.fetchall()
+        models = [self._map_row_to_model(row) for row in rows]
+        if before_id is not None:
+            models.reverse()
+        return models
+
     def _update(self, model_instance: T) -> T:
         """
         Atualiza um registro a partir de uma instância de modelo (deve ter um ID).
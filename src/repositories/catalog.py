@@ -0,0 +1,238 @@
+"""
+Snapshot em disco do catálogo público: projetos (com habilidades e
+organização) e a árvore de habilidades por domínio.
+
+O snapshot guarda a `Catalog_Version` do banco em que foi lido. Gatilhos
+avançam essa versão a cada escrita nas tabelas do catálogo, então um
+snapshot só é usado enquanto a versão do banco for a mesma.
+"""
+import os
+import pickle
+import string
+from dataclasses import dataclass, field
+from functools import cached_property
+from math import ceil
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from src import PICKLE_PATH
+from src.models import Hability, Project
+from src.repositories.hability import HabilityRepository
+from src.repositories.project import ProjectRepository
+
+CATALOG_FILE = PICKLE_PATH / 'catalog.pickle'
+# Formato do arquivo: mude quando os modelos guardados mudarem
+SNAPSHOT_FORMAT = 1
+# Projetos por consulta de relações (abaixo do limite de parâmetros)
+RELATIONS_CHUNK = 5_000
+
+# O LIKE do SQLite só ignora maiúsculas nas letras ASCII
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Catálogo em memória, lido do banco na versão `version`.
+
+    >>> snapshot = CatalogSnapshot('t', 1, (Project('Horta', 'Comunitária'),))
+    >>> snapshot.page(1, 10, search='COMUN')['total']
+    1
+    >>> snapshot.page(1, 10, search='horta comunitária')['total']
+    0
+    """
+
+    token: str
+    version: int
+    projects: tuple[Project, ...]  # ordenados por nome
+    habilities_by_domain: dict[str, list[Hability]] = field(
+        default_factory=dict
+    )
+    format: int = SNAPSHOT_FORMAT
+
+    def page(
+        self, page: int = 1, per_page: int = 10, search: Optional[str] = None
+    ) -> dict:
+        """
+        Mesma página de `ProjectRepository.find_all_with_habilities_paginated`,
+        sem consultar o banco.
+        """
+        if page < 1:
+            raise ValueError('page must be >= 1')
+
+        projects = self.projects
+        if search:
+            term = search.translate(_ASCII_LOWER)
+            projects = [
+                project
+                for project, name, description in zip(
+                    projects, *self._search_texts
+                )
+                if term in name or term in description
+            ]
+
+        total = len(projects)
+        total_pages = max(ceil(total / per_page), 1)
+        page = min(page, total_pages) if total else 1
+        start = (page - 1) * per_page
+        return {
+            'data': list(projects[start : start + per_page]),
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'total_pages': total_pages,
+        }
+
+    @cached_property
+    def _search_texts(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Nomes e descrições já em minúsculas, montados na 1ª busca."""
+        return (
+            tuple(
+                (p.name or '').translate(_ASCII_LOWER) for p in self.projects
+            ),
+            tuple(
+                (p.description or '').translate(_ASCII_LOWER)
+                for p in self.projects
+            ),
+        )
+
+    def __getstate__(self) -> dict:
+        # Os textos de busca não vão para o arquivo
+        state = self.__dict__.copy()
+        state.pop('_search_texts', None)
+        return state
+
+
+class CatalogRepository:
+    """
+    Lê, valida e grava o snapshot do catálogo.
+
+    `snapshot` é o último snapshot validado, em memória; quem o atualiza
+    é quem chamou `refresh`, que pode rodar em um worker com uma cópia
+    deste repositório ligada a outra conexão.
+    """
+
+    def __init__(
+        self,
+        project_repo: Optional[ProjectRepository] = None,
+        hability_repo: Optional[HabilityRepository] = None,
+        path: Path = CATALOG_FILE,
+    ):
+        self.project_repo = project_repo or ProjectRepository()
+        self.hability_repo = hability_repo or self.project_repo.hability_repo
+        self.path = Path(path)
+        self.snapshot: Optional[CatalogSnapshot] = None
+
+    def version(self) -> tuple[str, int]:
+        """(token, versão) atuais do catálogo no banco: uma consulta."""
+        cursor = self.project_repo.cursor
+        cursor.execute('SELECT token, version FROM Catalog_Version')
+        row = cursor.fetchone()
+        return row['token'], row['version']
+
+    def refresh(self) -> CatalogSnapshot:
+        """
+        Snapshot válido: o da memória ou o do arquivo, se a versão do banco
+        for a dele; senão, lê o catálogo do banco e grava o arquivo.
+        """
+        current = self.version()
+        if self._matches(self.snapshot, current):
+            return self.snapshot
+        snapshot = self.read()
+        if not self._matches(snapshot, current):
+            snapshot = self.build()
+            self.write(snapshot)
+        # Monta os textos de busca aqui, fora da thread da interface
+        snapshot._search_texts
+        return snapshot
+
+    def habilities_by_domain(self) -> dict[str, list[Hability]]:
+        """
+        Árvore de habilidades por domínio (ex.: para a `UserScreen`): a do
+        snapshot em memória, se a versão do banco ainda for a dele; senão,
+        lida do banco.
+        """
+        snapshot = self.snapshot
+        if self._matches(snapshot, self.version()):
+            return snapshot.habilities_by_domain
+        return self.hability_repo.get_dict_by_domain()
+
+    @staticmethod
+    def _matches(
+        snapshot: Optional[CatalogSnapshot], current: tuple[str, int]
+    ) -> bool:
+        return (
+            snapshot is not None
+            and (snapshot.token, snapshot.version) == current
+        )
+
+    def build(self) -> CatalogSnapshot:
+        """Lê o catálogo inteiro do banco."""
+        # A versão é lida antes dos dados: uma escrita no meio da leitura
+        # deixa o snapshot já desatualizado, e ele é refeito na próxima vez
+        token, version = self.version()
+        repo = self.project_repo
+        repo.cursor.execute(
+            f'SELECT * FROM {repo.table_name} ORDER BY name, id'
+        )
+        projects = [repo._map_row_to_model(r) for r in repo.cursor.fetchall()]
+        for start in range(0, len(projects), RELATIONS_CHUNK):
+            repo._load_relations(projects[start : start + RELATIONS_CHUNK])
+        habilities_by_domain = self.hability_repo.get_dict_by_domain()
+        self._share_relations(projects, habilities_by_domain)
+        return CatalogSnapshot(
+            token, version, tuple(projects), habilities_by_domain
+        )
+
+    @staticmethod
+    def _share_relations(
+        projects: list[Project],
+        habilities_by_domain: dict[str, list[Hability]],
+    ) -> None:
+        """
+        Troca as cópias de cada habilidade e organização (uma por linha
+        lida) por uma instância só, que o pickle grava uma vez.
+        """
+        habilities = {
+            h.id: h for group in habilities_by_domain.values() for h in group
+        }
+        organizations = {}
+        for project in projects:
+            project.habilities = [
+                habilities.setdefault(h.id, h) for h in project.habilities
+            ]
+            if project.organization is not None:
+                project.organization = organizations.setdefault(
+                    project.organization.id, project.organization
+                )
+
+    def read(self) -> Optional[CatalogSnapshot]:
+        """Snapshot do arquivo, ou None se não houver um utilizável."""
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Snapshot do catálogo '{self.path}' ignorado: {e}")
+            return None
+        if (
+            not isinstance(snapshot, CatalogSnapshot)
+            or snapshot.format != SNAPSHOT_FORMAT
+        ):
+            return None
+        return snapshot
+
+    def write(self, snapshot: CatalogSnapshot) -> None:
+        """Grava o arquivo por inteiro ou não grava (arquivo temporário)."""
+        tmp = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f'Não foi possível gravar o snapshot: {e}')
+            tmp.unlink(missing_ok=True)
@@ -1,10 +1,14 @@
 import sqlite3
+import threading
 from typing import Optional
 
 from loguru import logger
 
 from src import BASE_PATH
 
+from .instrumentation import InstrumentedCursor, metrics
+from .migrations import migrate
+
 DB_FILE = BASE_PATH / 'project_db.sqlite3'
 
 
@@ -40,14 +44,26 @@ class Database:
                 logger.debug(f'Erro ao conectar ou criar banco de dados: {e}')
                 raise
 
+        # Arquivo do banco principal ('' para bancos em memória)
+        self.path = next(
+            (
+                row[2]
+                for row in self.connection.execute('PRAGMA database_list')
+                if row[1] == 'main'
+            ),
+            '',
+        )
+        self._thread_local = threading.local()
+
         # Isso faz o sqlite retornar resultados como dicionários (ou tipo 'Row')
         # Facilita muito o 'get_by_id'
         self.connection.row_factory = sqlite3.Row
-        self.cursor = self.connection.cursor()
+        # Cursor instrumentado: tempo, linhas e repositório de cada query
+        self.cursor = self.connection.cursor(InstrumentedCursor)
+        self.metrics = metrics
 
-        # Garante que o schema e os índices sejam criados
-        self._create_schema()
-        self._create_indexes()   # Essencial para performance O(log N)
+        # Garante que o schema e os índices existam (só se desatualizados)
+        self._ensure_schema()
 
         self._initialized = True
 
@@ -57,117 +73,43 @@ class Database:
     def get_connection(self) -> sqlite3.Connection:
         return self.connection
 
+    def thread_connection(self, timeout: float = 5.0) -> sqlite3.Connection:
+        """
+        Retorna uma conexão exclusiva da thread atual com o mesmo arquivo,
+        para uso com `db_connection=` nos repositórios. Bancos em memória
+        não podem ser compartilhados entre conexões: nesse caso a conexão
+        principal é retornada.
+        """
+        if not self.path:
+            return self.connection
+
+        conn = getattr(self._thread_local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=timeout)
+            conn.row_factory = sqlite3.Row
+            self._thread_local.connection = conn
+        return conn
+
+    def close_thread_connection(self) -> None:
+        """Fecha a conexão da thread atual, se ela tiver uma."""
+        conn = getattr(self._thread_local, 'connection', None)
+        if conn is not None:
+            self._thread_local.connection = None
+            conn.close()
+
     def close(self):
         if self.connection:
             self.connection.commit()
             self.connection.close()
             logger.debug(f"Conexão com '{DB_FILE}' fechada.")
 
-    def _execute_script(self, script: str):
-        """Executa um script SQL (pode conter múltiplos comandos)."""
-        try:
-            self.cursor.executescript(script)
-            self.connection.commit()
-        except sqlite3.Error as e:
-            logger.debug(f'Erro ao executar script: {e}')
+    def schema_version(self) -> int:
+        """Versão do schema gravada no arquivo (`PRAGMA user_version`)."""
+        return self.connection.execute('PRAGMA user_version').fetchone()[0]
 
-    def _create_schema(self):
-        """
-        Cria as tabelas principais e as tabelas de junção para relacionamentos N-N.
-        """
-        schema_script = """
-        -- Modelos Principais
-        
-        CREATE TABLE IF NOT EXISTS Organization (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            contact_email TEXT UNIQUE,
-            contact_phone TEXT,
-            website TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS Hability (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            description TEXT,
-            domain TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS User (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT NOT NULL UNIQUE,
-            password TEXT NOT NULL,
-            salt TEXT NOT NULL,
-            first_name TEXT,
-            last_name TEXT,
-            birth_date TEXT, -- SQLite não tem tipo 'date', usamos TEXT (ISO 8601)
-            phone TEXT,
-            role TEXT NOT NULL DEFAULT 'USER'
-        );
-
-        CREATE TABLE IF NOT EXISTS Project (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            
-            -- Relacionamento 1-para-N (ForeignKey)
-            -- Um Projeto pertence a UMA Organização
-            organization_id INTEGER,
-            FOREIGN KEY (organization_id) REFERENCES Organization(id)
-        );
-
-        -- Tabelas de Junção (Relacionamentos N-para-N)
-
-        CREATE TABLE IF NOT EXISTS User_Habilities (
-            user_id INTEGER,
-            hability_id INTEGER,
-            PRIMARY KEY (user_id, hability_id),
-            FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE CASCADE,
-            FOREIGN KEY (hability_id) REFERENCES Hability(id) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS User_Projects (
-            user_id INTEGER,
-            project_id INTEGER,
-            PRIMARY KEY (user_id, project_id),
-            FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE CASCADE,
-            FOREIGN KEY (project_id) REFERENCES Project(id) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS Project_Habilities (
-            project_id INTEGER,
-            hability_id INTEGER,
-            PRIMARY KEY (project_id, hability_id),
-            FOREIGN KEY (project_id) REFERENCES Project(id) ON DELETE CASCADE,
-            FOREIGN KEY (hability_id) REFERENCES Hability(id) ON DELETE CASCADE
-        );
-        """
-        logger.debug('Criando esquema do banco de dados...')
-        self._execute_script(schema_script)
-        logger.debug('Esquema criado com sucesso.')
-
-    def _create_indexes(self):
-        """
-        Cria índices para buscas rápidas O(log N).
+    def _ensure_schema(self):
         """
-        index_script = """
-        -- Índice para busca de usuário por email (O(log N))
-        CREATE INDEX IF NOT EXISTS idx_user_email ON User(email);
-        
-        -- Índices para buscas por nome
-        CREATE INDEX IF NOT EXISTS idx_hability_name ON Hability(name);
-        CREATE INDEX IF NOT EXISTS idx_project_name ON Project(name);
-
-        -- Índices nas chaves estrangeiras (aceleram JOINs)
-        CREATE INDEX IF NOT EXISTS idx_project_organization_id ON Project(organization_id);
-        CREATE INDEX IF NOT EXISTS idx_user_habilities_user ON User_Habilities(user_id);
-        CREATE INDEX IF NOT EXISTS idx_user_habilities_hability ON User_Habilities(hability_id);
-        CREATE INDEX IF NOT EXISTS idx_project_habilities_project ON Project_Habilities(project_id);
-        CREATE INDEX IF NOT EXISTS idx_project_habilities_hability ON Project_Habilities(hability_id);
-        CREATE INDEX IF NOT EXISTS idx_user_projects_user ON User_Projects(user_id);
-        CREATE INDEX IF NOT EXISTS idx_user_projects_project ON User_Projects(project_id);
+        Aplica as migrações pendentes (`src/repositories/migrations.py`).
+        Com o banco em dia, custa só a leitura de `user_version`.
         """
-        logger.debug('Criando índices para performance O(log N)...')
-        self._execute_script(index_script)
-        logger.debug('Índices criados com sucesso.')
+        migrate(self.connection)
@@ -10,6 +10,8 @@ from src.repositories.base_repository import BaseRepository
 
 
 class HabilityRepository(BaseRepository):
+    search_columns = ('name',)
+
     def __init__(self, db_connection: Optional[sqlite3.Connection] = None):
         super().__init__('Hability', Hability, db_connection)
 
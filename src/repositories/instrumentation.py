@@ -0,0 +1,261 @@
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Callable, Optional
+
+from loguru import logger
+
+# Limite (em ms) a partir do qual uma query vai para o log de queries lentas
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('COLABORA_SLOW_QUERY_MS', '50'))
+
+# Quantidade máxima de amostras guardadas por formato de query
+MAX_SAMPLES_PER_SHAPE = 1024
+
+_REPOSITORIES_DIR = str(Path(__file__).parent)
+_IGNORED_FILES = {__file__, str(Path(_REPOSITORIES_DIR) / 'database.py')}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """
+    Reduz uma query ao seu "formato": remove literais, colapsa espaços e
+    listas de placeholders, para que queries equivalentes sejam agrupadas.
+
+    >>> normalize_sql("SELECT *  FROM User WHERE id IN (?, ?, ?) AND x = 'a'")
+    'SELECT * FROM User WHERE id IN (?...) AND x = ?'
+    """
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _WHITESPACE.sub(' ', shape).strip()
+    return _IN_LIST.sub('IN (?...)', shape)
+
+
+def _find_caller(frame: Optional[FrameType]) -> str:
+    """
+    Encontra, subindo a pilha a partir de `frame`, o método de repositório
+    que originou a query.
+    """
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(_REPOSITORIES_DIR)
+            and filename not in _IGNORED_FILES
+        ):
+            instance = frame.f_locals.get('self')
+            owner = (
+                type(instance).__name__ if instance else Path(filename).stem
+            )
+            return f'{owner}.{frame.f_code.co_name}'
+        frame = frame.f_back
+    return '<unknown>'
+
+
+class QueryRecord:
+    """
+    Dados de uma execução de query. `caller` (o método de repositório de
+    origem) só é resolvido para queries lentas, e fica None nas demais.
+    """
+
+    __slots__ = ('sql', 'shape', 'caller', 'duration_ms', 'rows', 'thread_id')
+
+    def __init__(
+        self,
+        sql: str,
+        caller: Optional[str],
+        duration_ms: float,
+        rows: int,
+    ):
+        self.sql = sql
+        self.shape = normalize_sql(sql)
+        self.caller = caller
+        self.duration_ms = duration_ms
+        self.rows = rows
+        self.thread_id = threading.get_ident()
+
+    def __repr__(self):
+        return (
+            f"<QueryRecord(caller='{self.caller}', "
+            f'duration_ms={self.duration_ms:.3f}, rows={self.rows})>'
+        )
+
+
+class _ShapeStats:
+    __slots__ = ('count', 'total_ms', 'rows', 'samples', 'slow_callers')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.rows = 0
+        self.samples: deque[float] = deque(maxlen=MAX_SAMPLES_PER_SHAPE)
+        self.slow_callers: set[str] = set()
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """
+    Percentil pelo método nearest-rank.
+
+    >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+    2.0
+    """
+    if not sorted_samples:
+        return 0.0
+    index = max(0, round(pct / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[min(index, len(sorted_samples) - 1)]
+
+
+class QueryMetrics:
+    """
+    Registro em memória das queries executadas, agrupadas por formato.
+    Expõe p50/p95/p99 de cada formato e envia as lentas para um log próprio.
+    """
+
+    def __init__(self, slow_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS):
+        self.enabled = True
+        self.slow_threshold_ms = slow_threshold_ms
+        self._lock = threading.Lock()
+        self._stats: dict[str, _ShapeStats] = {}
+        self._listeners: list[Callable[[QueryRecord], None]] = []
+
+    def record(self, record: QueryRecord) -> None:
+        with self._lock:
+            stats = self._stats.get(record.shape)
+            if stats is None:
+                stats = self._stats[record.shape] = _ShapeStats()
+            stats.count += 1
+            stats.total_ms += record.duration_ms
+            stats.rows += record.rows
+            stats.samples.append(record.duration_ms)
+            if record.caller is not None:
+                stats.slow_callers.add(record.caller)
+            listeners = list(self._listeners)
+
+        if record.duration_ms >= self.slow_threshold_ms:
+            logger.bind(slow_query=True).warning(
+                f'Query lenta ({record.duration_ms:.1f} ms, '
+                f'{record.rows} linhas) em {record.caller}: {record.shape}'
+            )
+
+        for listener in listeners:
+            listener(record)
+
+    def add_listener(self, listener: Callable[[QueryRecord], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[QueryRecord], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def summary(self) -> dict[str, dict]:
+        """Retorna as estatísticas de cada formato de query."""
+        with self._lock:
+            items = [
+                (shape, stats, sorted(stats.samples))
+                for shape, stats in self._stats.items()
+            ]
+        return {
+            shape: {
+                'count': stats.count,
+                'total_ms': stats.total_ms,
+                'rows': stats.rows,
+                'p50_ms': percentile(samples, 50),
+                'p95_ms': percentile(samples, 95),
+                'p99_ms': percentile(samples, 99),
+                'slow_callers': sorted(stats.slow_callers),
+            }
+            for shape, stats, samples in items
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+metrics = QueryMetrics()
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    Cursor que mede cada statement: tempo de execução (incluindo o fetch),
+    quantidade de linhas e, nas queries lentas, o método de repositório
+    que o chamou.
+    """
+
+    _pending: Optional[list] = None
+
+    def execute(self, sql, parameters=()):
+        if not metrics.enabled:
+            return super().execute(sql, parameters)
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._track(sql, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not metrics.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._track(sql, time.perf_counter() - start)
+
+    def fetchone(self):
+        if self._pending is None:
+            return super().fetchone()
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._pending[2] += time.perf_counter() - start
+        self._pending[3] += row is not None
+        self._flush()
+        return row
+
+    def fetchall(self):
+        if self._pending is None:
+            return super().fetchall()
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._pending[2] += time.perf_counter() - start
+        self._pending[3] += len(rows)
+        self._flush()
+        return rows
+
+    def _track(self, sql: str, elapsed: float) -> None:
+        # Só o frame: o método de origem é resolvido no `_flush`, e apenas
+        # se a query for lenta (subir a pilha a cada query custa caro)
+        pending = [sql, sys._getframe(2), elapsed, 0]
+        if self.description is None:
+            # DML/DDL: não há linhas a buscar, registra imediatamente
+            pending[3] = max(self.rowcount, 0)
+            self._pending = pending
+            self._flush()
+        else:
+            self._pending = pending
+
+    def _flush(self) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        sql, frame, elapsed, rows = pending
+        duration_ms = elapsed * 1000
+        caller = None
+        if duration_ms >= metrics.slow_threshold_ms:
+            caller = _find_caller(frame)
+        metrics.record(QueryRecord(sql, caller, duration_ms, rows))
@@ -0,0 +1,50 @@
+import sqlite3
+from typing import Optional
+
+from loguru import logger
+
+from src.models import LoginAttempt
+from src.repositories.base_repository import BaseRepository
+
+
+class LoginAttemptRepository(BaseRepository):
+    def __init__(self, db_connection: Optional[sqlite3.Connection] = None):
+        super().__init__('Login_Attempt', LoginAttempt, db_connection)
+
+    def get_by_email(self, email: str) -> Optional[LoginAttempt]:
+        """Busca O(log N) o estado de tentativas de um e-mail."""
+        self.cursor.execute(
+            f'SELECT * FROM {self.table_name} WHERE email = ?', (email,)
+        )
+        return self._map_row_to_model(self.cursor.fetchone())
+
+    def upsert(self, attempt: LoginAttempt) -> None:
+        """Grava o estado de tentativas de um e-mail em um único statement."""
+        sql = f"""
+            INSERT INTO {self.table_name} (email, failures, blocked_until)
+            VALUES (?, ?, ?)
+            ON CONFLICT(email) DO UPDATE SET
+                failures = excluded.failures,
+                blocked_until = excluded.blocked_until
+        """
+        try:
+            self.cursor.execute(
+                sql, (attempt.email, attempt.failures, attempt.blocked_until)
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f'Erro ao gravar tentativas de {attempt.email}: {e}')
+            self.conn.rollback()
+            raise
+
+    def delete_by_email(self, email: str) -> None:
+        """Remove o estado de tentativas de um e-mail."""
+        try:
+            self.cursor.execute(
+                f'DELETE FROM {self.table_name} WHERE email = ?', (email,)
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f'Erro ao apagar tentativas de {email}: {e}')
+            self.conn.rollback()
+            raise
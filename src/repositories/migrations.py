@@ -0,0 +1,312 @@
+"""
+Migrações do schema, versionadas por `PRAGMA user_version`.
+
+Cada `Migration` leva o banco da versão anterior à sua `version`, com
+passos em ordem: scripts SQL (cada um em uma transação) ou funções que
+recebem a conexão e um callback de progresso. A versão é gravada ao fim
+de cada migração; os passos devem poder ser repetidos, caso o processo
+pare no meio (`IF NOT EXISTS`, `IF EXISTS`, `rebuild_table`).
+
+Uso, para migrar um arquivo antes de abrir o app:
+    python -m src.repositories.migrations project_db.sqlite3
+"""
+import argparse
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Union
+
+from loguru import logger
+
+# Progresso de um passo: (descrição, feito, total)
+Progress = Callable[[str, int, int], None]
+Step = Union[str, Callable[[sqlite3.Connection, Progress], None]]
+
+# Linhas copiadas por lote em `rebuild_table`
+BATCH_SIZE = 10_000
+
+# Tabelas principais e tabelas de junção para relacionamentos N-N
+SCHEMA_SCRIPT = """
+-- Modelos Principais
+
+CREATE TABLE IF NOT EXISTS Organization (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT,
+    contact_email TEXT UNIQUE,
+    contact_phone TEXT,
+    website TEXT
+);
+
+CREATE TABLE IF NOT EXISTS Hability (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    domain TEXT
+);
+
+CREATE TABLE IF NOT EXISTS User (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    salt TEXT NOT NULL,
+    first_name TEXT,
+    last_name TEXT,
+    birth_date TEXT, -- SQLite não tem tipo 'date', usamos TEXT (ISO 8601)
+    phone TEXT,
+    role TEXT NOT NULL DEFAULT 'USER'
+);
+
+CREATE TABLE IF NOT EXISTS Project (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT,
+
+    -- Relacionamento 1-para-N (ForeignKey)
+    -- Um Projeto pertence a UMA Organização
+    organization_id INTEGER,
+    FOREIGN KEY (organization_id) REFERENCES Organization(id)
+);
+
+-- Tabelas de Junção (Relacionamentos N-para-N)
+
+CREATE TABLE IF NOT EXISTS User_Habilities (
+    user_id INTEGER,
+    hability_id INTEGER,
+    PRIMARY KEY (user_id, hability_id),
+    FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE CASCADE,
+    FOREIGN KEY (hability_id) REFERENCES Hability(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS User_Projects (
+    user_id INTEGER,
+    project_id INTEGER,
+    PRIMARY KEY (user_id, project_id),
+    FOREIGN KEY (user_id) REFERENCES User(id) ON DELETE CASCADE,
+    FOREIGN KEY (project_id) REFERENCES Project(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Project_Habilities (
+    project_id INTEGER,
+    hability_id INTEGER,
+    PRIMARY KEY (project_id, hability_id),
+    FOREIGN KEY (project_id) REFERENCES Project(id) ON DELETE CASCADE,
+    FOREIGN KEY (hability_id) REFERENCES Hability(id) ON DELETE CASCADE
+);
+
+-- Controle de tentativas de login falhas (throttling)
+
+CREATE TABLE IF NOT EXISTS Login_Attempt (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    failures INTEGER NOT NULL DEFAULT 0,
+    blocked_until REAL NOT NULL DEFAULT 0
+);
+
+-- Metadados da instalação (ex.: impressão digital das seeds)
+
+CREATE TABLE IF NOT EXISTS Metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Índices para buscas rápidas O(log N)
+INDEX_SCRIPT = """
+-- Índice para busca de usuário por email (O(log N))
+CREATE INDEX IF NOT EXISTS idx_user_email ON User(email);
+
+-- Índices para buscas por nome
+CREATE INDEX IF NOT EXISTS idx_hability_name ON Hability(name);
+CREATE INDEX IF NOT EXISTS idx_project_name ON Project(name);
+
+-- Índices nas chaves estrangeiras (aceleram JOINs)
+CREATE INDEX IF NOT EXISTS idx_project_organization_id ON Project(organization_id);
+CREATE INDEX IF NOT EXISTS idx_user_habilities_user ON User_Habilities(user_id);
+CREATE INDEX IF NOT EXISTS idx_user_habilities_hability ON User_Habilities(hability_id);
+CREATE INDEX IF NOT EXISTS idx_project_habilities_project ON Project_Habilities(project_id);
+CREATE INDEX IF NOT EXISTS idx_project_habilities_hability ON Project_Habilities(hability_id);
+CREATE INDEX IF NOT EXISTS idx_user_projects_user ON User_Projects(user_id);
+CREATE INDEX IF NOT EXISTS idx_user_projects_project ON User_Projects(project_id);
+"""
+
+# Tabelas do catálogo público: cada escrita nelas avança `catalog_version`,
+# que invalida o snapshot em disco (`src/repositories/catalog.py`)
+CATALOG_TABLES = ('Organization', 'Hability', 'Project', 'Project_Habilities')
+
+CATALOG_VERSION_SCRIPT = """
+CREATE TABLE IF NOT EXISTS Catalog_Version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL,
+    -- Identifica o banco: versões iguais de bancos diferentes não se confundem
+    token TEXT NOT NULL
+);
+INSERT OR IGNORE INTO Catalog_Version (id, version, token)
+VALUES (1, 1, lower(hex(randomblob(8))));
+""" + ''.join(
+    f"""
+CREATE TRIGGER IF NOT EXISTS catalog_{table.lower()}_{event.lower()}
+AFTER {event} ON {table}
+BEGIN
+    UPDATE Catalog_Version SET version = version + 1 WHERE id = 1;
+END;
+"""
+    for table in CATALOG_TABLES
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    steps: tuple[Step, ...]
+
+
+def rebuild_table(
+    table: str, create_sql: str, batch_size: int = BATCH_SIZE
+) -> Step:
+    """
+    Passo que recria `table` com o schema de `create_sql`, que deve
+    criar a tabela `{table}__new`. As colunas em comum são copiadas em
+    lotes de `batch_size` linhas, com o progresso informado a cada lote;
+    tudo roda em uma transação, então uma falha deixa a tabela antiga
+    intacta. Os índices da tabela antiga somem com ela: recrie-os num
+    passo seguinte.
+    """
+    new = f'{table}__new'
+
+    def step(conn: sqlite3.Connection, progress: Progress) -> None:
+        conn.execute('BEGIN')
+        try:
+            conn.execute(f'DROP TABLE IF EXISTS {new}')
+            conn.execute(create_sql)
+            old_columns = _columns(conn, table)
+            columns = ', '.join(
+                c for c in _columns(conn, new) if c in old_columns
+            )
+            total = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            done, last = 0, 0
+            while True:
+                rows = conn.execute(
+                    f'SELECT rowid, {columns} FROM {table} WHERE rowid > ? '
+                    'ORDER BY rowid LIMIT ?',
+                    (last, batch_size),
+                ).fetchall()
+                if not rows:
+                    break
+                placeholders = ', '.join('?' * (len(rows[0]) - 1))
+                conn.executemany(
+                    f'INSERT INTO {new} ({columns}) VALUES ({placeholders})',
+                    [tuple(row)[1:] for row in rows],
+                )
+                done += len(rows)
+                last = rows[-1][0]
+                progress(f'copiando {table}', done, total)
+            conn.execute(f'DROP TABLE {table}')
+            conn.execute(f'ALTER TABLE {new} RENAME TO {table}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    return step
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, 'schema inicial', (SCHEMA_SCRIPT, INDEX_SCRIPT)),
+    Migration(
+        2,
+        'remove índices repetidos de colunas UNIQUE',
+        (
+            # O UNIQUE de User.email e Hability.name já cria um índice
+            # (sqlite_autoindex_*); o segundo só encarecia as escritas
+            """
+            DROP INDEX IF EXISTS idx_user_email;
+            DROP INDEX IF EXISTS idx_hability_name;
+            """,
+        ),
+    ),
+    Migration(
+        3,
+        'contador de versão do catálogo',
+        (CATALOG_VERSION_SCRIPT,),
+    ),
+)
+
+# Versão de um banco com todas as migrações aplicadas
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def _log_progress(description: str, done: int, total: int) -> None:
+    logger.info(f'{description}: {done}/{total}')
+
+
+def pending(
+    conn: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS
+) -> list[Migration]:
+    """Migrações ainda não aplicadas a `conn`, em ordem."""
+    current = conn.execute('PRAGMA user_version').fetchone()[0]
+    return [m for m in migrations if m.version > current]
+
+
+def migrate(
+    conn: sqlite3.Connection,
+    migrations: Sequence[Migration] = MIGRATIONS,
+    progress: Optional[Progress] = None,
+) -> int:
+    """
+    Aplica as migrações pendentes e retorna quantas foram aplicadas. Com
+    o banco em dia, custa uma leitura de `user_version`.
+    """
+    progress = progress or _log_progress
+    todo = pending(conn, migrations)
+    for migration in todo:
+        name = f'migração {migration.version} ({migration.description})'
+        logger.info(f'Aplicando {name}...')
+        for number, step in enumerate(migration.steps, start=1):
+            if isinstance(step, str):
+                _run_script(conn, step)
+            else:
+                step(conn, progress)
+            progress(name, number, len(migration.steps))
+        conn.execute(f'PRAGMA user_version = {migration.version}')
+    return len(todo)
+
+
+def _run_script(conn: sqlite3.Connection, script: str) -> None:
+    """Executa um script SQL em uma única transação."""
+    try:
+        conn.executescript(f'BEGIN;\n{script}\nCOMMIT;')
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
+        logger.error(f'Erro ao aplicar migração: {e}')
+        raise
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Aplica as migrações pendentes a um banco SQLite.'
+    )
+    parser.add_argument('path', type=Path, help='arquivo SQLite')
+    args = parser.parse_args(argv)
+
+    def report(description: str, done: int, total: int) -> None:
+        print(f'{description}: {done}/{total}', flush=True)
+
+    conn = sqlite3.connect(args.path)
+    try:
+        applied = migrate(conn, progress=report)
+    finally:
+        conn.close()
+    print(f'{applied} migração(ões) aplicada(s); versão {SCHEMA_VERSION}.')
+    return applied
+
+
+if __name__ == '__main__':
+    main()
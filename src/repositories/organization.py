@@ -7,6 +7,8 @@ from src.repositories import BaseRepository
 
 
 class OrganizationRepository(BaseRepository):
+    search_columns = ('name', 'contact_email')
+
     def __init__(self, db_connection: Optional[sqlite3.Connection] = None):
         super().__init__('Organization', Organization, db_connection)
 
@@ -5,19 +5,24 @@ from typing import Optional
 from loguru import logger
 
 from src.models import Hability, Project
-from src.repositories import (
-    BaseRepository,
-    HabilityRepository,
-    OrganizationRepository,
-)
+from src.repositories.base_repository import BaseRepository
+from src.repositories.hability import HabilityRepository
+from src.repositories.organization import OrganizationRepository
 
 
 class ProjectRepository(BaseRepository):
-    def __init__(self, db_connection: Optional[sqlite3.Connection] = None):
+    search_columns = ('name',)
+
+    def __init__(
+        self,
+        db_connection: Optional[sqlite3.Connection] = None,
+        hability_repo: Optional[HabilityRepository] = None,
+        org_repo: Optional[OrganizationRepository] = None,
+    ):
         super().__init__('Project', Project, db_connection)
         # Garante que as dependências sejam inicializadas (e populadas) primeiro
-        self.hability_repo = HabilityRepository(db_connection)
-        self.org_repo = OrganizationRepository(db_connection)
+        self.hability_repo = hability_repo or HabilityRepository(db_connection)
+        self.org_repo = org_repo or OrganizationRepository(db_connection)
 
     def save(self, project: Project) -> Project:
         """
@@ -71,9 +76,21 @@ class ProjectRepository(BaseRepository):
         sql_projects = f'SELECT * FROM {self.table_name} WHERE id IN ({placeholders}) ORDER BY name'
         self.cursor.execute(sql_projects, project_ids)
         projects = [self._map_row_to_model(r) for r in self.cursor.fetchall()]
-        projects_dict = {p.id: p for p in projects}
+        return self._load_relations(projects)
 
-        # 2. Busca todas as organizações necessárias de uma vez
+    def find_keyset(
+        self,
+        after_id: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[Project]:
+        """Como o `find_keyset` base, já com a organização de cada projeto."""
+        projects = super().find_keyset(after_id, limit, search, before_id)
+        return self._load_organizations(projects)
+
+    def _load_organizations(self, projects: list[Project]) -> list[Project]:
+        """Carrega a organização dos projetos, com uma query só."""
         org_ids = {p.organization_id for p in projects if p.organization_id}
         if org_ids:
             orgs = self.org_repo.find_by_ids(list(org_ids))
@@ -81,6 +98,22 @@ class ProjectRepository(BaseRepository):
             for project in projects:
                 if project.organization_id in orgs_dict:
                     project.organization = orgs_dict[project.organization_id]
+        return projects
+
+    def _load_relations(self, projects: list[Project]) -> list[Project]:
+        """
+        Carrega organização e habilidades de projetos já buscados,
+        com uma query por relação.
+        """
+        if not projects:
+            return projects
+
+        projects_dict = {p.id: p for p in projects}
+        project_ids = list(projects_dict)
+        placeholders = ','.join('?' for _ in project_ids)
+
+        # 2. Busca todas as organizações necessárias de uma vez
+        self._load_organizations(projects)
 
         # 3. Busca todas as habilidades para esses projetos de uma vez
         sql_habilities = f"""
@@ -117,16 +150,31 @@ class ProjectRepository(BaseRepository):
         self,
         page: int = 1,
         per_page: int = 10,
+        search: Optional[str] = None,
     ):
         """
         Busca projetos com habilidades e organização, de forma paginada.
+        `search` filtra por trecho do nome ou da descrição (sem diferenciar
+        maiúsculas, só para letras sem acento, como o LIKE do SQLite).
         Retorna dict com dados + informações de paginação.
         """
         if page < 1:
             raise ValueError('page must be >= 1')
 
+        where, params = '', ()
+        if search:
+            pattern = self._like_pattern(search)
+            where = (
+                "WHERE name LIKE ? ESCAPE '\\' "
+                "OR description LIKE ? ESCAPE '\\'"
+            )
+            params = (pattern, pattern)
+
         # total de projetos
-        total = self.count()
+        self.cursor.execute(
+            f'SELECT COUNT(*) FROM {self.table_name} {where}', params
+        )
+        total = self.cursor.fetchone()[0]
         total_pages = max(ceil(total / per_page), 1)
 
         # se não houver projetos, retorna vazio
@@ -148,10 +196,11 @@ class ProjectRepository(BaseRepository):
         # Busca só os projetos da página atual
         sql = f"""
             SELECT * FROM {self.table_name}
+            {where}
             ORDER BY name
             LIMIT ? OFFSET ?
         """
-        self.cursor.execute(sql, (per_page, offset))
+        self.cursor.execute(sql, (*params, per_page, offset))
         project_rows = self.cursor.fetchall()
         projects = [self._map_row_to_model(r) for r in project_rows]
 
@@ -165,10 +214,7 @@ class ProjectRepository(BaseRepository):
             }
 
         # Carrega as relações (habilidades + organização) só para esses projetos
-        project_ids = [p.id for p in projects]
-        projects_with_relations = self.find_by_ids_with_all_relations(
-            project_ids
-        )
+        projects_with_relations = self._load_relations(projects)
 
         return {
             'data': projects_with_relations,
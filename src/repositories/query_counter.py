@@ -0,0 +1,121 @@
+import functools
+import inspect
+import os
+import threading
+from collections import Counter
+from typing import Optional
+
+from loguru import logger
+
+from .instrumentation import QueryRecord, metrics
+
+
+class QueryBudgetExceeded(Exception):
+    """Lançada quando um escopo excede o orçamento de queries (modo estrito)."""
+
+
+class QueryCounter:
+    """
+    Conta as queries executadas dentro de um escopo (uma ação do usuário),
+    agrupando-as por formato. Ao final do escopo, avisa (ou falha, no modo
+    estrito) se um mesmo formato se repetiu demais — sinal típico de N+1 —
+    ou se o total de queries passou do orçamento.
+
+    Pode ser usado como context manager ou como decorator:
+
+        with QueryCounter('login', max_queries=2):
+            ...
+
+        @QueryCounter('inscrição', max_queries=4, max_repeats=1)
+        def handle_subscription(self, event): ...
+    """
+
+    # Em modo estrito as violações lançam QueryBudgetExceeded (útil em testes)
+    strict = os.getenv('COLABORA_STRICT_QUERY_BUDGET', '') == '1'
+
+    def __init__(
+        self,
+        name: str = '',
+        max_queries: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        strict: Optional[bool] = None,
+    ):
+        self.name = name
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self._strict = strict
+        self.by_shape: Counter[str] = Counter()
+        self._thread_id: Optional[int] = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_shape.values())
+
+    def _on_query(self, record: QueryRecord) -> None:
+        # Só conta queries da thread que abriu o escopo
+        if record.thread_id == self._thread_id:
+            self.by_shape[record.shape] += 1
+
+    def __enter__(self) -> 'QueryCounter':
+        self.by_shape.clear()
+        self._thread_id = threading.get_ident()
+        metrics.add_listener(self._on_query)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        metrics.remove_listener(self._on_query)
+        if exc_type is not None:
+            return
+
+        violations = self.violations()
+        if not violations:
+            return
+
+        message = f"Orçamento de queries excedido em '{self.name}': " + (
+            '; '.join(violations)
+        )
+        strict = self.strict if self._strict is None else self._strict
+        if strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+    def violations(self) -> list[str]:
+        """Lista as regras violadas pelas queries contadas no escopo."""
+        violations = []
+        if self.max_queries is not None and self.total > self.max_queries:
+            violations.append(
+                f'{self.total} queries (máximo {self.max_queries})'
+            )
+        if self.max_repeats is not None:
+            for shape, count in self.by_shape.most_common():
+                if count <= self.max_repeats:
+                    break
+                violations.append(
+                    f'{count}x (máximo {self.max_repeats}) {shape}'
+                )
+        return violations
+
+    def _copy(self) -> 'QueryCounter':
+        return QueryCounter(
+            self.name, self.max_queries, self.max_repeats, self._strict
+        )
+
+    def __call__(self, func):
+        if not self.name:
+            self.name = func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with self._copy():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self._copy():
+                return func(*args, **kwargs)
+
+        return wrapper
@@ -14,10 +14,21 @@ from src.repositories.project import ProjectRepository
 
 
 class UserRepository(BaseRepository):
-    def __init__(self, db_connection: Optional[sqlite3.Connection] = None):
+    search_columns = ('email', 'first_name', 'last_name')
+
+    def __init__(
+        self,
+        db_connection: Optional[sqlite3.Connection] = None,
+        hability_repo: Optional[HabilityRepository] = None,
+        project_repo: Optional[ProjectRepository] = None,
+    ):
         super().__init__('User', User, db_connection)
-        self.hability_repo = HabilityRepository(db_connection)
-        self.project_repo = ProjectRepository(db_connection)
+        # Repositórios relacionados podem ser compartilhados (ex.: pelo
+        # `ServiceContainer`); sem eles, cria os seus
+        self.hability_repo = hability_repo or HabilityRepository(db_connection)
+        self.project_repo = project_repo or ProjectRepository(
+            db_connection, hability_repo=self.hability_repo
+        )
 
     def save(self, user: User) -> User:
         """
@@ -98,6 +109,51 @@ class UserRepository(BaseRepository):
             self.conn.rollback()
             raise
 
+    def save_many(self, users: list[User]) -> list[User]:
+        """
+        Insere vários usuários novos (sem relações) em uma única transação.
+        Atualiza cada instância com o ID gerado.
+        """
+        if not users:
+            return []
+
+        columns = [
+            key
+            for key in self._pop_relations(users[0].to_dict())
+            if key != 'id'
+        ]
+        sql = (
+            f'INSERT INTO {self.table_name} ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" for _ in columns)})'
+        )
+        try:
+            for user in users:
+                data = user.to_dict()
+                self.cursor.execute(sql, [data[key] for key in columns])
+                user.id = self.cursor.lastrowid
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f'Erro ao inserir usuários em lote: {e}')
+            self.conn.rollback()
+            for user in users:
+                user.id = None
+            raise
+        return users
+
+    def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """
+        Retorna quais dos e-mails informados já estão cadastrados, em uma
+        única query (a lista vai como JSON, sem limite de placeholders).
+        """
+        if not emails:
+            return set()
+        sql = f"""
+            SELECT email FROM {self.table_name}
+            WHERE email IN (SELECT value FROM json_each(?))
+        """
+        self.cursor.execute(sql, (json.dumps(list(emails)),))
+        return {row['email'] for row in self.cursor.fetchall()}
+
     def get_by_email(self, email: str) -> Optional[User]:
         """Busca O(log N) por email e retorna um objeto User."""
         self.cursor.execute(
@@ -114,6 +170,19 @@ class UserRepository(BaseRepository):
             user.projects = self.get_projects_for_user(user_id)
         return user
 
+    def update_password(self, user_id: int, password, salt) -> None:
+        """Atualiza apenas a senha e o salt, sem tocar nas relações."""
+        sql = (
+            f'UPDATE {self.table_name} SET password = ?, salt = ? WHERE id = ?'
+        )
+        try:
+            self.cursor.execute(sql, (password, salt, user_id))
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f'Erro ao atualizar senha do user_id {user_id}: {e}')
+            self.conn.rollback()
+            raise
+
     def add_hability(self, user_id: int, hability_id: int) -> bool:
         """Adiciona um relacionamento N-N na tabela de junção."""
         sql = (
@@ -127,6 +196,56 @@ class UserRepository(BaseRepository):
             print(f'Erro ao relacionar usuário e habilidade: {e}')
             return False
 
+    def subscribe(self, user_id: int, project_id: int) -> bool:
+        """
+        Inscreve o usuário no projeto com uma única instrução, e só se ele
+        tiver ao menos uma das habilidades pedidas pelo projeto.
+        Retorna se a inscrição foi criada (False também quando já existia).
+        """
+        sql = """
+        INSERT OR IGNORE INTO User_Projects (user_id, project_id)
+        SELECT ?, ? WHERE EXISTS (
+            SELECT 1 FROM Project_Habilities ph
+            JOIN User_Habilities uh
+              ON uh.hability_id = ph.hability_id AND uh.user_id = ?
+            WHERE ph.project_id = ?
+        )
+        """
+        try:
+            self.cursor.execute(
+                sql, (user_id, project_id, user_id, project_id)
+            )
+            self.conn.commit()
+            return self.cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.error(
+                f'Erro ao inscrever user_id {user_id} no projeto {project_id}: {e}'
+            )
+            self.conn.rollback()
+            raise
+
+    def unsubscribe(self, user_id: int, project_id: int) -> bool:
+        """Remove a inscrição. Retorna se havia uma inscrição para remover."""
+        sql = 'DELETE FROM User_Projects WHERE user_id = ? AND project_id = ?'
+        try:
+            self.cursor.execute(sql, (user_id, project_id))
+            self.conn.commit()
+            return self.cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.error(
+                f'Erro ao remover inscrição do user_id {user_id} '
+                f'no projeto {project_id}: {e}'
+            )
+            self.conn.rollback()
+            raise
+
+    def is_subscribed(self, user_id: int, project_id: int) -> bool:
+        sql = (
+            'SELECT 1 FROM User_Projects WHERE user_id = ? AND project_id = ?'
+        )
+        self.cursor.execute(sql, (user_id, project_id))
+        return self.cursor.fetchone() is not None
+
     @overload
     def exists(self, id: int) -> bool:
         ...
@@ -1 +1,2 @@
 from .password import PasswordManager
+from .throttle import LoginThrottle
@@ -0,0 +1,16 @@
+"""
+Calibra o custo do scrypt para esta máquina.
+
+Uso: python -m src.security [alvo_em_ms]
+"""
+import sys
+
+from src.security.password import PasswordManager
+
+if __name__ == '__main__':
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 250
+    manager = PasswordManager.calibrate(target_ms=target_ms)
+    print(f'# Parâmetros para ~{target_ms:.0f} ms por derivação')
+    print(f'COLABORA_SCRYPT_N={manager.n}')
+    print(f'COLABORA_SCRYPT_R={manager.r}')
+    print(f'COLABORA_SCRYPT_P={manager.p}')
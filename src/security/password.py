@@ -1,57 +1,297 @@
+import asyncio
+import base64
 import hashlib
 import hmac
 import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 
 from src.models.users import User
 
-PasswordHash = bytes
+# Hash auto-descritivo: '$scrypt$ln=14,r=8,p=1$<salt base64>$<hash base64>'.
+# Hashes antigos (bytes crus + salt na coluna própria) continuam válidos.
+PasswordHash = str
 Salt = bytes
 
+HASH_PREFIX = '$scrypt$'
+
+# Parâmetros dos hashes gravados antes do formato versionado
+LEGACY_N, LEGACY_R, LEGACY_P = 16384, 8, 1
+
+# Cada derivação scrypt aloca ~128 * n * r bytes (16 MiB com n=16384, r=8).
+# O semáforo limita quantas rodam ao mesmo tempo, em qualquer thread.
+MAX_CONCURRENT_KDF = int(
+    os.getenv('COLABORA_MAX_CONCURRENT_KDF', min(4, os.cpu_count() or 1))
+)
+_kdf_slots = threading.BoundedSemaphore(MAX_CONCURRENT_KDF)
+_kdf_executor: ThreadPoolExecutor | None = None
+
+
+def _get_kdf_executor() -> ThreadPoolExecutor:
+    """Pool de threads (criado sob demanda) para as derivações assíncronas."""
+    global _kdf_executor
+    if _kdf_executor is None:
+        _kdf_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_KDF, thread_name_prefix='kdf'
+        )
+    return _kdf_executor
+
+
+def _scrypt(
+    password: str, salt: bytes, n: int, r: int, p: int, dklen: int
+) -> bytes:
+    # Memória exigida pelo OpenSSL: 128 * r * (n + p + 2) bytes
+    maxmem = max(32 * 1024 * 1024, 128 * r * (n + p + 2) + 1024 * 1024)
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        dklen=dklen,
+        maxmem=maxmem,
+    )
+
+
+def _scrypt_job(job: tuple) -> bytes:
+    """Executa uma derivação dentro de um processo do pool."""
+    return _scrypt(*job)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
 
 class PasswordManager:
-    # Fatores de custo n r p
-    n = 16384
-    r = 8
-    p = 1
+    # Fatores de custo n r p (podem ser ajustados por instalação)
+    n = int(os.getenv('COLABORA_SCRYPT_N', 16384))
+    r = int(os.getenv('COLABORA_SCRYPT_R', 8))
+    p = int(os.getenv('COLABORA_SCRYPT_P', 1))
     dklen = 64   # Tamanho da chave derivada (hash)
 
+    def __init__(
+        self,
+        n: Optional[int] = None,
+        r: Optional[int] = None,
+        p: Optional[int] = None,
+    ):
+        if n is not None:
+            self.n = n
+        if r is not None:
+            self.r = r
+        if p is not None:
+            self.p = p
+
     def _gen_salt(self):
         return os.urandom(16)
 
+    def _derive(
+        self,
+        password: str,
+        salt: Salt,
+        n: Optional[int] = None,
+        r: Optional[int] = None,
+        p: Optional[int] = None,
+        dklen: Optional[int] = None,
+    ) -> bytes:
+        """Deriva a chave com scrypt, respeitando o limite de concorrência."""
+        with _kdf_slots:
+            return _scrypt(
+                password,
+                salt,
+                n or self.n,
+                r or self.r,
+                p or self.p,
+                dklen or self.dklen,
+            )
+
+    def encode(self, derived: bytes, salt: Salt) -> PasswordHash:
+        """
+        Monta o hash auto-descritivo com o algoritmo e os parâmetros atuais.
+
+        >>> PasswordManager(n=1024, r=8, p=1).encode(b'h', b's')
+        '$scrypt$ln=10,r=8,p=1$cw==$aA=='
+        """
+        ln = self.n.bit_length() - 1
+        return (
+            f'{HASH_PREFIX}ln={ln},r={self.r},p={self.p}'
+            f'${_b64encode(salt)}${_b64encode(derived)}'
+        )
+
+    @staticmethod
+    def decode(stored: PasswordHash | bytes, salt: Salt = None) -> dict:
+        """
+        Extrai parâmetros, salt e hash de uma senha armazenada. Hashes no
+        formato antigo (bytes crus) usam os parâmetros legados e o salt da
+        coluna própria; um `$scrypt$` malformado levanta `ValueError`.
+
+        >>> PasswordManager.decode('$scrypt$ln=10,r=8,p=1$cw==$aA==')
+        {'n': 1024, 'r': 8, 'p': 1, 'salt': b's', 'hash': b'h'}
+        """
+        if isinstance(stored, str) and stored.startswith(HASH_PREFIX):
+            try:
+                _, _, params, salt_b64, hash_b64 = stored.split('$')
+                values = dict(item.split('=') for item in params.split(','))
+                decoded = {
+                    'n': 1 << int(values['ln']),
+                    'r': int(values['r']),
+                    'p': int(values['p']),
+                    'salt': base64.b64decode(salt_b64, validate=True),
+                    'hash': base64.b64decode(hash_b64, validate=True),
+                }
+            except (ValueError, KeyError) as e:
+                raise ValueError(f'Hash de senha malformado: {e}') from e
+            if (
+                not decoded['hash']
+                or min(decoded['n'] - 1, decoded['r'], decoded['p']) < 1
+            ):
+                raise ValueError(
+                    'Hash de senha malformado: parâmetros inválidos'
+                )
+            return decoded
+
+        return {
+            'n': LEGACY_N,
+            'r': LEGACY_R,
+            'p': LEGACY_P,
+            'salt': salt,
+            'hash': stored,
+        }
+
     def hash_password(self, password: str) -> tuple[PasswordHash, Salt]:
         """
         Função para criar o hash da senha do usuário.
-        Retornar uma tupla com o hash e o salt.
+        Retornar uma tupla com o hash (no formato auto-descritivo) e o salt.
         """
         salt = self._gen_salt()
-        hash_password = hashlib.scrypt(
-            password.encode(),
-            salt=salt,
-            n=self.n,
-            r=self.r,
-            p=self.p,
-            dklen=self.dklen,
-        )
+        hash_password = self.encode(self._derive(password, salt), salt)
 
         return hash_password, salt
 
+    def hash_passwords(
+        self,
+        passwords: list[str],
+        max_workers: Optional[int] = None,
+        processes: bool = True,
+    ) -> list[tuple[PasswordHash, Salt]]:
+        """
+        Gera os hashes de várias senhas em paralelo, em um pool de processos
+        (limitado a `MAX_CONCURRENT_KDF` para conter o uso de memória).
+        Lotes pequenos são processados aqui mesmo, sem criar o pool. Com
+        `processes=False` (ex.: dentro de um worker de thread, onde não se
+        deve criar processos), as derivações vão para o pool de threads.
+        """
+        workers = max_workers or MAX_CONCURRENT_KDF
+        salts = [self._gen_salt() for _ in passwords]
+        jobs = [
+            (password, salt, self.n, self.r, self.p, self.dklen)
+            for password, salt in zip(passwords, salts)
+        ]
+
+        if not processes:
+            derived = list(
+                _get_kdf_executor().map(self._derive, passwords, salts)
+            )
+        elif workers == 1 or len(jobs) < 2 * workers:
+            derived = [
+                self._derive(password, salt) for password, salt, *_ in jobs
+            ]
+        else:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                derived = list(
+                    pool.map(_scrypt_job, jobs, chunksize=chunksize)
+                )
+
+        return [
+            (self.encode(d, salt), salt) for d, salt in zip(derived, salts)
+        ]
+
     def check_password(self, password: str, user: User) -> bool:
         """
         Função para verificar se a senha está correta.
         Retorna True se a senha estiver correta, False caso contrário.
         """
-        user_salt = user.salt
+        try:
+            stored = self.decode(user.password, user.salt)
+        except ValueError:
+            print('Hash de senha inválido.')
+            return False
 
-        hash_teste = hashlib.scrypt(
-            password.encode(),
-            salt=user_salt,
-            n=self.n,
-            r=self.r,
-            p=self.p,
-            dklen=self.dklen,
+        hash_teste = self._derive(
+            password,
+            stored['salt'],
+            stored['n'],
+            stored['r'],
+            stored['p'],
+            len(stored['hash']),
         )
-        if hmac.compare_digest(user.password, hash_teste):
+        if hmac.compare_digest(stored['hash'], hash_teste):
             print('Login bem-sucedido!')
             return True
         print('Senha incorreta.')
         return False
+
+    def needs_rehash(self, user: User) -> bool:
+        """
+        Indica se a senha do usuário foi gravada no formato antigo ou com
+        parâmetros diferentes dos atuais.
+        """
+        if not (
+            isinstance(user.password, str)
+            and user.password.startswith(HASH_PREFIX)
+        ):
+            return True
+        stored = self.decode(user.password)
+        return (stored['n'], stored['r'], stored['p']) != (
+            self.n,
+            self.r,
+            self.p,
+        )
+
+    @classmethod
+    def calibrate(
+        cls,
+        target_ms: float = 250,
+        r: int = 8,
+        p: int = 1,
+        max_memory: int = 128 * 1024 * 1024,
+    ) -> 'PasswordManager':
+        """
+        Mede o scrypt nesta máquina e escolhe o maior `n` (potência de 2)
+        cuja derivação fica dentro de `target_ms` e de `max_memory`.
+        """
+        n = 1 << 10
+        salt = os.urandom(16)
+        while True:
+            next_n = n * 2
+            if 128 * r * (next_n + p + 2) > max_memory:
+                break
+            start = time.perf_counter()
+            _scrypt('calibration', salt, next_n, r, p, cls.dklen)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms > target_ms:
+                break
+            n = next_n
+        return cls(n=n, r=r, p=p)
+
+    async def hash_password_async(
+        self, password: str
+    ) -> tuple[PasswordHash, Salt]:
+        """
+        Versão assíncrona de `hash_password`: a derivação roda no pool de
+        threads, sem bloquear o event loop da interface.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_kdf_executor(), self.hash_password, password
+        )
+
+    async def check_password_async(self, password: str, user: User) -> bool:
+        """Versão assíncrona de `check_password`."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_kdf_executor(), self.check_password, password, user
+        )
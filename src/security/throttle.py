@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from loguru import logger
+
+from src.models import LoginAttempt
+from src.repositories.login_attempt import LoginAttemptRepository
+
+
+class TokenBucket:
+    """Balde de fichas: `capacity` tentativas, repostas a `refill_rate`/s."""
+
+    def __init__(self, capacity: float, refill_rate: float, now: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(
+            self.capacity, self.tokens + elapsed * self.refill_rate
+        )
+        self.updated = now
+
+    def has_token(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+    def wait_time(self) -> float:
+        """Segundos até a próxima ficha ficar disponível."""
+        missing = 1 - self.tokens
+        return max(0.0, missing / self.refill_rate)
+
+
+class LoginThrottle:
+    """
+    Limita tentativas de login antes de qualquer derivação de chave.
+
+    - Um balde de fichas por e-mail e um global limitam a taxa de tentativas.
+    - Após `free_failures` falhas seguidas, o e-mail fica bloqueado por um
+      tempo que dobra a cada nova falha (até `max_backoff`).
+
+    O estado vive em memória; as falhas também são gravadas no SQLite, que
+    é consultado quando o e-mail não está em memória (ex.: após reiniciar).
+    """
+
+    def __init__(
+        self,
+        attempt_repository: Optional[LoginAttemptRepository] = None,
+        per_email_capacity: int = 5,
+        per_email_refill: float = 1 / 12,
+        global_capacity: int = 30,
+        global_refill: float = 5.0,
+        free_failures: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        max_tracked_emails: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._repo = attempt_repository
+        self._per_email_capacity = per_email_capacity
+        self._per_email_refill = per_email_refill
+        self._free_failures = free_failures
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._max_tracked_emails = max_tracked_emails
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._global_bucket = TokenBucket(
+            global_capacity, global_refill, clock()
+        )
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._attempts: OrderedDict[str, LoginAttempt] = OrderedDict()
+        # Um dict (e não dois ints) para que cópias ligadas a outra conexão
+        # (`bind_to_connection`) contem no mesmo lugar, sob o mesmo lock
+        self._counts = {'rejected': 0, 'evaluated': 0}
+
+    def stats(self) -> dict:
+        """Contadores de tentativas rejeitadas e avaliadas."""
+        with self._lock:
+            return dict(self._counts)
+
+    def _remember(self, cache: OrderedDict, key: str, value) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self._max_tracked_emails:
+            cache.popitem(last=False)
+
+    def _get_attempt(self, email: str) -> LoginAttempt:
+        attempt = self._attempts.get(email)
+        if attempt is None:
+            attempt = self._repo.get_by_email(email) if self._repo else None
+            attempt = attempt or LoginAttempt(email=email)
+            self._remember(self._attempts, email, attempt)
+        return attempt
+
+    def check(self, email: str) -> tuple[bool, float]:
+        """
+        Decide se a tentativa pode seguir para a verificação da senha.
+        Retorna `(permitido, segundos até poder tentar de novo)`.
+        """
+        email = (email or '').strip().lower()
+        with self._lock:
+            now = self._clock()
+
+            attempt = self._get_attempt(email)
+            if attempt.blocked_until > now:
+                self._counts['rejected'] += 1
+                return False, attempt.blocked_until - now
+
+            bucket = self._buckets.get(email)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self._per_email_capacity, self._per_email_refill, now
+                )
+                self._remember(self._buckets, email, bucket)
+
+            for limiter in (bucket, self._global_bucket):
+                if not limiter.has_token(now):
+                    self._counts['rejected'] += 1
+                    return False, limiter.wait_time()
+
+            bucket.take()
+            self._global_bucket.take()
+            self._counts['evaluated'] += 1
+            return True, 0.0
+
+    def record_failure(self, email: str, persist: bool = True) -> None:
+        """
+        Registra uma falha e aplica o backoff exponencial, se for o caso.
+
+        Com `persist=False` (e-mails sem conta) a falha fica só na memória,
+        limitada a `max_tracked_emails`: uma varredura de e-mails
+        inventados não faz a tabela `Login_Attempt` crescer.
+        """
+        email = (email or '').strip().lower()
+        with self._lock:
+            attempt = self._get_attempt(email)
+            attempt.failures += 1
+            excess = attempt.failures - self._free_failures
+            if excess > 0:
+                backoff = min(
+                    self._max_backoff, self._base_backoff * 2 ** (excess - 1)
+                )
+                attempt.blocked_until = self._clock() + backoff
+                logger.warning(
+                    f'Login de {email} bloqueado por {backoff:.0f}s '
+                    f'após {attempt.failures} falhas.'
+                )
+        if self._repo and persist:
+            self._repo.upsert(attempt)
+
+    def record_success(self, email: str) -> None:
+        """
+        Zera o histórico de falhas do e-mail. O `check` já trouxe o estado
+        do banco para a memória: sem falhas lá, não há linha a apagar.
+        """
+        email = (email or '').strip().lower()
+        with self._lock:
+            attempt = self._attempts.pop(email, None)
+        if self._repo and attempt is not None and attempt.failures:
+            self._repo.delete_by_email(email)
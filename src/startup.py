@@ -0,0 +1,64 @@
+"""
+Linha do tempo da inicialização do app (`python main.py --profile-startup`).
+
+Os marcos são sempre registrados (uma leitura do relógio cada); o
+relatório só é impresso com a flag, depois que o app fecha.
+"""
+import sys
+import threading
+import time
+from typing import Callable, NamedTuple
+
+
+class Mark(NamedTuple):
+    label: str
+    elapsed: float  # segundos desde o início
+    modules: int  # módulos importados até o marco
+
+
+class StartupTimeline:
+    """
+    Marcos da inicialização, com o tempo desde o início e quantos módulos
+    já foram importados.
+
+    >>> ticks = iter([0.0, 0.25, 0.5])
+    >>> timeline = StartupTimeline(clock=lambda: next(ticks))
+    >>> timeline.mark('imports')
+    >>> timeline.mark('primeira pintura')
+    >>> print(timeline.report())  # doctest: +ELLIPSIS
+    marco                 total     etapa  módulos
+    imports            250.0 ms  250.0 ms  ...
+    primeira pintura   500.0 ms  250.0 ms  ...
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        # Pode ser recuado (ex.: para antes dos imports do `main.py`)
+        self.start = clock()
+        self._lock = threading.Lock()
+        self.marks: list[Mark] = []
+
+    def mark(self, label: str) -> None:
+        """Registra um marco; pode ser chamado de qualquer thread."""
+        with self._lock:
+            self.marks.append(
+                Mark(label, self._clock() - self.start, len(sys.modules))
+            )
+
+    def report(self) -> str:
+        width = max((len(m.label) for m in self.marks), default=5)
+        lines = [f'{"marco":<{width}}  {"total":>9} {"etapa":>9}  módulos']
+        previous = 0.0
+        for mark in self.marks:
+            lines.append(
+                f'{mark.label:<{width}}  {mark.elapsed * 1000:>6.1f} ms'
+                f' {(mark.elapsed - previous) * 1000:>6.1f} ms'
+                f'  {mark.modules}'
+            )
+            previous = mark.elapsed
+        return '\n'.join(lines)
+
+
+# Linha do tempo do processo; o `main.py` recua o início para antes dos
+# seus imports
+timeline = StartupTimeline()
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+import pytest
+
+from src.benchmarks import runner
+
+
+@pytest.fixture
+def benchmarks_path(tmp_path: Path, monkeypatch) -> Path:
+    """Guarda bases sintéticas e relatórios em um diretório temporário."""
+    monkeypatch.setattr(runner, 'BENCHMARKS_PATH', tmp_path)
+    return tmp_path
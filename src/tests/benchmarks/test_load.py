@@ -0,0 +1,69 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from src.benchmarks.load import parse_mix, run_load
+from src.repositories import ProjectRepository
+from src.repositories.query_counter import QueryCounter
+
+
+def test_run_load_reports_each_operation(benchmarks_path: Path):
+    """
+    Testa que a carga roda em várias threads e o relatório traz vazão,
+    latência e contagem de SQLITE_BUSY por operação e no total.
+    """
+    # Act
+    report = run_load(
+        size=50,
+        workers=3,
+        operations=10,
+        duration=30,
+        mix={'browse': 2, 'subscribe': 1, 'update_user': 1},
+    )
+
+    # Assert
+    total = report['results']['total']
+    assert total['operations'] == 30
+    assert total['errors'] == 0
+    assert total['throughput_per_s'] > 0
+    assert set(report['results']) <= {
+        'total',
+        'browse',
+        'subscribe',
+        'update_user',
+    }
+    assert {'p50_ms', 'p95_ms', 'p99_ms', 'busy', 'lock_wait_ms'} <= set(total)
+
+
+def test_run_load_keeps_application_logs_enabled(
+    benchmarks_path: Path, db_connection: sqlite3.Connection
+):
+    """
+    Testa que a carga não silencia os logs de `src` para o resto do
+    processo.
+    """
+    # Arrange
+    run_load(size=50, workers=2, operations=2, duration=30)
+    messages = []
+    sink_id = logger.add(messages.append, level='WARNING')
+
+    # Act
+    try:
+        with QueryCounter('depois da carga', max_queries=0, strict=False):
+            ProjectRepository(db_connection=db_connection).count()
+    finally:
+        logger.remove(sink_id)
+
+    # Assert
+    assert any('1 queries (máximo 0)' in m for m in messages)
+
+
+def test_parse_mix_rejects_unknown_operation():
+    """
+    Testa que operações fora do simulador são rejeitadas.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError):
+        parse_mix('browse=1,delete_everything=2')
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from src.benchmarks import runner
+from src.benchmarks.__main__ import main
+from src.repositories.database import Database
+
+
+def test_run_measures_each_size(benchmarks_path: Path):
+    """
+    Testa que cada cenário é medido em cada tamanho de base e que o
+    singleton do banco volta ao estado anterior.
+    """
+    # Arrange
+    previous = Database._instance
+
+    # Act
+    report = runner.run([50, 100], only=['ProjectRepository.*'], repeat=2)
+
+    # Assert
+    assert set(report['results']) == {
+        'ProjectRepository.find_all_with_habilities_paginated[50]',
+        'ProjectRepository.find_all_with_habilities_paginated[100]',
+        'ProjectRepository.find_by_ids_with_all_relations[50]',
+        'ProjectRepository.find_by_ids_with_all_relations[100]',
+    }
+    stats = report['results'][
+        'ProjectRepository.find_by_ids_with_all_relations[50]'
+    ]
+    assert stats['runs'] == 2
+    assert stats['queries'] == 3
+    assert Database._instance is previous
+
+
+def test_compare_flags_extra_queries():
+    """
+    Testa que mais queries que na baseline contam como regressão, mesmo
+    sem piora no tempo.
+    """
+    # Arrange
+    baseline = {'results': {'a': {'median_ms': 1.0, 'queries': 3}}}
+    report = {'results': {'a': {'median_ms': 1.0, 'queries': 4}}}
+
+    # Act
+    regressions = runner.compare(report, baseline)
+
+    # Assert
+    assert regressions == ['a: queries 3 -> 4']
+
+
+def test_main_saves_and_compares_baseline(benchmarks_path: Path):
+    """
+    Testa o fluxo da linha de comando: grava a baseline e depois compara
+    uma nova rodada com ela.
+    """
+    # Arrange
+    args = ['--sizes', '50', '--only', '*paginated', '--repeat', '2']
+    baseline = benchmarks_path / 'baseline.json'
+
+    # Act
+    saved = main([*args, '--baseline', str(baseline), '--save-baseline'])
+    compared = main(
+        [
+            *args,
+            '--baseline',
+            str(baseline),
+            '--output',
+            str(benchmarks_path / 'results.json'),
+            '--tolerance',
+            '100',
+            '--min-delta-ms',
+            '1000',
+        ]
+    )
+
+    # Assert
+    assert saved == 0
+    assert compared == 0
+    assert baseline.exists()
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from src.benchmarks.tui import run_tui
+
+
+@pytest.mark.asyncio
+async def test_run_tui_reports_screen_metrics(benchmarks_path: Path):
+    """
+    Testa que a tela de projetos é montada sem terminal e que o relatório
+    traz montagem, primeira pintura, widgets e latência das teclas, com
+    as queries da thread da interface.
+    """
+    # Act
+    results = await run_tui([600], only=['ProjectScreen'], repeat=1)
+
+    # Assert
+    assert set(results) == {
+        'ProjectScreen.mount[600]',
+        'ProjectScreen.first_paint[600]',
+        'ProjectScreen.ready[600]',
+        'ProjectScreen.key:search[600]',
+        'ProjectScreen.key:next_page[600]',
+    }
+    ready = results['ProjectScreen.ready[600]']
+    assert ready['widgets'] > 0
+    assert ready['median_ms'] >= results['ProjectScreen.mount[600]']['min_ms']
+    # A página seguinte já veio do prefetch, feito num worker
+    assert results['ProjectScreen.key:next_page[600]']['queries'] == 0
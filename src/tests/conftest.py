@@ -8,6 +8,7 @@ import pytest
 from src.models.users import User
 from src.repositories.database import Database
 from src.repositories.hability import HabilityRepository
+from src.repositories.query_counter import QueryCounter
 from src.repositories.user import UserRepository
 from src.security.password import PasswordManager
 from src.use_cases.register import RegisterUserUseCase
@@ -16,6 +17,9 @@ from src.validators import email_validator, password_validator
 # Ajuste o caminho para encontrar a pasta 'seeds' a partir da raiz do projeto
 SEEDS_PATH = Path(__file__).parent.parent / 'seeds'
 
+# Nos testes, orçamentos de queries excedidos falham em vez de só avisar
+QueryCounter.strict = True
+
 
 @pytest.fixture
 def db_connection() -> sqlite3.Connection:
@@ -38,6 +42,22 @@ def db_connection() -> sqlite3.Connection:
     Database._initialized = False
 
 
+@pytest.fixture
+def file_database(tmp_path: Path) -> sqlite3.Connection:
+    """
+    Banco em arquivo: só assim workers e threads têm conexões próprias.
+    """
+    conn = sqlite3.connect(tmp_path / 'db.sqlite3', check_same_thread=False)
+    Database._instance = None
+    Database(connection=conn)
+
+    yield conn
+
+    conn.close()
+    Database._instance = None
+    Database._initialized = False
+
+
 @pytest.fixture
 def registered_user(
     db_connection: sqlite3.Connection,
@@ -0,0 +1,121 @@
+import json
+import sqlite3
+
+from src import SEEDS_PATH
+from src.populate_db.users import SEED_FINGERPRINT_KEY, PopulateRawDB
+from src.repositories.database import Database
+from src.repositories.query_counter import QueryCounter
+from src.security import password
+from src.security.password import PasswordManager
+
+
+def _populate() -> PopulateRawDB:
+    # Custo baixo do scrypt para o teste não demorar
+    return PopulateRawDB(password_manager=PasswordManager(n=1024))
+
+
+def _count(conn: sqlite3.Connection, table: str) -> int:
+    return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+def test_run_populates_all_seeds(db_connection: sqlite3.Connection):
+    """
+    Testa que a carga insere usuários, organizações, habilidades, projetos
+    e os vínculos projeto-habilidade descritos nas seeds.
+    """
+    # Arrange
+    projects = json.loads((SEEDS_PATH / 'projects.json').read_text())
+    project = projects['projects'][0]
+
+    # Act
+    _populate().run()
+
+    # Assert
+    assert _count(db_connection, 'User') == 5
+    assert _count(db_connection, 'Organization') == 2
+    assert _count(db_connection, 'Hability') == 39
+    assert _count(db_connection, 'Project') == len(projects['projects'])
+    linked = db_connection.execute(
+        """
+        SELECT h.name FROM Project_Habilities ph
+        JOIN Project p ON p.id = ph.project_id
+        JOIN Hability h ON h.id = ph.hability_id
+        WHERE p.name = ?
+        """,
+        (project['name'],),
+    ).fetchall()
+    assert {row['name'] for row in linked} == set(
+        project['required_habilities']
+    )
+    stored = db_connection.execute(
+        'SELECT value FROM Metadata WHERE key = ?', (SEED_FINGERPRINT_KEY,)
+    ).fetchone()
+    assert stored['value'] == PopulateRawDB.fingerprint()
+
+
+def test_run_skips_when_seeds_unchanged(db_connection: sqlite3.Connection):
+    """
+    Testa que, com a impressão digital das seeds já gravada, a carga se
+    resume a uma única consulta.
+    """
+    # Arrange
+    populated = _populate().run()
+
+    # Act / Assert
+    with QueryCounter('PopulateRawDB.run', max_queries=1) as counter:
+        assert _populate().run() is False
+    assert counter.total == 1
+    assert populated is True
+
+
+def test_run_is_idempotent(db_connection: sqlite3.Connection):
+    """
+    Testa que rodar a carga de novo (seeds alteradas) não duplica
+    registros já existentes.
+    """
+    # Arrange
+    _populate().run()
+    tables = ('User', 'Organization', 'Hability', 'Project')
+    before = {table: _count(db_connection, table) for table in tables}
+    links = _count(db_connection, 'Project_Habilities')
+    db_connection.execute('DELETE FROM Metadata')
+    db_connection.commit()
+
+    # Act
+    _populate().run()
+
+    # Assert
+    assert {table: _count(db_connection, table) for table in tables} == before
+    assert _count(db_connection, 'Project_Habilities') == links
+
+
+def test_run_on_worker_connection_is_instrumented_and_forks_nothing(
+    file_database: sqlite3.Connection, monkeypatch
+):
+    """
+    Testa que a carga na conexão de um worker passa pelo cursor
+    instrumentado e gera os hashes sem criar processos, mesmo quando o
+    lote seria grande para o pool.
+    """
+    # Arrange
+    def no_processes(*args, **kwargs):
+        raise AssertionError('a carga criou um pool de processos')
+
+    monkeypatch.setattr(password, 'MAX_CONCURRENT_KDF', 2)
+    monkeypatch.setattr(password, 'ProcessPoolExecutor', no_processes)
+    conn = Database().thread_connection()
+    populate = PopulateRawDB(
+        password_manager=PasswordManager(n=1024), connection=conn
+    )
+
+    # Act
+    try:
+        with QueryCounter('PopulateRawDB.run') as counter:
+            populated = populate.run()
+    finally:
+        Database().close_thread_connection()
+
+    # Assert
+    assert populated is True
+    assert counter.total > 0
+    assert _count(file_database, 'User') == 5
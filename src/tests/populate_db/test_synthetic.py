@@ -0,0 +1,113 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.models.users import User
+from src.populate_db.synthetic import DEFAULT_PASSWORD, SyntheticDataset
+from src.security.password import PasswordManager
+
+
+def _dataset(seed: int = 7) -> SyntheticDataset:
+    return SyntheticDataset(
+        users=300,
+        organizations=10,
+        projects=80,
+        seed=seed,
+        password_manager=PasswordManager(n=1024),
+    )
+
+
+def _dump(path: Path) -> list[tuple]:
+    conn = sqlite3.connect(path)
+    try:
+        return [
+            *conn.execute('SELECT id, email, first_name FROM User'),
+            *conn.execute('SELECT * FROM User_Projects'),
+            *conn.execute('SELECT * FROM Project_Habilities'),
+        ]
+    finally:
+        conn.close()
+
+
+def test_generate_creates_requested_volume(tmp_path: Path):
+    """
+    Testa que a base gerada tem o volume pedido e inscrições apenas em
+    projetos que pedem alguma habilidade do usuário.
+    """
+    # Arrange
+    path = tmp_path / 'bench.sqlite3'
+
+    # Act
+    counts = _dataset().generate(path)
+
+    # Assert
+    assert counts['User'] == 300
+    assert counts['Organization'] == 10
+    assert counts['Project'] == 80
+    assert counts['Hability'] == 39
+    assert counts['User_Projects'] > 0
+    conn = sqlite3.connect(path)
+    unmatched = conn.execute(
+        """
+        SELECT COUNT(*) FROM User_Projects up
+        WHERE NOT EXISTS (
+            SELECT 1 FROM User_Habilities uh
+            JOIN Project_Habilities ph ON ph.hability_id = uh.hability_id
+            WHERE uh.user_id = up.user_id AND ph.project_id = up.project_id
+        )
+        """
+    ).fetchone()[0]
+    conn.close()
+    assert unmatched == 0
+
+
+def test_generate_is_deterministic(tmp_path: Path):
+    """
+    Testa que a mesma seed gera os mesmos dados e outra seed, dados
+    diferentes.
+    """
+    # Arrange
+    first, second, other = (tmp_path / f'{n}.sqlite3' for n in 'abc')
+
+    # Act
+    _dataset().generate(first)
+    _dataset().generate(second)
+    _dataset(seed=8).generate(other)
+
+    # Assert
+    assert _dump(first) == _dump(second)
+    assert _dump(first) != _dump(other)
+
+
+def test_generated_users_can_log_in(tmp_path: Path):
+    """
+    Testa que o hash compartilhado é válido para a senha padrão.
+    """
+    # Arrange
+    path = tmp_path / 'bench.sqlite3'
+    _dataset().generate(path)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    row = conn.execute('SELECT * FROM User WHERE id = 42').fetchone()
+    conn.close()
+
+    # Act
+    user = User(**dict(row))
+
+    # Assert
+    assert PasswordManager().check_password(DEFAULT_PASSWORD, user)
+
+
+def test_generate_refuses_to_overwrite(tmp_path: Path):
+    """
+    Testa que um arquivo existente só é substituído com `overwrite=True`.
+    """
+    # Arrange
+    path = tmp_path / 'bench.sqlite3'
+    _dataset().generate(path)
+
+    # Act / Assert
+    with pytest.raises(FileExistsError):
+        _dataset().generate(path)
+    assert _dataset().generate(path, overwrite=True)['User'] == 300
@@ -0,0 +1,150 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.models import Hability, Organization, Project
+from src.repositories import (
+    CatalogRepository,
+    HabilityRepository,
+    OrganizationRepository,
+    ProjectRepository,
+)
+from src.repositories.query_counter import QueryCounter
+
+
+@pytest.fixture
+def catalog(db_connection: sqlite3.Connection, tmp_path: Path):
+    """
+    Repositório do catálogo, com o arquivo em `tmp_path`, numa base com
+    25 projetos.
+    """
+    hability = HabilityRepository().save(
+        Hability(name='Python', description='', domain='TI')
+    )
+    org = OrganizationRepository().save(
+        Organization('ONG', 'desc', 'ong@ong.org', '123', 'ong.org')
+    )
+    project_repo = ProjectRepository()
+    for i in range(24):
+        project_repo.save(
+            Project(f'Projeto {i:02}', f'Descrição {i}', org, [hability])
+        )
+    project_repo.save(Project('Ação Social', '50% voluntário', org))
+    return CatalogRepository(path=tmp_path / 'catalog.pickle')
+
+
+@pytest.mark.parametrize(
+    'page, search',
+    [
+        (1, None),
+        (3, None),
+        (9, None),
+        (1, 'PROJETO 1'),
+        (1, 'ação'),
+        (1, 'AÇÃO'),
+        (1, '%'),
+        (1, 'descrição'),
+    ],
+)
+def test_snapshot_pages_match_the_database(
+    catalog: CatalogRepository, page: int, search
+):
+    """
+    Testa que as páginas do snapshot são as mesmas do banco, inclusive
+    na busca (o LIKE do SQLite só ignora maiúsculas nas letras ASCII).
+    """
+    # Arrange
+    snapshot = catalog.build()
+
+    # Act
+    expected = catalog.project_repo.find_all_with_habilities_paginated(
+        page, 10, search=search
+    )
+    result = snapshot.page(page, 10, search=search)
+
+    # Assert
+    assert {k: v for k, v in result.items() if k != 'data'} == {
+        k: v for k, v in expected.items() if k != 'data'
+    }
+    assert [p.id for p in result['data']] == [p.id for p in expected['data']]
+    assert [len(p.habilities) for p in result['data']] == [
+        len(p.habilities) for p in expected['data']
+    ]
+
+
+def test_refresh_reuses_file_until_the_catalog_changes(
+    catalog: CatalogRepository,
+):
+    """
+    Testa que o snapshot gravado é reaproveitado com uma única consulta e
+    que uma escrita no catálogo faz ele ser refeito. O arquivo guarda cada
+    habilidade uma vez e não guarda os textos de busca.
+    """
+    # Arrange
+    first = catalog.refresh()
+    reopened = CatalogRepository(path=catalog.path)
+
+    # Act
+    with QueryCounter('catalog.refresh', max_queries=1) as counter:
+        from_file = reopened.refresh()
+    project = first.projects[0]
+    project.update(name='Projeto renomeado')
+    catalog.project_repo.save(project)
+    rebuilt = reopened.refresh()
+
+    # Assert
+    assert counter.total == 1
+    assert from_file.version == first.version
+    assert len(from_file.projects) == 25
+    python = from_file.projects[1].habilities[0]
+    assert from_file.projects[2].habilities[0] is python
+    assert '_search_texts' not in catalog.read().__dict__
+    assert rebuilt.version > first.version
+    assert 'Projeto renomeado' in {p.name for p in rebuilt.projects}
+    assert catalog.read().version == rebuilt.version
+
+
+def test_snapshot_of_another_database_is_ignored(
+    catalog: CatalogRepository,
+):
+    """
+    Testa que um snapshot de outro banco, mesmo com a mesma versão, não é
+    usado.
+    """
+    # Arrange
+    snapshot = catalog.refresh()
+    catalog.project_repo.conn.execute(
+        "UPDATE Catalog_Version SET token = 'outro'"
+    )
+
+    # Act
+    refreshed = CatalogRepository(path=catalog.path).refresh()
+
+    # Assert
+    assert refreshed.token == 'outro'
+    assert refreshed.version == snapshot.version
+    assert refreshed is not snapshot
+
+
+def test_habilities_come_from_a_valid_snapshot(catalog: CatalogRepository):
+    """
+    Testa que a árvore de habilidades vem do snapshot, com uma consulta
+    (a da versão), e volta ao banco quando uma habilidade muda.
+    """
+    # Arrange
+    catalog.snapshot = catalog.refresh()
+
+    # Act
+    with QueryCounter('catalog.habilities', max_queries=1) as counter:
+        cached = catalog.habilities_by_domain()
+    HabilityRepository().save(
+        Hability(name='SQL', description='', domain='TI')
+    )
+    fresh = catalog.habilities_by_domain()
+
+    # Assert
+    assert counter.total == 1
+    assert cached is catalog.snapshot.habilities_by_domain
+    assert [h.name for h in cached['TI']] == ['Python']
+    assert {h.name for h in fresh['TI']} == {'Python', 'SQL'}
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+from src.repositories.database import Database
+from src.repositories.migrations import SCHEMA_VERSION
+from src.repositories.user import UserRepository
+
+
+def test_thread_connection_falls_back_for_memory_database(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa que bancos em memória (que não podem ser abertos por outra
+    conexão) devolvem a conexão principal.
+    """
+    # Act
+    conn = Database().thread_connection()
+
+    # Assert
+    assert conn is db_connection
+
+
+def test_thread_connection_is_per_thread(tmp_path: Path):
+    """
+    Testa que, com um arquivo, cada thread recebe a sua própria conexão,
+    reaproveitada nas chamadas seguintes da mesma thread.
+    """
+    # Arrange
+    main_conn = sqlite3.connect(tmp_path / 'db.sqlite3')
+    Database._instance = None
+    db = Database(connection=main_conn)
+    others = []
+
+    # Act
+    first = db.thread_connection()
+    thread = threading.Thread(
+        target=lambda: others.append(db.thread_connection())
+    )
+    thread.start()
+    thread.join()
+
+    # Assert
+    try:
+        assert first is db.thread_connection()
+        assert first is not main_conn
+        assert others[0] is not first
+    finally:
+        main_conn.close()
+        Database._instance = None
+
+
+def test_repository_uses_explicit_connection(tmp_path: Path):
+    """
+    Testa que um repositório criado com outra conexão usa essa conexão
+    (e um cursor próprio) em vez da conexão do singleton.
+    """
+    # Arrange
+    path = tmp_path / 'db.sqlite3'
+    main_conn = sqlite3.connect(path)
+    Database._instance = None
+    db = Database(connection=main_conn)
+    other = sqlite3.connect(path)
+
+    # Act
+    repo = UserRepository(db_connection=other)
+
+    # Assert
+    try:
+        assert repo.conn is other
+        assert repo.cursor is not db.cursor
+        assert repo.hability_repo.conn is other
+        assert repo.count() == 0
+    finally:
+        other.close()
+        main_conn.close()
+        Database._instance = None
+
+
+def test_current_schema_opens_without_ddl(tmp_path: Path):
+    """
+    Testa que o primeiro acesso cria o schema e grava `user_version`, e
+    que reabrir um banco já nessa versão não executa DDL.
+    """
+    # Arrange
+    path = tmp_path / 'db.sqlite3'
+    first = sqlite3.connect(path)
+    Database._instance = None
+    created = Database(connection=first).schema_version()
+    first.close()
+    Database._instance = None
+    statements = []
+    second = sqlite3.connect(path)
+    second.set_trace_callback(statements.append)
+
+    # Act
+    db = Database(connection=second)
+
+    # Assert
+    try:
+        assert created == SCHEMA_VERSION
+        assert db.schema_version() == SCHEMA_VERSION
+        assert not [sql for sql in statements if 'CREATE' in sql]
+    finally:
+        second.close()
+        Database._instance = None
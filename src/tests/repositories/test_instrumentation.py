@@ -0,0 +1,88 @@
+import sqlite3
+from pathlib import Path
+
+from loguru import logger
+
+import src
+from src.models.hability import Hability
+from src.repositories import instrumentation
+from src.repositories.hability import HabilityRepository
+from src.repositories.instrumentation import metrics, normalize_sql
+
+
+def test_normalize_sql_groups_equivalent_queries():
+    """
+    Testa que queries que diferem apenas em literais, espaços ou tamanho da
+    lista de IN são reduzidas ao mesmo formato.
+    """
+    a = normalize_sql('SELECT * FROM Hability WHERE id IN (?, ?)')
+    b = normalize_sql('SELECT *\n  FROM Hability\n WHERE id IN (?,?,?,?)')
+
+    assert a == b == 'SELECT * FROM Hability WHERE id IN (?...)'
+    assert normalize_sql("SELECT 1 WHERE name = 'x'") == (
+        'SELECT ? WHERE name = ?'
+    )
+
+
+def test_repository_queries_are_recorded_with_rows(
+    db_connection: sqlite3.Connection, monkeypatch
+):
+    """
+    Testa que cada query guarda as linhas retornadas e aparece no resumo
+    com seus percentis, sem subir a pilha atrás do método de origem
+    quando não é lenta.
+    """
+    # --- Arrange ---
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    for name in ['Python', 'SQL', 'Design']:
+        hability_repo.save(Hability(name=name, description='', domain='T'))
+    metrics.reset()
+
+    def find_caller(frame):
+        raise AssertionError('origem resolvida para uma query rápida')
+
+    monkeypatch.setattr(instrumentation, '_find_caller', find_caller)
+
+    # --- Act ---
+    hability_repo.find_all()
+    hability_repo.find_all()
+
+    # --- Assert ---
+    summary = metrics.summary()
+    stats = summary['SELECT * FROM Hability']
+    assert stats['count'] == 2
+    assert stats['rows'] == 6
+    assert stats['slow_callers'] == []
+    assert 0 <= stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms']
+
+
+def test_slow_queries_go_to_slow_query_log(
+    db_connection: sqlite3.Connection, tmp_path: Path
+):
+    """
+    Testa que queries acima do limite configurado são enviadas ao log de
+    queries lentas.
+    """
+    # --- Arrange ---
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    log_file = tmp_path / 'slow_queries.log'
+    logger.remove(src.slow_query_sink)
+    sink_id = src.add_slow_query_log(log_file)
+    previous_threshold = metrics.slow_threshold_ms
+    metrics.slow_threshold_ms = 0
+    metrics.reset()
+
+    # --- Act ---
+    try:
+        hability_repo.count()
+    finally:
+        metrics.slow_threshold_ms = previous_threshold
+        logger.remove(sink_id)
+        src.slow_query_sink = src.add_slow_query_log()
+
+    # --- Assert ---
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert 'HabilityRepository.count' in lines[0]
+    (stats,) = metrics.summary().values()
+    assert stats['slow_callers'] == ['HabilityRepository.count']
@@ -0,0 +1,32 @@
+import sqlite3
+
+from src.models import Hability
+from src.repositories import HabilityRepository
+from src.repositories.query_counter import QueryCounter
+
+
+def test_find_keyset_pages_forward_and_backward(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa que a paginação por id anda nas duas direções, com uma query
+    por página, e filtra pelas colunas de busca.
+    """
+    # Arrange
+    repo = HabilityRepository(db_connection=db_connection)
+    for i in range(10):
+        repo.save(Hability(name=f'Hab {i}', description='', domain='TI'))
+
+    # Act
+    with QueryCounter('keyset') as counter:
+        forward = repo.find_keyset(after_id=3, limit=4)
+        backward = repo.find_keyset(before_id=4, limit=4)
+    searched = repo.find_keyset(search='Hab 9')
+    escaped = repo.find_keyset(search='%')
+
+    # Assert
+    assert counter.total == 2
+    assert [h.id for h in forward] == [4, 5, 6, 7]
+    assert [h.id for h in backward] == [1, 2, 3]
+    assert [h.name for h in searched] == ['Hab 9']
+    assert escaped == []
@@ -0,0 +1,144 @@
+import sqlite3
+
+import pytest
+
+from src.repositories.migrations import (
+    INDEX_SCRIPT,
+    SCHEMA_SCRIPT,
+    SCHEMA_VERSION,
+    Migration,
+    migrate,
+    rebuild_table,
+)
+
+
+def _version(conn: sqlite3.Connection) -> int:
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def _indexes(conn: sqlite3.Connection) -> set[str]:
+    return {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+
+
+def test_migrate_applies_all_then_does_nothing():
+    """
+    Testa que um banco novo recebe todas as migrações e que, em dia, a
+    migração seguinte só lê `user_version`.
+    """
+    # Arrange
+    conn = sqlite3.connect(':memory:')
+    statements = []
+
+    # Act
+    applied = migrate(conn)
+    conn.set_trace_callback(statements.append)
+    applied_again = migrate(conn)
+    conn.set_trace_callback(None)
+
+    # Assert
+    assert applied == SCHEMA_VERSION
+    assert applied_again == 0
+    assert _version(conn) == SCHEMA_VERSION
+    assert statements == ['PRAGMA user_version']
+    assert 'idx_project_name' in _indexes(conn)
+    assert 'idx_user_email' not in _indexes(conn)
+
+
+def test_migrate_upgrades_from_stored_version():
+    """
+    Testa que um banco na versão 1 (schema inicial) recebe só as
+    migrações seguintes, com progresso informado a cada passo.
+    """
+    # Arrange
+    conn = sqlite3.connect(':memory:')
+    conn.executescript(SCHEMA_SCRIPT + INDEX_SCRIPT)
+    conn.execute('PRAGMA user_version = 1')
+    reports = []
+
+    # Act
+    applied = migrate(conn, progress=lambda *args: reports.append(args))
+
+    # Assert
+    assert applied == SCHEMA_VERSION - 1
+    assert reports[0][0].startswith('migração 2')
+    assert 'idx_hability_name' not in _indexes(conn)
+
+
+def test_rebuild_table_copies_rows_in_batches():
+    """
+    Testa que a reconstrução copia as linhas em lotes, informando o
+    progresso de cada um, e mantém as colunas em comum.
+    """
+    # Arrange
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE Item (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany(
+        'INSERT INTO Item (name) VALUES (?)', [(f'i{n}',) for n in range(25)]
+    )
+    conn.commit()
+    migration = Migration(
+        1,
+        'Item com status',
+        (
+            rebuild_table(
+                'Item',
+                'CREATE TABLE Item__new (id INTEGER PRIMARY KEY, '
+                "name TEXT NOT NULL, status TEXT DEFAULT 'ok')",
+                batch_size=10,
+            ),
+        ),
+    )
+    reports = []
+
+    # Act
+    migrate(conn, [migration], progress=lambda *args: reports.append(args))
+
+    # Assert
+    assert [r for r in reports if r[0] == 'copiando Item'] == [
+        ('copiando Item', 10, 25),
+        ('copiando Item', 20, 25),
+        ('copiando Item', 25, 25),
+    ]
+    rows = conn.execute('SELECT id, name, status FROM Item').fetchall()
+    assert rows[0] == (1, 'i0', 'ok')
+    assert len(rows) == 25
+    assert _version(conn) == 1
+
+
+def test_failed_migration_keeps_table_and_version():
+    """
+    Testa que uma reconstrução que falha desfaz tudo: a tabela antiga e a
+    versão do banco ficam como estavam.
+    """
+    # Arrange
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE Item (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.execute('INSERT INTO Item (name) VALUES (NULL)')
+    conn.commit()
+    migration = Migration(
+        1,
+        'nome obrigatório',
+        (
+            rebuild_table(
+                'Item',
+                'CREATE TABLE Item__new (id INTEGER PRIMARY KEY, '
+                'name TEXT NOT NULL)',
+            ),
+        ),
+    )
+
+    # Act
+    with pytest.raises(sqlite3.IntegrityError):
+        migrate(conn, [migration])
+
+    # Assert
+    assert conn.execute('SELECT COUNT(*) FROM Item').fetchone()[0] == 1
+    assert 'Item__new' not in {
+        row[0] for row in conn.execute('SELECT name FROM sqlite_master')
+    }
+    assert _version(conn) == 0
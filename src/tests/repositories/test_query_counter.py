@@ -0,0 +1,141 @@
+import sqlite3
+
+import pytest
+from loguru import logger
+
+from src.models import Hability, Organization, Project
+from src.repositories.hability import HabilityRepository
+from src.repositories.organization import OrganizationRepository
+from src.repositories.project import ProjectRepository
+from src.repositories.query_counter import QueryBudgetExceeded, QueryCounter
+from src.repositories.user import UserRepository
+from src.security.password import PasswordManager
+from src.use_cases.login import LoginUseCase
+
+
+@pytest.fixture
+def projects(db_connection: sqlite3.Connection) -> list[Project]:
+    """Cria alguns projetos com organização e habilidades."""
+    org = OrganizationRepository(db_connection=db_connection).save(
+        Organization('ONG', 'desc', 'ong@ong.org', '123', 'ong.org')
+    )
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    habilities = [
+        hability_repo.save(Hability(name=f'H{i}', description='', domain='T'))
+        for i in range(3)
+    ]
+    project_repo = ProjectRepository(db_connection=db_connection)
+    return [
+        project_repo.save(
+            Project(f'Projeto {i}', 'desc', org, habilities=habilities)
+        )
+        for i in range(5)
+    ]
+
+
+def test_counter_groups_queries_by_shape(
+    db_connection: sqlite3.Connection, projects
+):
+    """
+    Testa que o contador agrupa por formato as queries feitas no escopo.
+    """
+    # --- Arrange ---
+    project_repo = ProjectRepository(db_connection=db_connection)
+
+    # --- Act ---
+    with QueryCounter('loop') as counter:
+        for project in projects:
+            project_repo.get_by_id(project.id)
+
+    # --- Assert ---
+    assert counter.total == len(projects)
+    assert counter.by_shape['SELECT * FROM Project WHERE id = ?'] == len(
+        projects
+    )
+
+
+def test_repeated_shape_fails_in_strict_mode(
+    db_connection: sqlite3.Connection, projects
+):
+    """
+    Testa que um N+1 (mesmo formato repetido além do limite) falha o teste
+    quando o contador está em modo estrito.
+    """
+    project_repo = ProjectRepository(db_connection=db_connection)
+
+    with pytest.raises(QueryBudgetExceeded, match='5x'):
+        with QueryCounter('n+1', max_repeats=1, strict=True):
+            for project in projects:
+                project_repo.get_habilities_for_project(project.id)
+
+
+def test_exceeded_budget_only_warns_by_default(
+    db_connection: sqlite3.Connection, projects
+):
+    """
+    Testa que fora do modo estrito o orçamento excedido gera apenas um aviso.
+    """
+    # --- Arrange ---
+    project_repo = ProjectRepository(db_connection=db_connection)
+    messages = []
+    sink_id = logger.add(messages.append, level='WARNING')
+
+    # --- Act ---
+    try:
+        with QueryCounter('orçamento', max_queries=1, strict=False):
+            project_repo.count()
+            project_repo.find_all()
+    finally:
+        logger.remove(sink_id)
+
+    # --- Assert ---
+    assert any('2 queries (máximo 1)' in m for m in messages)
+
+
+def test_decorator_applies_budget_per_call(
+    db_connection: sqlite3.Connection, projects
+):
+    """
+    Testa o uso como decorator: cada chamada tem seu próprio escopo.
+    """
+    project_repo = ProjectRepository(db_connection=db_connection)
+
+    @QueryCounter(max_queries=1, strict=True)
+    def load_one(project_id):
+        return project_repo.get_by_id(project_id)
+
+    assert load_one(projects[0].id).id == projects[0].id
+    assert load_one(projects[1].id).id == projects[1].id
+
+
+def test_paginated_listing_has_no_n_plus_one(
+    db_connection: sqlite3.Connection, projects
+):
+    """
+    Testa que a listagem paginada carrega relações em número constante de
+    queries, independente da quantidade de projetos na página.
+    """
+    project_repo = ProjectRepository(db_connection=db_connection)
+
+    with QueryCounter('paginação', max_queries=4, max_repeats=1, strict=True):
+        result = project_repo.find_all_with_habilities_paginated(per_page=5)
+
+    assert len(result['data']) == 5
+    assert all(len(p.habilities) == 3 for p in result['data'])
+
+
+def test_login_runs_a_single_query(
+    db_connection: sqlite3.Connection, registered_user
+):
+    """
+    Testa que o login faz apenas uma consulta ao banco.
+    """
+    user, password = registered_user
+    login_uc = LoginUseCase(
+        UserRepository(db_connection=db_connection), PasswordManager()
+    )
+
+    with QueryCounter('login', max_queries=1, strict=True):
+        logged_in_user, _ = login_uc.execute(user.email, password)
+
+    assert logged_in_user is not None
@@ -0,0 +1,158 @@
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.repositories.login_attempt import LoginAttemptRepository
+from src.repositories.query_counter import QueryCounter
+from src.repositories.user import UserRepository
+from src.security.password import PasswordManager
+from src.security.throttle import LoginThrottle
+from src.use_cases.login import LoginUseCase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_per_email_bucket_rejects_excess_attempts(clock):
+    """
+    Testa que, esgotadas as fichas de um e-mail, novas tentativas são
+    rejeitadas até a reposição, sem afetar outros e-mails.
+    """
+    throttle = LoginThrottle(
+        per_email_capacity=2, per_email_refill=1.0, clock=clock
+    )
+
+    assert throttle.check('a@example.com')[0] is True
+    assert throttle.check('a@example.com')[0] is True
+    allowed, retry_after = throttle.check('a@example.com')
+    assert allowed is False
+    assert retry_after == pytest.approx(1.0)
+    assert throttle.check('b@example.com')[0] is True
+
+    clock.now += 1
+    assert throttle.check('a@example.com')[0] is True
+    assert throttle.stats() == {'rejected': 1, 'evaluated': 4}
+
+
+def test_global_bucket_limits_all_emails(clock):
+    """
+    Testa que o balde global limita tentativas mesmo com e-mails diferentes.
+    """
+    throttle = LoginThrottle(global_capacity=3, global_refill=1, clock=clock)
+
+    results = [throttle.check(f'u{i}@example.com')[0] for i in range(5)]
+
+    assert results == [True, True, True, False, False]
+
+
+def test_backoff_doubles_after_free_failures(clock):
+    """
+    Testa o backoff exponencial depois das falhas gratuitas.
+    """
+    throttle = LoginThrottle(free_failures=1, base_backoff=2, clock=clock)
+
+    throttle.record_failure('a@example.com')
+    assert throttle.check('a@example.com')[0] is True
+
+    throttle.record_failure('a@example.com')
+    assert throttle.check('a@example.com') == (False, 2)
+
+    clock.now += 2
+    throttle.record_failure('a@example.com')
+    assert throttle.check('a@example.com') == (False, 4)
+
+    throttle.record_success('a@example.com')
+    assert throttle.check('a@example.com')[0] is True
+
+
+def test_blocked_state_survives_restart_through_sqlite(
+    db_connection: sqlite3.Connection, clock
+):
+    """
+    Testa que o bloqueio é recuperado do SQLite quando o e-mail não está na
+    memória (ex.: após reiniciar a aplicação).
+    """
+    repo = LoginAttemptRepository(db_connection=db_connection)
+    first = LoginThrottle(repo, free_failures=0, base_backoff=60, clock=clock)
+    first.record_failure('a@example.com')
+
+    restarted = LoginThrottle(repo, clock=clock)
+
+    assert restarted.check('a@example.com') == (False, 60)
+
+
+def test_login_rejects_before_key_derivation(
+    db_connection: sqlite3.Connection, registered_user, clock
+):
+    """
+    Testa que tentativas em excesso são rejeitadas pelo LoginUseCase antes
+    de qualquer derivação scrypt.
+    """
+    # --- Arrange ---
+    user, _ = registered_user
+    throttle = LoginThrottle(
+        LoginAttemptRepository(db_connection=db_connection),
+        free_failures=1,
+        clock=clock,
+    )
+    login_uc = LoginUseCase(
+        UserRepository(db_connection=db_connection),
+        PasswordManager(),
+        throttle,
+    )
+    for _ in range(2):
+        login_uc.execute(user.email, 'wrong-password')
+
+    # --- Act ---
+    with patch.object(PasswordManager, '_derive') as derive:
+        logged_in_user, error = login_uc.execute(user.email, 'wrong-password')
+
+    # --- Assert ---
+    assert logged_in_user is None
+    assert error.startswith('Muitas tentativas de login.')
+    derive.assert_not_called()
+    assert throttle.stats() == {'rejected': 1, 'evaluated': 2}
+
+
+def test_only_known_accounts_are_persisted(
+    db_connection: sqlite3.Connection, registered_user, clock
+):
+    """
+    Testa que falhas de e-mails sem conta não são gravadas no SQLite e que
+    um login sem falhas anteriores não escreve na tabela.
+    """
+    # --- Arrange ---
+    user, password = registered_user
+    repo = LoginAttemptRepository(db_connection=db_connection)
+    throttle = LoginThrottle(repo, clock=clock)
+    login_uc = LoginUseCase(
+        UserRepository(db_connection=db_connection),
+        PasswordManager(),
+        throttle,
+    )
+
+    # --- Act ---
+    for i in range(5):
+        login_uc.execute(f'spray{i}@example.com', 'any-password')
+    login_uc.execute(user.email, 'wrong-password')
+    persisted = repo.count()
+    login_uc.execute(user.email, password)
+    with QueryCounter('login.success') as counter:
+        throttle.record_success(user.email)
+        throttle.record_success('nobody@example.com')
+
+    # --- Assert ---
+    assert persisted == 1
+    assert repo.count() == 0
+    assert counter.total == 0
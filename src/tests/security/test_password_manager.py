@@ -0,0 +1,97 @@
+import pytest
+
+from src.models.users import User
+from src.security.password import HASH_PREFIX, PasswordManager
+
+
+def _legacy_user(password: str) -> User:
+    """Cria um usuário com a senha no formato antigo (bytes crus + salt)."""
+    pm = PasswordManager(n=16384, r=8, p=1)
+    salt = pm._gen_salt()
+    return User(
+        email='legacy@example.com',
+        password=pm._derive(password, salt),
+        salt=salt,
+    )
+
+
+def test_hash_is_self_describing():
+    """
+    Testa que o hash gerado carrega o algoritmo e os parâmetros usados.
+    """
+    pm = PasswordManager(n=1024, r=4, p=1)
+
+    hashed, salt = pm.hash_password('Senha123*')
+
+    assert hashed.startswith(f'{HASH_PREFIX}ln=10,r=4,p=1$')
+    decoded = PasswordManager.decode(hashed)
+    assert decoded['salt'] == salt
+    assert len(decoded['hash']) == pm.dklen
+
+
+def test_check_password_uses_stored_parameters():
+    """
+    Testa que a verificação usa os parâmetros gravados no hash, mesmo que a
+    configuração atual seja outra.
+    """
+    hashed, salt = PasswordManager(n=1024).hash_password('Senha123*')
+    user = User(email='u@example.com', password=hashed, salt=salt)
+
+    assert PasswordManager(n=2048).check_password('Senha123*', user) is True
+    assert PasswordManager(n=2048).check_password('errada', user) is False
+
+
+def test_legacy_hash_is_accepted_and_flagged_for_rehash():
+    """
+    Testa que hashes no formato antigo continuam válidos, mas são marcados
+    para serem regravados.
+    """
+    user = _legacy_user('Senha123*')
+    pm = PasswordManager()
+
+    assert pm.check_password('Senha123*', user) is True
+    assert pm.needs_rehash(user) is True
+
+
+def test_needs_rehash_when_parameters_change():
+    """
+    Testa que um hash com custo diferente do atual precisa ser regravado.
+    """
+    hashed, salt = PasswordManager(n=1024).hash_password('Senha123*')
+    user = User(email='u@example.com', password=hashed, salt=salt)
+
+    assert PasswordManager(n=1024).needs_rehash(user) is False
+    assert PasswordManager(n=2048).needs_rehash(user) is True
+
+
+def test_calibrate_respects_memory_limit():
+    """
+    Testa que a calibração não escolhe um custo acima do limite de memória.
+    """
+    pm = PasswordManager.calibrate(target_ms=10_000, max_memory=4 * 1024**2)
+
+    assert 128 * pm.r * (pm.n + pm.p + 2) <= 4 * 1024**2
+    assert pm.n & (pm.n - 1) == 0
+
+
+@pytest.mark.parametrize(
+    'stored',
+    [
+        '$scrypt$',
+        '$scrypt$ln=10,r=8$cw==$aA==',
+        '$scrypt$ln=x,r=8,p=1$cw==$aA==',
+        '$scrypt$ln=10,r=8,p=1$c!==$aA==',
+        '$scrypt$ln=10,r=8,p=1$cw==$',
+        '$scrypt$ln=0,r=8,p=1$cw==$aA==',
+    ],
+)
+def test_malformed_hash_is_rejected(stored: str):
+    """
+    Testa que um hash `$scrypt$` malformado é recusado com `ValueError`
+    na decodificação e faz a verificação da senha retornar False.
+    """
+    user = User(email='u@example.com', password=stored, salt=b's')
+
+    with pytest.raises(ValueError):
+        PasswordManager.decode(stored)
+    assert PasswordManager(n=1024).check_password('Senha123*', user) is False
@@ -0,0 +1,48 @@
+import sqlite3
+
+from src.container import ServiceContainer
+from src.events import EventBus
+
+
+def test_services_are_built_once_and_shared(db_connection: sqlite3.Connection):
+    """
+    Testa que cada serviço é montado uma vez e que repositórios e casos
+    de uso compartilham as mesmas instâncias.
+    """
+    # Arrange
+    events = EventBus()
+    services = ServiceContainer(db_connection, events=events)
+
+    # Act
+    user_repo = services.user_repository
+    project_repo = services.project_repository
+
+    # Assert
+    assert services.user_repository is user_repo
+    assert user_repo.conn is db_connection
+    assert user_repo.project_repo is project_repo
+    assert user_repo.hability_repo is services.hability_repository
+    assert project_repo.hability_repo is services.hability_repository
+    assert project_repo.org_repo is services.organization_repository
+    assert services.login_use_case.user_repository is user_repo
+    assert services.login_use_case.throttle is services.login_throttle
+    assert services.subscribe_use_case._user_repository is user_repo
+    assert services.update_user_use_case._events is events
+
+
+def test_services_are_built_on_demand(db_connection: sqlite3.Connection):
+    """
+    Testa que o contêiner só monta os serviços pedidos.
+    """
+    # Arrange
+    services = ServiceContainer(db_connection)
+
+    # Act
+    services.hability_repository
+
+    # Assert
+    assert set(vars(services)) == {
+        '_db_connection',
+        'events',
+        'hability_repository',
+    }
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from src import BASE_PATH
+
+
+def test_login_does_not_import_other_screens():
+    """
+    Testa que importar o app não importa as demais telas: elas só são
+    carregadas quando abertas.
+    """
+    # Arrange
+    code = (
+        'import sys, src.tui.login; '
+        'print(sorted(m for m in sys.modules if m in ('
+        "'src.tui.user', 'src.tui.admin', 'src.tui.project', "
+        "'src.tui.register')))"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=BASE_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,360 @@
+import sqlite3
+
+import pytest
+from textual.app import App
+from textual.widgets import (
+    DataTable,
+    Input,
+    Select,
+    SelectionList,
+    TabbedContent,
+)
+from textual.widgets.select import InvalidSelectValueError
+
+from src.models import Hability, Organization, Project, Role, User
+from src.repositories import (
+    HabilityRepository,
+    OrganizationRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.query_counter import QueryCounter
+from src.tui.admin import AdminScreen
+from src.tui.widgets import EntityBrowser
+from src.tui.widgets.entity_browser import SEARCH_DEBOUNCE
+
+
+@pytest.fixture
+def admin(
+    db_connection: sqlite3.Connection, registered_user: tuple[User, str]
+) -> User:
+    """
+    Administrador, com 45 organizações, uma habilidade e três projetos.
+    """
+    hability = HabilityRepository(db_connection=db_connection).save(
+        Hability(name='Python', description='', domain='TI')
+    )
+    org_repo = OrganizationRepository(db_connection=db_connection)
+    for i in range(45):
+        org = org_repo.save(
+            Organization(f'ONG {i}', 'desc', f'ong{i}@ong.org', '1', 'ong.org')
+        )
+    project_repo = ProjectRepository(db_connection=db_connection)
+    for i in range(3):
+        project_repo.save(Project(f'Projeto {i}', 'desc', org, [hability]))
+
+    user, _ = registered_user
+    user.role = Role.ADMIN
+    return UserRepository(db_connection=db_connection).save(user)
+
+
+@pytest.mark.asyncio
+async def test_opening_admin_panel_runs_no_queries(admin: User):
+    """
+    Testa que abrir o painel não busca dados: a aba inicial (criar
+    organização) não tem listas.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        # Act
+        with QueryCounter('admin') as counter:
+            await app.push_screen(AdminScreen(user_logged=admin))
+            await pilot.pause()
+            await app.screen.workers.wait_for_complete()
+
+        # Assert
+        assert counter.total == 0
+        assert not app.screen.query_one('#org-edit-list', EntityBrowser).loaded
+
+
+@pytest.mark.asyncio
+async def test_tab_data_is_fetched_once_for_sibling_lists(admin: User):
+    """
+    Testa que abrir a edição de projetos busca cada grupo de dados uma
+    vez só, preenche com ele todas as listas do grupo, e carrega só a
+    primeira página da tabela de projetos.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(AdminScreen(user_logged=admin))
+        await pilot.pause()
+        screen = app.screen
+
+        # Act
+        with QueryCounter('admin.projects') as counter:
+            screen.query_one('#main-tabs', TabbedContent).active = 'proj-tab'
+            screen.query_one(
+                '#proj-crud-tabs', TabbedContent
+            ).active = 'proj-edit-tab'
+            await pilot.pause()
+            await screen.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Assert
+        # Organizações, habilidades, projetos e a organização deles
+        assert counter.total == 4
+        browser = screen.query_one('#proj-edit-list', EntityBrowser)
+        table = browser.query_one(DataTable)
+        assert table.row_count == 3
+        assert str(table.get_row_at(0)[2]) == 'ONG 44'
+        assert not browser.loading
+        # Levantaria InvalidSelectValueError sem a opção
+        for select_id in ('#proj-org-select', '#proj-edit-org-select'):
+            screen.query_one(select_id, Select).value = 45
+        assert screen.query_one('#proj-hab-list', SelectionList).option_count
+        assert not screen.query_one('#user-edit-list', EntityBrowser).loaded
+
+
+async def _open_org_browser(app: App, pilot, admin: User) -> EntityBrowser:
+    await app.push_screen(AdminScreen(user_logged=admin))
+    await pilot.pause()
+    app.screen.query_one(
+        '#org-crud-tabs', TabbedContent
+    ).active = 'org-edit-tab'
+    await pilot.pause()
+    await app.screen.workers.wait_for_complete()
+    await pilot.pause()
+    return app.screen.query_one('#org-edit-list', EntityBrowser)
+
+
+def _ids(browser: EntityBrowser) -> list[int]:
+    table = browser.query_one(DataTable)
+    return [int(row.value) for row in table.rows]
+
+
+async def _settle(pilot, widget) -> None:
+    await pilot.pause()
+    await widget.workers.wait_for_complete()
+    await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_entity_browser_pages_searches_and_jumps(admin: User):
+    """
+    Testa a paginação por id, a busca no banco e o salto para um id na
+    tabela de organizações.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        browser = await _open_org_browser(app, pilot, admin)
+        first_page = _ids(browser)
+
+        # Act
+        browser.query_one('.entity-next').press()
+        await _settle(pilot, browser)
+        second_page = _ids(browser)
+        browser.query_one('.entity-prev').press()
+        await _settle(pilot, browser)
+        back = _ids(browser)
+
+        browser.query_one(Input).value = 'ONG 4'
+        await pilot.pause(SEARCH_DEBOUNCE + 0.1)
+        await _settle(pilot, browser)
+        searched = _ids(browser)
+
+        browser.query_one(Input).value = '#33'
+        await pilot.pause(SEARCH_DEBOUNCE + 0.1)
+        await _settle(pilot, browser)
+        jumped = _ids(browser)
+
+        # Assert
+        assert first_page == list(range(1, 21))
+        assert second_page == list(range(21, 41))
+        assert back == first_page
+        assert searched == [5, 41, 42, 43, 44, 45]  # 'ONG 4' e 'ONG 40'..44
+        assert jumped[0] == 33
+        assert browser.query_one(DataTable).cursor_row == 0
+
+
+@pytest.mark.asyncio
+async def test_entity_browser_pages_after_emptied_page(admin: User):
+    """
+    Testa que a próxima página ainda abre depois de todas as linhas da
+    página atual serem removidas.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        browser = await _open_org_browser(app, pilot, admin)
+        for entity_id in _ids(browser):
+            browser.remove(entity_id)
+
+        # Act
+        browser.query_one('.entity-next').press()
+        await _settle(pilot, browser)
+
+        # Assert
+        assert _ids(browser) == list(range(21, 41))
+
+
+@pytest.mark.asyncio
+async def test_entity_browser_reports_database_errors(
+    admin: User, monkeypatch
+):
+    """
+    Testa que um erro do banco ao buscar uma página não derruba o app:
+    a tabela sai do estado de carregamento e o erro é notificado.
+    """
+
+    # Arrange
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(OrganizationRepository, 'find_keyset', locked)
+    app = App()
+    async with app.run_test() as pilot:
+        # Act
+        browser = await _open_org_browser(app, pilot, admin)
+
+        # Assert
+        assert browser.loaded
+        assert not browser.loading
+        assert _ids(browser) == []
+        assert isinstance(app.screen, AdminScreen)
+
+
+@pytest.mark.asyncio
+async def test_selecting_a_row_fills_edit_form(admin: User):
+    """
+    Testa que escolher uma linha da tabela preenche o formulário.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        browser = await _open_org_browser(app, pilot, admin)
+        table = browser.query_one(DataTable)
+        table.focus()
+        table.move_cursor(row=2)
+
+        # Act
+        await pilot.press('enter')
+        await _settle(pilot, app.screen)
+
+        # Assert
+        assert browser.selected_id == 3
+        assert app.screen.query_one('#org-edit-name', Input).value == 'ONG 2'
+
+
+async def _select_row(pilot, browser: EntityBrowser, row: int) -> None:
+    table = browser.query_one(DataTable)
+    table.focus()
+    table.move_cursor(row=row)
+    await pilot.press('enter')
+    await _settle(pilot, browser.screen)
+
+
+@pytest.mark.asyncio
+async def test_admin_writes_patch_lists_without_requerying(admin: User):
+    """
+    Testa que editar e deletar uma organização atualiza as tabelas e os
+    Selects no lugar: a única query é a própria escrita.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        edit_browser = await _open_org_browser(app, pilot, admin)
+        screen = app.screen
+        main_tabs = screen.query_one('#main-tabs', TabbedContent)
+        main_tabs.active = 'proj-tab'  # carrega os Selects de organização
+        await _settle(pilot, screen)
+        main_tabs.active = 'org-tab'
+        await _select_row(pilot, edit_browser, 2)
+        screen.query_one(
+            '#org-crud-tabs', TabbedContent
+        ).active = 'org-delete-tab'
+        await _settle(pilot, screen)
+        delete_browser = screen.query_one('#org-delete-list', EntityBrowser)
+        await _select_row(pilot, delete_browser, 3)
+        screen.query_one('#org-edit-name', Input).value = 'ONG renomeada'
+
+        # Act
+        with QueryCounter('admin.writes') as counter:
+            screen.query_one('#update-org-button').press()
+            await _settle(pilot, screen)
+            screen.query_one('#delete-org-button').press()
+            await _settle(pilot, screen)
+
+        # Assert
+        assert counter.total == 2  # UPDATE e DELETE
+        for browser in (edit_browser, delete_browser):
+            table = browser.query_one(DataTable)
+            assert str(table.get_row('3')[1]) == 'ONG renomeada'
+            assert '4' not in table.rows
+        select = screen.query_one('#proj-org-select', Select)
+        select.value = 3
+        with pytest.raises(InvalidSelectValueError):
+            select.value = 4
+
+
+@pytest.mark.asyncio
+async def test_group_refresh_keeps_chosen_options(admin: User):
+    """
+    Testa que atualizar as opções de um grupo mantém a organização e as
+    habilidades escolhidas, enquanto elas existirem.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(AdminScreen(user_logged=admin))
+        await pilot.pause()
+        screen = app.screen
+        screen.query_one('#main-tabs', TabbedContent).active = 'proj-tab'
+        await _settle(pilot, screen)
+        org_select = screen.query_one('#proj-org-select', Select)
+        hab_list = screen.query_one('#proj-hab-list', SelectionList)
+        org_select.value = 5
+        hab_list.select(1)
+
+        # Act
+        screen._patch_option('org', 46, 'ONG nova')
+        screen._patch_option('hab', 2, 'Outra habilidade')
+        kept = (org_select.value, hab_list.selected)
+        screen._patch_option('org', 5)
+        removed = org_select.value
+
+        # Assert
+        assert kept == (5, [1])
+        assert removed == Select.BLANK
+
+
+@pytest.mark.asyncio
+async def test_selection_list_patches_only_the_changed_option(
+    admin: User, monkeypatch
+):
+    """
+    Testa que inserir, renomear e remover uma habilidade mexe só na opção
+    afetada das SelectionLists, sem remontar a lista.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(AdminScreen(user_logged=admin))
+        await pilot.pause()
+        screen = app.screen
+        screen.query_one('#main-tabs', TabbedContent).active = 'proj-tab'
+        await _settle(pilot, screen)
+        hab_list = screen.query_one('#proj-hab-list', SelectionList)
+        hab_list.select(1)
+
+        def rebuilt(*args):
+            raise AssertionError('a lista foi remontada')
+
+        monkeypatch.setattr(SelectionList, 'clear_options', rebuilt)
+
+        # Act
+        screen._patch_option('hab', 2, 'SQL')
+        screen._patch_option('hab', 3, 'Go')
+        hab_list.select(3)
+        screen._patch_option('hab', 2, 'SQLite')
+        screen._patch_option('hab', 3)
+
+        # Assert
+        prompts = [
+            str(hab_list.get_option_at_index(i).prompt)
+            for i in range(hab_list.option_count)
+        ]
+        assert prompts == ['Python', 'SQLite']
+        assert hab_list.selected == [1]
@@ -0,0 +1,56 @@
+import sqlite3
+
+import pytest
+from textual.widgets import Button, Input
+
+from src.repositories import UserRepository
+from src.security.password import PasswordManager
+from src.tui.login import ColaboraApp
+from src.tui.user import UserScreen
+from src.use_cases import RegisterUserUseCase
+from src.validators import email_validator, password_validator
+
+
+async def _login(app: ColaboraApp, pilot, email: str, password: str):
+    app.query_one('#email-input', Input).value = email
+    app.query_one('#password-input', Input).value = password
+    app.query_one('#login-button', Button).press()
+    await pilot.pause()
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_login_counts_on_the_app_throttle(
+    file_database: sqlite3.Connection, monkeypatch
+):
+    """
+    Testa que os logins feitos pela tela, num worker, aparecem nos
+    contadores do `LoginThrottle` do contêiner do app.
+    """
+    # Arrange
+    monkeypatch.setattr(ColaboraApp, '_populate', staticmethod(lambda _: None))
+    RegisterUserUseCase(
+        UserRepository(),
+        PasswordManager(n=1024),
+        email_validator,
+        password_validator,
+    ).execute('screen.user@example.com', 'ValidPassword123*')
+    app = ColaboraApp()
+    async with app.run_test() as pilot:
+        # O botão só é liberado depois das seeds, rodadas após a 1ª pintura
+        while app.query_one('#login-button', Button).disabled:
+            await pilot.pause(0.01)
+
+        # Act
+        await _login(app, pilot, 'screen.user@example.com', 'wrong')
+        await _login(
+            app, pilot, 'screen.user@example.com', 'ValidPassword123*'
+        )
+
+        # Assert
+        assert isinstance(app.screen, UserScreen)
+        assert app.services.login_throttle.stats() == {
+            'rejected': 0,
+            'evaluated': 2,
+        }
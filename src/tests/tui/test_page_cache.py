@@ -0,0 +1,37 @@
+from src.tui.cache import PageCache
+
+
+def test_page_cache_discards_results_from_before_clear():
+    """
+    Testa que uma página buscada antes de `clear()` não entra no cache.
+    """
+    # Arrange
+    cache = PageCache()
+    generation = cache.generation
+
+    # Act
+    cache.clear()
+    cache.put(((), 1), 'antiga', generation)
+    cache.put(((), 2), 'nova', cache.generation)
+
+    # Assert
+    assert ((), 1) not in cache
+    assert cache.get(((), 2)) == 'nova'
+
+
+def test_page_cache_evicts_least_recently_used():
+    """
+    Testa que, cheio, o cache descarta a página usada há mais tempo.
+    """
+    # Arrange
+    cache = PageCache(max_pages=2)
+    cache.put(1, 'p1')
+    cache.put(2, 'p2')
+    cache.get(1)
+
+    # Act
+    cache.put(3, 'p3')
+
+    # Assert
+    assert 2 not in cache
+    assert 1 in cache and 3 in cache
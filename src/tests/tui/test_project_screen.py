@@ -0,0 +1,405 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+from textual.app import App
+
+from src.models import Hability, Organization, Project, User
+from src.repositories import (
+    CatalogRepository,
+    HabilityRepository,
+    OrganizationRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.query_counter import QueryCounter
+from src.tui.project import SEARCH_BATCH, SEARCH_DEBOUNCE, ProjectScreen
+from src.tui.widgets import ProjectList
+
+
+def _create_projects(conn: sqlite3.Connection, user: User) -> User:
+    """
+    Cria 150 projetos (duas páginas) e dá ao usuário a habilidade pedida
+    por todos eles.
+    """
+    hability = HabilityRepository(db_connection=conn).save(
+        Hability(name='Python', description='', domain='TI')
+    )
+    org = OrganizationRepository(db_connection=conn).save(
+        Organization('ONG', 'desc', 'ong@ong.org', '123', 'ong.org')
+    )
+    project_repo = ProjectRepository(db_connection=conn)
+    for i in range(150):
+        project_repo.save(
+            Project(f'Projeto {i:03}', f'Descrição {i}', org, [hability])
+        )
+
+    user.add_hability(hability)
+    return UserRepository(db_connection=conn).save(user)
+
+
+@pytest.fixture
+def subscriber(
+    db_connection: sqlite3.Connection, registered_user: tuple[User, str]
+) -> User:
+    user, _ = registered_user
+    return _create_projects(db_connection, user)
+
+
+@pytest.fixture
+def file_subscriber(file_database: sqlite3.Connection) -> User:
+    """
+    Como `subscriber`, mas em um arquivo: só assim as threads de prefetch
+    têm conexões próprias.
+    """
+    file_database.row_factory = sqlite3.Row
+    user = UserRepository(db_connection=file_database).save(
+        User(email='file.user@example.com', password='hash', salt='salt')
+    )
+    return _create_projects(file_database, user)
+
+
+def _screen(user: User) -> ProjectScreen:
+    return ProjectScreen(
+        user=user,
+        user_repository=UserRepository(),
+        project_repository=ProjectRepository(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_project_list_does_not_mount_widgets_per_project(
+    subscriber: User,
+):
+    """
+    Testa que uma página inteira de projetos vira opções de uma única
+    lista, e que os detalhes só aparecem ao expandir o card.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(_screen(subscriber))
+        await pilot.pause()
+        project_list = app.screen.query_one('#project-list', ProjectList)
+
+        # Act
+        project_list.focus()
+        await pilot.press('enter')
+        await pilot.pause()
+
+        # Assert
+        assert project_list.option_count == 100
+        assert not app.screen.query('Collapsible')
+        expanded = str(project_list.get_option_at_index(0).prompt)
+        collapsed = str(project_list.get_option_at_index(1).prompt)
+        assert 'Descrição 0' in expanded
+        assert 'Descrição 1' not in collapsed
+
+
+@pytest.mark.asyncio
+async def test_subscribe_button_acts_on_highlighted_project(
+    subscriber: User,
+):
+    """
+    Testa que o botão de inscrição inscreve o usuário no projeto destacado
+    e o adiciona à aba "Meus Projetos".
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(_screen(subscriber))
+        await pilot.pause()
+        project_list = app.screen.query_one('#project-list', ProjectList)
+        project_list.highlighted = 2
+        await pilot.pause()
+
+        # Act
+        app.screen.query_one('#subscribe-button').press()
+        await pilot.pause()
+        await app.screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Assert
+        my_projects = app.screen.query_one('#my-projects-list', ProjectList)
+        user = UserRepository().get_by_id_with_all_relations(subscriber.id)
+        assert [p.name for p in user.projects] == ['Projeto 002']
+        assert my_projects.option_count == 1
+        button = app.screen.query_one('#subscribe-button')
+        assert str(button.label) == 'Desinscrever-se'
+
+
+@pytest.mark.asyncio
+async def test_visited_pages_are_served_from_cache(subscriber: User):
+    """
+    Testa que voltar para uma página já exibida não consulta o banco.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(_screen(subscriber))
+        await app.screen.workers.wait_for_complete()
+        await pilot.pause()
+        app.screen.query_one('#next-page').press()
+        await app.screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Act
+        with QueryCounter('prev_page') as counter:
+            app.screen.query_one('#prev-page').press()
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert app.screen.current_page == 1
+        project_list = app.screen.query_one('#project-list', ProjectList)
+        assert project_list.highlighted_project.name == 'Projeto 000'
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_in_background(file_subscriber: User):
+    """
+    Testa que a página seguinte é carregada por um worker, e a troca de
+    página acontece sem queries na thread da interface.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(_screen(file_subscriber))
+        await pilot.pause()
+        await app.screen.workers.wait_for_complete()
+
+        # Act
+        with QueryCounter('next_page') as counter:
+            app.screen.query_one('#next-page').press()
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert app.screen.current_page == 2
+        project_list = app.screen.query_one('#project-list', ProjectList)
+        assert project_list.option_count == 50
+
+
+@pytest.mark.asyncio
+async def test_page_missing_from_cache_loads_in_worker(
+    file_subscriber: User, monkeypatch
+):
+    """
+    Testa que uma página fora do cache é buscada por um worker: a lista
+    fica em carregamento e a thread da interface não consulta o banco.
+    """
+    # Arrange
+    release = threading.Event()
+    fetch = ProjectScreen._fetch_page_result
+
+    def held_fetch(*args):
+        release.wait(5)
+        return fetch(*args)
+
+    monkeypatch.setattr(
+        ProjectScreen, '_fetch_page_result', staticmethod(held_fetch)
+    )
+    app = App()
+    async with app.run_test() as pilot:
+        screen = _screen(file_subscriber)
+
+        # Act
+        with QueryCounter('first_page') as counter:
+            await app.push_screen(screen)
+            project_list = screen.query_one('#project-list', ProjectList)
+            info = str(screen.query_one('#pagination-info').render())
+            loading = project_list.loading
+            release.set()
+            await screen.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert loading
+        assert info == 'Carregando...'
+        assert not project_list.loading
+        assert project_list.option_count == 100
+        assert screen.total_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_subscription_invalidates_cached_pages(subscriber: User):
+    """
+    Testa que as páginas em cache são descartadas depois de uma inscrição.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        screen = _screen(subscriber)
+        await app.push_screen(screen)
+        await pilot.pause()
+        generation = screen._page_cache.generation
+
+        # Act
+        screen.query_one('#subscribe-button').press()
+        await pilot.pause()
+        await app.screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Assert
+        assert len(screen._page_cache) == 0
+        assert screen._page_cache.generation == generation + 1
+
+
+async def _search(pilot, screen: ProjectScreen, text: str) -> None:
+    screen.query_one('#search-project').focus()
+    await pilot.press(*text)
+
+
+@pytest.mark.asyncio
+async def test_search_waits_for_typing_to_stop(subscriber: User):
+    """
+    Testa que a busca só roda depois da pausa na digitação, sem bloquear
+    a lista enquanto o usuário digita, e busca em todas as páginas.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        screen = _screen(subscriber)
+        await app.push_screen(screen)
+        await pilot.pause()
+        project_list = screen.query_one('#project-list', ProjectList)
+
+        # Act
+        await _search(pilot, screen, 'projeto 14')
+        while_typing = project_list.option_count
+        await pilot.pause(SEARCH_DEBOUNCE + 0.1)
+        await screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Assert
+        assert while_typing == 100
+        assert project_list.option_count == 10
+        assert project_list.highlighted_project.name == 'Projeto 140'
+        assert screen.total_pages == 1
+
+
+@pytest.mark.asyncio
+async def test_search_results_arrive_in_batches(file_subscriber: User):
+    """
+    Testa que os resultados de uma busca chegam em lotes, numa thread, e
+    que a página completa é guardada no cache.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        screen = _screen(file_subscriber)
+        await app.push_screen(screen)
+        await pilot.pause()
+        project_list = screen.query_one('#project-list', ProjectList)
+        sizes = []
+        add_projects = project_list.add_projects
+        project_list.add_projects = lambda projects: (
+            sizes.append(len(projects)),
+            add_projects(projects),
+        )
+
+        # Act
+        with QueryCounter('search') as counter:
+            screen._start_search('Descrição')
+            await screen.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert sizes == [SEARCH_BATCH] * 3
+        assert project_list.option_count == 100
+        assert screen.total_pages == 2
+        assert screen._page_key(1) in screen._page_cache
+
+
+@pytest.mark.asyncio
+async def test_search_reports_database_errors(subscriber: User, monkeypatch):
+    """
+    Testa que um erro do banco durante a busca não derruba o app e que a
+    paginação volta a ser exibida.
+    """
+
+    # Arrange
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError('database is locked')
+
+    app = App()
+    async with app.run_test() as pilot:
+        screen = _screen(subscriber)
+        await app.push_screen(screen)
+        await pilot.pause()
+        monkeypatch.setattr(
+            ProjectRepository, 'find_all_with_habilities_paginated', locked
+        )
+
+        # Act
+        screen._start_search('Descrição')
+        await screen.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Assert
+        info = screen.query_one('#pagination-info')
+        assert str(info.render()) == 'Página 1/2'
+        assert app.screen is screen
+
+
+def test_paginated_search_escapes_wildcards(subscriber: User):
+    """
+    Testa que '%' e '_' no termo de busca são procurados literalmente.
+    """
+    # Arrange
+    repository = ProjectRepository()
+
+    # Act
+    literal = repository.find_all_with_habilities_paginated(search='%')
+    partial = repository.find_all_with_habilities_paginated(
+        search='projeto 00'
+    )
+
+    # Assert
+    assert literal['total'] == 0
+    assert partial['total'] == 10
+
+
+@pytest.mark.asyncio
+async def test_anonymous_catalog_renders_from_snapshot(
+    subscriber: User, tmp_path: Path
+):
+    """
+    Testa que, sem usuário, a lista vem do snapshot do catálogo (só a
+    versão é consultada) e que um snapshot desatualizado é trocado.
+    """
+    # Arrange
+    catalog = CatalogRepository(path=tmp_path / 'catalog.pickle')
+    catalog.snapshot = catalog.refresh()
+    project_repo = ProjectRepository()
+    project = project_repo.get_by_id_with_habilities(1)
+    project.update(name='Aaa Novo')
+    project_repo.save(project)
+    app = App()
+    async with app.run_test() as pilot:
+        # Act
+        with QueryCounter('anonymous') as counter:
+            await app.push_screen(
+                ProjectScreen(
+                    user=None,
+                    user_repository=UserRepository(),
+                    project_repository=project_repo,
+                    catalog_repository=catalog,
+                )
+            )
+            first = app.screen.query_one('#project-list', ProjectList)
+            stale = first.highlighted_project.name
+            await app.screen.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Assert
+        assert stale == 'Projeto 000'
+        assert first.highlighted_project.name == 'Aaa Novo'
+        assert catalog.read().version == catalog.snapshot.version
+        # Nenhuma para exibir a página: a versão e, como ela mudou, a
+        # releitura do catálogo (versão, projetos, organizações, habilidades
+        # dos projetos e árvore de habilidades)
+        assert counter.total == 1 + 5
@@ -0,0 +1,211 @@
+import sqlite3
+import threading
+
+import pytest
+from textual.app import App
+from textual.widgets import Collapsible, Digits, Input, Switch
+
+from src.events import SubscriptionCreated, SubscriptionRemoved, bus
+from src.models import Hability, User
+from src.repositories import HabilityRepository, UserRepository
+from src.repositories.query_counter import QueryCounter
+from src.security.password import PasswordManager
+from src.tui.user import UserScreen
+from src.use_cases import ReplacePasswordUseCase, UpdateUserUseCase
+from src.validators import password_validator
+
+
+@pytest.fixture
+def user_screen(
+    db_connection: sqlite3.Connection, registered_user: tuple[User, str]
+) -> UserScreen:
+    """
+    Tela de perfil de um usuário com a habilidade 'Python', numa base com
+    200 habilidades em 10 domínios.
+    """
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    for i in range(200):
+        hability_repo.save(
+            Hability(f'Habilidade {i:03}', '', f'Domínio {i % 10}')
+        )
+    python = hability_repo.save(Hability('Python', '', 'Programação'))
+    hability_repo.save(Hability('Análise de Dados', '', 'Programação'))
+
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    user.add_hability(python)
+    user_repo.save(user)
+    return UserScreen(
+        user=user_repo.get_by_id_with_all_relations(user.id),
+        user_repository=user_repo,
+        hability_repository=hability_repo,
+        update_user_use_case=UpdateUserUseCase(user_repo),
+        replace_password_use_case=ReplacePasswordUseCase(
+            user_repo, PasswordManager(), password_validator
+        ),
+        habilities_data=hability_repo.get_dict_by_domain(),
+    )
+
+
+def _domain(screen: UserScreen, domain: str) -> Collapsible:
+    return next(
+        section
+        for section in screen.query('.domain-section').results(Collapsible)
+        if section.name == domain
+    )
+
+
+async def _search(pilot, screen: UserScreen, term: str) -> list[Switch]:
+    screen.query_one('#hability-search', Input).value = term
+    await pilot.pause()
+    return list(screen.query('#hability-results Switch').results(Switch))
+
+
+@pytest.mark.asyncio
+async def test_domain_switches_are_built_when_expanded(
+    user_screen: UserScreen,
+):
+    """
+    Testa que a tela abre sem consultas nem switches de habilidade e que
+    expandir um domínio monta só os switches dele.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        with QueryCounter('profile.open') as counter:
+            await app.push_screen(user_screen)
+            await pilot.pause()
+        switches_on_open = len(user_screen.query(Switch))
+        section = _domain(user_screen, 'Programação')
+
+        # Act
+        section.collapsed = False
+        await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert switches_on_open == 0
+        switches = list(section.query(Switch).results(Switch))
+        assert [s.name for s in switches] == ['Python', 'Análise de Dados']
+        assert [s.value for s in switches] == [True, False]
+        assert len(user_screen.query(Switch)) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_filters_habilities_by_word_prefix(
+    user_screen: UserScreen,
+):
+    """
+    Testa que a busca encontra habilidades pelo início de qualquer
+    palavra, sem diferenciar acentos, e que limpar a busca volta aos
+    domínios.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(user_screen)
+        await pilot.pause()
+
+        # Act
+        by_word = await _search(pilot, user_screen, 'dad')
+        by_accent = await _search(pilot, user_screen, 'ANALISE')
+        many = await _search(pilot, user_screen, 'habilidade')
+        cleared = await _search(pilot, user_screen, '')
+
+        # Assert
+        assert [s.name for s in by_word] == ['Análise de Dados']
+        assert [s.name for s in by_accent] == ['Análise de Dados']
+        assert len(many) == 30  # SEARCH_LIMIT
+        assert cleared == []
+        assert not user_screen.query_one('#hability-domains').has_class(
+            'hidden'
+        )
+
+
+@pytest.mark.asyncio
+async def test_switch_in_search_updates_user_and_domain(
+    user_screen: UserScreen,
+):
+    """
+    Testa que desligar uma habilidade na busca tira a habilidade do
+    usuário e atualiza o switch dela no domínio já montado.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(user_screen)
+        await pilot.pause()
+        section = _domain(user_screen, 'Programação')
+        section.collapsed = False
+        await pilot.pause()
+        (found,) = await _search(pilot, user_screen, 'pyt')
+
+        # Act
+        found.value = False
+        await pilot.pause()
+
+        # Assert
+        python = user_screen.hability_map['Python']
+        assert not user_screen.user.has_hability(python)
+        assert section.query(Switch).first(Switch).value is False
+
+
+@pytest.mark.asyncio
+async def test_profile_counters_follow_domain_events(
+    user_screen: UserScreen,
+):
+    """
+    Testa que os contadores acompanham os switches e as inscrições
+    publicadas no barramento (inclusive por outra thread), sem queries.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(user_screen)
+        await pilot.pause()
+        user_id = user_screen.user.id
+        (found,) = await _search(pilot, user_screen, 'anal')
+
+        # Act
+        with QueryCounter('profile.counters') as counter:
+            found.value = True
+            worker = threading.Thread(
+                target=lambda: [
+                    bus.publish(SubscriptionCreated(user_id, project_id))
+                    for project_id in (1, 2, 2)
+                ]
+            )
+            worker.start()
+            worker.join()
+            await pilot.pause()
+            bus.publish(SubscriptionRemoved(user_id, 1))
+            bus.publish(SubscriptionCreated(user_id + 1, 3))
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert user_screen.projects_count == 1
+        assert user_screen.habilities_count == 2
+        digits = user_screen.query_one('#projects-count', Digits)
+        assert digits.value == '1'
+
+
+@pytest.mark.asyncio
+async def test_profile_stops_listening_when_closed(user_screen: UserScreen):
+    """
+    Testa que a tela fechada deixa de receber eventos do barramento.
+    """
+    # Arrange
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(user_screen)
+        await pilot.pause()
+
+        # Act
+        app.pop_screen()
+        await pilot.pause()
+        bus.publish(SubscriptionCreated(user_screen.user.id, 1))
+        await pilot.pause()
+
+        # Assert
+        assert user_screen.projects_count == 0
@@ -0,0 +1,198 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+from textual import on
+from textual.app import App
+from textual.screen import Screen
+
+from src.models import Organization
+from src.repositories import (
+    LoginAttemptRepository,
+    OrganizationRepository,
+    UserRepository,
+)
+from src.repositories.query_counter import QueryCounter
+from src.security import LoginThrottle, PasswordManager
+from src.tui.workers import (
+    DataAccess,
+    DataResult,
+    bind_to_connection,
+    worker_connection,
+)
+from src.use_cases.login import LoginUseCase
+
+
+class DataScreen(Screen):
+    """Tela que guarda os resultados recebidos."""
+
+    def __init__(self):
+        super().__init__()
+        self.data = DataAccess(self)
+        self.results: list[DataResult] = []
+
+    @on(DataResult)
+    def _collect(self, message: DataResult) -> None:
+        self.results.append(message)
+
+
+def test_bind_to_connection_shares_state_but_not_repositories(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa que o caso de uso ligado a outra conexão tem repositórios novos
+    e compartilha o resto do estado (ex.: os contadores do throttle).
+    """
+    # Arrange
+    user_repo = UserRepository()
+    throttle = LoginThrottle(LoginAttemptRepository())
+    use_case = LoginUseCase(user_repo, PasswordManager(), throttle)
+    other = sqlite3.connect(':memory:')
+
+    # Act
+    bound = bind_to_connection(use_case, other)
+
+    # Assert
+    assert bound is not use_case
+    assert bound.user_repository.conn is other
+    assert bound.throttle._repo.conn is other
+    assert bound.throttle._lock is throttle._lock
+    assert bound.throttle._counts is throttle._counts
+    assert bound.password_manager is use_case.password_manager
+    assert use_case.user_repository is user_repo
+    assert bind_to_connection('texto', other) == 'texto'
+
+
+def test_bindings_are_reused_while_the_connection_is_open(
+    file_database: sqlite3.Connection,
+):
+    """
+    Testa que, dentro de um `worker_connection`, ligar o mesmo caso de uso
+    de novo reaproveita as cópias, e que elas valem só até a conexão
+    fechar.
+    """
+    # Arrange
+    use_case = LoginUseCase(
+        UserRepository(),
+        PasswordManager(),
+        LoginThrottle(LoginAttemptRepository()),
+    )
+
+    # Act
+    with worker_connection() as conn:
+        first = bind_to_connection(use_case, conn)
+        with worker_connection() as inner:
+            again = bind_to_connection(use_case, inner)
+        repository = bind_to_connection(use_case.user_repository, conn)
+    with worker_connection() as other:
+        after = bind_to_connection(use_case, other)
+
+    # Assert
+    assert again is first
+    assert repository is first.user_repository
+    assert after is not first
+    assert after.user_repository.conn is other
+
+
+@pytest.mark.asyncio
+async def test_data_access_runs_off_the_ui_thread(
+    file_database: sqlite3.Connection,
+):
+    """
+    Testa que a chamada roda em outra thread, com outra conexão, e que o
+    resultado e os erros chegam como mensagens.
+    """
+    # Arrange
+    OrganizationRepository().save(
+        Organization('ONG', 'desc', 'ong@ong.org', '123', 'ong.org')
+    )
+    threads = []
+
+    def find(repo: OrganizationRepository, org_id: int):
+        threads.append(threading.get_ident())
+        return repo.get_by_id(org_id)
+
+    app = App()
+    async with app.run_test() as pilot:
+        screen = DataScreen()
+        await app.push_screen(screen)
+
+        # Act
+        with QueryCounter('ui') as counter:
+            screen.data.run('org', OrganizationRepository(), find, 1)
+            screen.data.run('fail', None, lambda _: 1 / 0)
+            await screen.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Assert
+        assert counter.total == 0
+        assert threads != [threading.get_ident()]
+        results = {message.request: message for message in screen.results}
+        assert results['org'].result.name == 'ONG'
+        assert isinstance(results['fail'].error, ZeroDivisionError)
+
+
+@pytest.mark.asyncio
+async def test_stale_requests_are_discarded(file_database: sqlite3.Connection):
+    """
+    Testa que um pedido repetido descarta o resultado do anterior, e que
+    nada chega a uma tela que já foi fechada.
+    """
+
+    # Arrange
+    def slow(_, value: int, delay: float) -> int:
+        time.sleep(delay)
+        return value
+
+    app = App()
+    async with app.run_test() as pilot:
+        screen = DataScreen()
+        await app.push_screen(screen)
+        closed = DataScreen()
+        await app.push_screen(closed)
+
+        # Act
+        screen.data.run('page', None, slow, 1, 0.2)
+        screen.data.run('page', None, slow, 2, 0.0)
+        closed.data.run('page', None, slow, 3, 0.2)
+        app.pop_screen()
+        await pilot.pause(0.4)
+        await pilot.pause()
+
+        # Assert
+        assert [message.result for message in screen.results] == [2]
+        assert closed.results == []
+
+
+@pytest.mark.asyncio
+async def test_worker_connection_is_closed_when_the_worker_ends(
+    file_database: sqlite3.Connection,
+):
+    """
+    Testa que chamadas aninhadas no worker usam a mesma conexão e que ela
+    é fechada quando o worker termina.
+    """
+    # Arrange
+    used = []
+
+    def grab(repo: OrganizationRepository) -> None:
+        with worker_connection() as inner:
+            used.append((repo.conn, inner))
+
+    app = App()
+    async with app.run_test() as pilot:
+        screen = DataScreen()
+        await app.push_screen(screen)
+
+        # Act
+        screen.data.run('grab', OrganizationRepository(), grab)
+        await screen.workers.wait_for_complete()
+        await pilot.pause()
+
+    # Assert
+    ((conn, inner),) = used
+    assert inner is conn
+    assert conn is not file_database
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute('SELECT 1')
@@ -1,5 +1,7 @@
 import sqlite3
 
+from src.models.hability import Hability
+from src.repositories.hability import HabilityRepository
 from src.repositories.user import UserRepository
 from src.security.password import PasswordManager
 from src.use_cases.login import LoginUseCase
@@ -69,3 +71,62 @@ def test_login_with_non_existent_user(db_connection: sqlite3.Connection):
     # --- Assert ---
     assert logged_in_user is None
     assert error == 'Credenciais inválidas.'
+
+
+def test_login_rehashes_outdated_password(
+    db_connection: sqlite3.Connection, registered_user
+):
+    """
+    Testa que um login bem-sucedido regrava a senha quando o hash armazenado
+    usa parâmetros desatualizados, sem perder as relações do usuário.
+    """
+    # --- Arrange ---
+    user_repo = UserRepository(db_connection=db_connection)
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    user, password = registered_user
+    user.habilities = [
+        hability_repo.save(Hability(name='SQL', description='', domain='T'))
+    ]
+    user_repo.save(user)
+    stronger = PasswordManager(n=PasswordManager.n * 2)
+    login_uc = LoginUseCase(user_repo, stronger)
+
+    # --- Act ---
+    logged_in_user, error = login_uc.execute(user.email, password)
+
+    # --- Assert ---
+    assert error is None
+    stored = user_repo.get_by_id_with_all_relations(user.id)
+    assert stronger.needs_rehash(stored) is False
+    assert stronger.check_password(password, stored) is True
+    assert len(stored.habilities) == 1
+
+
+def test_login_succeeds_when_rehash_fails(
+    db_connection: sqlite3.Connection, registered_user, monkeypatch
+):
+    """
+    Testa que uma falha ao regravar a senha (ex.: banco travado) não
+    impede o login com a senha correta; o hash antigo é mantido.
+    """
+    # --- Arrange ---
+    user_repo = UserRepository(db_connection=db_connection)
+    user, password = registered_user
+    old_hash = user_repo.get_by_id(user.id).password
+
+    def locked(*args):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(user_repo, 'update_password', locked)
+    login_uc = LoginUseCase(
+        user_repo, PasswordManager(n=PasswordManager.n * 2)
+    )
+
+    # --- Act ---
+    logged_in_user, error = login_uc.execute(user.email, password)
+
+    # --- Assert ---
+    assert error is None
+    assert logged_in_user.id == user.id
+    assert logged_in_user.password == old_hash
+    assert user_repo.get_by_id(user.id).password == old_hash
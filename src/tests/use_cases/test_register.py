@@ -3,6 +3,7 @@ import sqlite3
 
 import pytest
 
+from src.models import Role
 from src.repositories.user import UserRepository
 from src.security.password import PasswordManager
 from src.use_cases.register import RegisterUserUseCase
@@ -115,3 +116,126 @@ def test_register_user_with_invalid_password(
     assert isinstance(error, ValueError)
     # A mensagem de erro exata pode variar dependendo da sua implementação do validador
     assert 'Senha deve ter no mínimo 8 caracteres.' == str(error)
+
+
+@pytest.mark.asyncio
+async def test_register_async_new_user_successfully(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa a versão assíncrona do registro, que gera o hash fora do event loop.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    password_manager = PasswordManager()
+    use_case = RegisterUserUseCase(
+        user_repo, password_manager, email_validator, password_validator
+    )
+
+    # Act
+    user, error = await use_case.execute_async(
+        'async@example.com', 'ValidPassword123*'
+    )
+
+    # Assert
+    assert error is None
+    assert user_repo.exists('async@example.com') is True
+    assert password_manager.check_password('ValidPassword123*', user) is True
+
+
+def test_register_many_creates_valid_rows_and_reports_errors(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa o registro em lote: linhas válidas são criadas e cada linha
+    inválida, duplicada ou já cadastrada aparece no relatório de erros.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    password_manager = PasswordManager(n=1024)
+    use_case = RegisterUserUseCase(
+        user_repo, password_manager, email_validator, password_validator
+    )
+    use_case.execute('existing@example.com', 'ValidPassword123*')
+    records = [
+        {'email': f'user{i}@example.com', 'password': f'ValidPassword{i}*'}
+        for i in range(4)
+    ]
+    records[1]['first_name'] = 'Ana'
+    records[1]['role'] = 'ADMIN'
+    records += [
+        {'email': 'not-an-email', 'password': 'ValidPassword123*'},
+        {'email': 'user0@example.com', 'password': 'ValidPassword123*'},
+        {'email': 'existing@example.com', 'password': 'ValidPassword123*'},
+        {'email': 'weak@example.com', 'password': '123'},
+    ]
+
+    # Act
+    users, errors = use_case.execute_many(
+        records, max_workers=2, allow_roles=True
+    )
+
+    # Assert
+    assert [u.email for u in users] == [
+        f'user{i}@example.com' for i in range(4)
+    ]
+    assert all(u.id is not None for u in users)
+    assert [(e['row'], str(e['error'])) for e in errors] == [
+        (4, 'E-mail deve conter "@".'),
+        (5, 'E-mail duplicado no lote'),
+        (6, 'Usuário já existe'),
+        (7, 'Senha deve ter no mínimo 8 caracteres.'),
+    ]
+
+    saved = user_repo.get_by_email('user1@example.com')
+    assert saved.first_name == 'Ana'
+    assert saved.role == 'ADMIN'
+    assert password_manager.check_password('ValidPassword1*', saved) is True
+    assert user_repo.count() == 5
+
+
+def test_register_many_with_no_valid_rows(db_connection: sqlite3.Connection):
+    """
+    Testa que um lote sem linhas válidas não cria usuários.
+    """
+    user_repo = UserRepository(db_connection=db_connection)
+    use_case = RegisterUserUseCase(
+        user_repo, PasswordManager(), email_validator, password_validator
+    )
+
+    users, errors = use_case.execute_many([{'email': None, 'password': None}])
+
+    assert users == []
+    assert len(errors) == 1
+    assert user_repo.count() == 0
+
+
+def test_register_many_rejects_roles_by_default(
+    db_connection: sqlite3.Connection,
+):
+    """
+    Testa que, sem `allow_roles=True`, uma linha pedindo o papel de
+    administrador é rejeitada e as demais são criadas como `Role.USER`.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    use_case = RegisterUserUseCase(
+        user_repo, PasswordManager(n=1024), email_validator, password_validator
+    )
+    records = [
+        {'email': 'admin@example.com', 'password': 'ValidPassword1*'},
+        {'email': 'user@example.com', 'password': 'ValidPassword2*'},
+    ]
+    records[0]['role'] = Role.ADMIN
+    records[1]['role'] = Role.USER
+
+    # Act
+    users, errors = use_case.execute_many(records)
+
+    # Assert
+    assert [u.email for u in users] == ['user@example.com']
+    assert [(e['row'], str(e['error'])) for e in errors] == [
+        (0, 'Papel não permitido no registro')
+    ]
+    assert user_repo.get_by_email('user@example.com').role == Role.USER
+    assert user_repo.exists('admin@example.com') is False
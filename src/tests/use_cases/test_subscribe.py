@@ -0,0 +1,173 @@
+import sqlite3
+
+import pytest
+
+from src.events import EventBus, SubscriptionCreated, SubscriptionRemoved
+from src.models import Hability, Organization, Project, User
+from src.repositories import (
+    HabilityRepository,
+    OrganizationRepository,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.query_counter import QueryCounter
+from src.use_cases.subscribe import (
+    NO_SHARED_HABILITY,
+    SubscribeToProjectUseCase,
+)
+
+
+@pytest.fixture
+def project(db_connection: sqlite3.Connection) -> Project:
+    """Projeto que pede a habilidade 'Python'."""
+    hability = HabilityRepository(db_connection=db_connection).save(
+        Hability(name='Python', description='', domain='TI')
+    )
+    org = OrganizationRepository(db_connection=db_connection).save(
+        Organization('ONG', 'desc', 'ong@ong.org', '123', 'ong.org')
+    )
+    return ProjectRepository(db_connection=db_connection).save(
+        Project('Projeto', 'desc', org, [hability])
+    )
+
+
+def test_subscribe_is_a_single_write_when_habilities_overlap(
+    db_connection: sqlite3.Connection,
+    registered_user: tuple[User, str],
+    project: Project,
+):
+    """
+    Testa que a inscrição, com habilidade em comum, custa uma única query
+    e não reescreve as outras relações do usuário.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    user.habilities = project.habilities
+    user_repo.save(user)
+    use_case = SubscribeToProjectUseCase(user_repo)
+
+    # Act
+    with QueryCounter('subscribe') as counter:
+        ok, err = use_case.execute(user.id, project.id)
+
+    # Assert
+    assert (ok, err) == (True, None)
+    assert counter.total == 1
+    saved = user_repo.get_by_id_with_all_relations(user.id)
+    assert [p.id for p in saved.projects] == [project.id]
+    assert [h.name for h in saved.habilities] == ['Python']
+
+
+def test_subscribe_is_denied_without_a_shared_hability(
+    db_connection: sqlite3.Connection,
+    registered_user: tuple[User, str],
+    project: Project,
+):
+    """
+    Testa que o backend recusa a inscrição de quem não tem nenhuma das
+    habilidades pedidas pelo projeto.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    use_case = SubscribeToProjectUseCase(user_repo)
+
+    # Act
+    ok, err = use_case.execute(user.id, project.id)
+
+    # Assert
+    assert (ok, err) == (False, NO_SHARED_HABILITY)
+    assert not user_repo.is_subscribed(user.id, project.id)
+
+
+def test_subscribe_and_cancel_are_idempotent(
+    db_connection: sqlite3.Connection,
+    registered_user: tuple[User, str],
+    project: Project,
+):
+    """
+    Testa que repetir a inscrição ou o cancelamento não gera erro.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    user.habilities = project.habilities
+    user_repo.save(user)
+    use_case = SubscribeToProjectUseCase(user_repo)
+    use_case.execute(user.id, project.id)
+
+    # Act
+    again = use_case.execute(user.id, project.id)
+    use_case.cancel(user.id, project.id)
+    cancel_again = use_case.cancel(user.id, project.id)
+
+    # Assert
+    assert again == (True, None)
+    assert cancel_again == (True, None)
+    assert not user_repo.is_subscribed(user.id, project.id)
+
+
+def test_subscription_changes_are_published_once(
+    db_connection: sqlite3.Connection,
+    registered_user: tuple[User, str],
+    project: Project,
+):
+    """
+    Testa que só as inscrições de fato criadas ou removidas são
+    publicadas no barramento de eventos.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    user.habilities = project.habilities
+    user_repo.save(user)
+    events = EventBus()
+    published = []
+    events.subscribe(SubscriptionCreated, published.append)
+    events.subscribe(SubscriptionRemoved, published.append)
+    use_case = SubscribeToProjectUseCase(user_repo, events)
+
+    # Act
+    for _ in range(2):
+        use_case.execute(user.id, project.id)
+    for _ in range(2):
+        use_case.cancel(user.id, project.id)
+
+    # Assert
+    assert published == [
+        SubscriptionCreated(user.id, project.id),
+        SubscriptionRemoved(user.id, project.id),
+    ]
+
+
+@pytest.mark.parametrize('event', ['INSERT', 'DELETE'])
+def test_failed_write_leaves_no_open_transaction(
+    db_connection: sqlite3.Connection,
+    registered_user: tuple[User, str],
+    project: Project,
+    event: str,
+):
+    """
+    Testa que uma inscrição (ou remoção) que falha desfaz a transação, em
+    vez de deixá-la aberta para o próximo commit da conexão.
+    """
+    # Arrange
+    user_repo = UserRepository(db_connection=db_connection)
+    user, _ = registered_user
+    user.habilities = project.habilities
+    user_repo.save(user)
+    if event == 'DELETE':
+        user_repo.subscribe(user.id, project.id)
+    db_connection.execute(
+        f'CREATE TRIGGER fail BEFORE {event} ON User_Projects '
+        "BEGIN SELECT RAISE(ABORT, 'falha'); END"
+    )
+    write = user_repo.subscribe if event == 'INSERT' else user_repo.unsubscribe
+
+    # Act
+    with pytest.raises(sqlite3.IntegrityError):
+        write(user.id, project.id)
+
+    # Assert
+    assert db_connection.in_transaction is False
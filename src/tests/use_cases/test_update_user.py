@@ -1,6 +1,7 @@
 import sqlite3
 from unittest.mock import patch
 
+from src.events import EventBus, HabilityAdded, HabilityRemoved
 from src.models.hability import Hability
 from src.repositories.hability import HabilityRepository
 from src.repositories.user import UserRepository
@@ -99,6 +100,43 @@ def test_update_user_habilities_list(
     assert {h.id for h in habilities_after} == {h3_new.id, h4_new.id}
 
 
+def test_update_user_publishes_hability_changes(
+    db_connection: sqlite3.Connection, registered_user
+):
+    """
+    Testa que a atualização publica só as habilidades adicionadas e
+    removidas, e nada quando elas não mudam.
+    """
+    # --- Arrange ---
+    user_repo = UserRepository(db_connection=db_connection)
+    hability_repo = HabilityRepository(db_connection=db_connection)
+    events = EventBus()
+    published = []
+    events.subscribe(HabilityAdded, published.append)
+    events.subscribe(HabilityRemoved, published.append)
+    use_case = UpdateUserUseCase(user_repo, events)
+
+    user, _ = registered_user
+    python, sql = [
+        hability_repo.save(Hability(name=name, description='', domain='TI'))
+        for name in ('Python', 'SQL')
+    ]
+    user.habilities = [python]
+    user_repo.save(user)
+
+    # --- Act ---
+    use_case.execute(id=user.id, habilities=[sql])
+    changes = list(published)
+    use_case.execute(id=user.id, first_name='Ana')
+
+    # --- Assert ---
+    assert changes == [
+        HabilityAdded(user.id, sql.id),
+        HabilityRemoved(user.id, python.id),
+    ]
+    assert published == changes
+
+
 def test_update_non_existent_user(db_connection: sqlite3.Connection):
     """
     Testa que o caso de uso não faz nada e retorna None se o usuário não existir.
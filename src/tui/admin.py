@@ -1,4 +1,6 @@
-from textual import on
+from typing import Optional
+
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.screen import Screen
@@ -8,15 +10,15 @@ from textual.widgets import (
     Header,
     Input,
     Label,
-    RadioButton,
-    RadioSet,
     Select,
     SelectionList,
     Static,
     TabbedContent,
     TabPane,
 )
+from textual.widgets.selection_list import Selection
 
+from src.container import ServiceContainer
 from src.models import Hability, Organization, Project, Role, User
 from src.repositories import (
     HabilityRepository,
@@ -24,12 +26,62 @@ from src.repositories import (
     ProjectRepository,
     UserRepository,
 )
+from src.repositories.query_counter import QueryCounter
+from src.tui.widgets import EntityBrowser
+from src.tui.workers import DataAccess, DataResult, query_in_worker
 from src.use_cases import (
     UpdateProjectUseCase,
 )
 from src.use_cases.register import RegisterUserUseCase
 from src.use_cases.update_user import UpdateUserUseCase
 
+# Widgets alimentados por cada grupo de dados: uma única busca preenche
+# todos eles
+DATA_GROUPS = {
+    'org': ('#proj-org-select', '#proj-edit-org-select'),
+    'hab': ('#proj-hab-list', '#proj-edit-hab-list'),
+}
+# Grupos de dados de cada aba; abas ausentes não precisam de nenhum
+TAB_GROUPS = {
+    'proj-create-tab': ('org', 'hab'),
+    'proj-edit-tab': ('org', 'hab'),
+}
+# Escritas feitas pela tela, com a ação usada nas mensagens de erro
+WRITE_ACTIONS = {
+    'save-org': 'salvar organização',
+    'update-org': 'atualizar organização',
+    'delete-org': 'deletar organização',
+    'save-proj': 'salvar projeto',
+    'update-proj': 'atualizar projeto',
+    'delete-proj': 'deletar projeto',
+    'save-user': 'salvar usuário',
+    'update-user': 'atualizar usuário',
+    'delete-user': 'deletar usuário',
+}
+# Tabelas de cada entidade e as colunas exibidas nelas
+ENTITY_BROWSERS = {
+    'org': ('#org-edit-list', '#org-delete-list'),
+    'proj': ('#proj-edit-list', '#proj-delete-list'),
+    'user': ('#user-edit-list', '#user-delete-list'),
+}
+BROWSER_COLUMNS = {
+    'org': [('Nome', lambda o: o.name), ('E-mail', lambda o: o.contact_email)],
+    'proj': [
+        ('Nome', lambda p: p.name),
+        (
+            'Organização',
+            lambda p: p.organization.name
+            if p.organization
+            else p.organization_id,
+        ),
+    ],
+    'user': [
+        ('Nome', lambda u: f'{u.first_name or ""} {u.last_name or ""}'),
+        ('E-mail', lambda u: u.email),
+        ('Role', lambda u: u.role),
+    ],
+}
+
 
 class AdminScreen(Screen):
     """Tela administrativa para criação de entidades."""
@@ -46,55 +98,59 @@ class AdminScreen(Screen):
         update_project_use_case: UpdateProjectUseCase = None,
         register_user_use_case: RegisterUserUseCase = None,
         update_user_uc: UpdateUserUseCase = None,
+        services: Optional[ServiceContainer] = None,
     ):
         self._user_logged = user_logged
-        self._org_repo = (
-            organization_repo
-            if organization_repo
-            else OrganizationRepository()
-        )
-        self._proj_repo = project_repo if project_repo else ProjectRepository()
-        self._hab_repo = (
-            hability_repo if hability_repo else HabilityRepository()
-        )
-        self._user_repo = user_repo if user_repo else UserRepository()
+        # O que não for passado vem do contêiner, compartilhado com o app
+        services = services or ServiceContainer()
+        self._org_repo = organization_repo or services.organization_repository
+        self._proj_repo = project_repo or services.project_repository
+        self._hab_repo = hability_repo or services.hability_repository
+        self._user_repo = user_repo or services.user_repository
         self._update_proj_uc = (
-            update_project_use_case
-            if update_project_use_case
-            else UpdateProjectUseCase.factory()
+            update_project_use_case or services.update_project_use_case
         )
         self._register_user_uc = (
-            register_user_use_case
-            if register_user_use_case
-            else RegisterUserUseCase.factory()
-        )
-        self._update_user_uc = (
-            update_user_uc if update_user_uc else UpdateUserUseCase.factory()
+            register_user_use_case or services.register_user_use_case
         )
+        self._update_user_uc = update_user_uc or services.update_user_use_case
+        # Grupos de dados já exibidos e em carregamento. A geração de um
+        # grupo avança quando ele é alterado durante o carregamento, para
+        # que o resultado antigo seja descartado.
+        self._loaded: set[str] = set()
+        self._loading: set[str] = set()
+        # Opções de cada grupo (id -> rótulo), compartilhadas pelos widgets
+        self._options: dict[str, dict[int, str]] = {}
+        self._generations: dict[str, int] = dict.fromkeys(DATA_GROUPS, 0)
+        self._sources = {
+            'org': (self._org_repo, self._org_options),
+            'hab': (self._hab_repo, self._hab_options),
+        }
+        self._entity_repos = {
+            'org': self._org_repo,
+            'proj': self._proj_repo,
+            'user': self._user_repo,
+        }
         super().__init__()
+        self._data = DataAccess(self)
 
-    def _get_org_options(self) -> list[tuple[str, int]]:
+    @staticmethod
+    def _org_options(repo: OrganizationRepository) -> list[tuple[str, int]]:
         """Busca organizações e as formata para widgets de seleção."""
-        return [(org.name, org.id) for org in self._org_repo.find_all()]
+        return [(org.name, org.id) for org in repo.find_all()]
 
-    def _get_hab_options(self) -> list[tuple[str, int]]:
+    @staticmethod
+    def _hab_options(repo: HabilityRepository) -> list[tuple[str, int]]:
         """Busca habilidades e as formata para widgets de seleção."""
-        return [(hab.name, hab.id) for hab in self._hab_repo.find_all()]
-
-    def _get_proj_options(self) -> list[tuple[str, int]]:
-        """Busca projetos e os formata para widgets de seleção."""
-        return [(proj.name, proj.id) for proj in self._proj_repo.find_all()]
-
-    def _get_user_options(self) -> list[tuple[str, int]]:
-        """Busca usuários e os formata para widgets de seleção."""
-        users = self._user_repo.find_all()
-        return [
-            (
-                f'{user.first_name or ""} {user.last_name or ""} ({user.email})',
-                user.id,
-            )
-            for user in users
-        ]
+        return [(hab.name, hab.id) for hab in repo.find_all()]
+
+    def _browser(self, entity: str, browser_id: str) -> EntityBrowser:
+        return EntityBrowser(
+            self._entity_repos[entity],
+            BROWSER_COLUMNS[entity],
+            id=browser_id,
+            classes='entity-browser',
+        )
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -144,11 +200,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Listar/Editar', id='org-edit-tab', classes='mt1'
                         ):
-                            with RadioSet(id='org-edit-list', classes='mx4'):
-                                for name, org_id in self._get_org_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = org_id
-                                    yield rb
+                            yield self._browser('org', 'org-edit-list')
 
                             with Container(
                                 id='org-edit-form',
@@ -200,11 +252,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Deletar', id='org-delete-tab', classes='mt1'
                         ):
-                            with RadioSet(id='org-delete-list', classes='mx4'):
-                                for name, org_id in self._get_org_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = org_id
-                                    yield rb
+                            yield self._browser('org', 'org-delete-list')
                             with Container(classes='full-width h3 center mt1'):
                                 yield Button(
                                     'Deletar Selecionada',
@@ -228,7 +276,7 @@ class AdminScreen(Screen):
                                 id='proj-description',
                             )
                             yield Select(
-                                self._get_org_options(),
+                                [],
                                 classes='input-margin-sm',
                                 prompt='Selecione a Organização',
                                 id='proj-org-select',
@@ -238,7 +286,6 @@ class AdminScreen(Screen):
                                 classes='text mt1',
                             )
                             yield SelectionList[int](
-                                *self._get_hab_options(),
                                 id='proj-hab-list',
                                 classes='input-margin-sm',
                             )
@@ -253,11 +300,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Listar/Editar', id='proj-edit-tab', classes='mt1'
                         ):
-                            with RadioSet(id='proj-edit-list', classes='mx4'):
-                                for name, proj_id in self._get_proj_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = proj_id
-                                    yield rb
+                            yield self._browser('proj', 'proj-edit-list')
 
                             with Container(
                                 id='proj-edit-form',
@@ -281,7 +324,7 @@ class AdminScreen(Screen):
                                     classes='input-margin-sm',
                                 )
                                 yield Select(
-                                    self._get_org_options(),
+                                    [],
                                     prompt='Selecione a Organização',
                                     id='proj-edit-org-select',
                                     classes='input-margin-sm',
@@ -291,7 +334,6 @@ class AdminScreen(Screen):
                                     classes='text mt1',
                                 )
                                 yield SelectionList[int](
-                                    *self._get_hab_options(),
                                     id='proj-edit-hab-list',
                                     classes='input-margin-sm',
                                 )
@@ -308,13 +350,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Deletar', id='proj-delete-tab', classes='mt1'
                         ):
-                            with RadioSet(
-                                id='proj-delete-list', classes='mx4'
-                            ):
-                                for name, proj_id in self._get_proj_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = proj_id
-                                    yield rb
+                            yield self._browser('proj', 'proj-delete-list')
 
                             with Container(classes='full-width h3 center mt1'):
                                 yield Button(
@@ -356,11 +392,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Listar/Editar', id='user-edit-tab', classes='mt1'
                         ):
-                            with RadioSet(id='user-edit-list', classes='mx4'):
-                                for name, user_id in self._get_user_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = user_id
-                                    yield rb
+                            yield self._browser('user', 'user-edit-list')
 
                             with Container(
                                 id='user-edit-form',
@@ -409,13 +441,7 @@ class AdminScreen(Screen):
                         with TabPane(
                             'Deletar', id='user-delete-tab', classes='mt1'
                         ):
-                            with RadioSet(
-                                id='user-delete-list', classes='mx4'
-                            ):
-                                for name, user_id in self._get_user_options():
-                                    rb = RadioButton(name)
-                                    rb.db_id = user_id
-                                    yield rb
+                            yield self._browser('user', 'user-delete-list')
                             with Container(classes='full-width h3 center mt1'):
                                 yield Button(
                                     'Deletar Selecionado',
@@ -425,400 +451,500 @@ class AdminScreen(Screen):
 
         yield Footer()
 
-    def _repopulate_org_radio_sets(self, clear_selection: bool = True):
-        """Atualiza os RadioSets de organização."""
-        new_options = self._get_org_options()
-        for list_id in ['#org-edit-list', '#org-delete-list']:
-            radio_set = self.query_one(list_id, RadioSet)
-            radio_set.blur()  # Remove o foco para evitar problemas de estado
-            if clear_selection:
-                ...
-                # radio_set.pressed_button = None
-            radio_set.remove_children()
-            for name, org_id in new_options:
-                rb = RadioButton(name)
-                rb.db_id = org_id
-                radio_set.mount(rb)
-
-    def _repopulate_org_selects(self):
-        """Atualiza os Selects de organização nos formulários de projeto."""
-        new_options = self._get_org_options()
-        proj_org_select = self.query_one('#proj-org-select', Select)
-        proj_org_select.set_options(new_options)
-        proj_edit_org_select = self.query_one('#proj-edit-org-select', Select)
-        proj_edit_org_select.set_options(new_options)
-
-    def _clear_and_repopulate_org_lists(self, clear_selection: bool = True):
-        """Atualiza todas as listas de organizações na tela."""
-        self._repopulate_org_radio_sets(clear_selection)
-        self._repopulate_org_selects()
-
-    def _clear_and_repopulate_proj_lists(self):
-        """Atualiza todas as listas de projetos na tela."""
-        new_options = self._get_proj_options()
-
-        # Atualiza lista de edição
-        edit_list = self.query_one('#proj-edit-list', RadioSet)
-        edit_list.remove_children()
-        for name, proj_id in new_options:
-            rb = RadioButton(name)
-            rb.db_id = proj_id
-            edit_list.mount(rb)
-
-        # Atualiza lista de deleção
-        delete_list = self.query_one('#proj-delete-list', RadioSet)
-        delete_list.remove_children()
-        for name, proj_id in new_options:
-            rb = RadioButton(name)
-            rb.db_id = proj_id
-            delete_list.mount(rb)
-
-    def _clear_and_repopulate_user_lists(self):
-        """Atualiza todas as listas de usuários na tela."""
-        new_options = self._get_user_options()
-
-        # Atualiza lista de edição
-        edit_list = self.query_one('#user-edit-list', RadioSet)
-        edit_list.remove_children()
-        for name, user_id in new_options:
-            rb = RadioButton(name)
-            rb.db_id = user_id
-            edit_list.mount(rb)
-
-        # Atualiza lista de deleção
-        delete_list = self.query_one('#user-delete-list', RadioSet)
-        delete_list.remove_children()
-        for name, user_id in new_options:
-            rb = RadioButton(name)
-            rb.db_id = user_id
-            delete_list.mount(rb)
-
-    @on(RadioSet.Changed, '#org-edit-list')
-    def on_org_selection_changed(self, event: RadioSet.Changed):
-        """Preenche o formulário de edição quando uma organização é selecionada."""
-        edit_form = self.query_one('#org-edit-form')
-        # O evento Changed é emitido duas vezes: ao desmarcar o antigo e marcar o novo.
-        # Ignoramos o evento de "desmarcar" onde `event.pressed` é None.
-        if event.pressed:
-            org_id = getattr(event.pressed, 'db_id', None)
-            if org_id is not None:
-                org = self._org_repo.get_by_id(org_id)
-
-                if org:
-                    self.query_one('#org-edit-id-label', Label).update(
-                        f'[b]ID:[/b] {org.id}'
-                    )
-                    self.query_one('#org-edit-name', Input).value = org.name
-                    self.query_one(
-                        '#org-edit-description', Input
-                    ).value = org.description
-                    self.query_one(
-                        '#org-edit-email', Input
-                    ).value = org.contact_email
-                    self.query_one(
-                        '#org-edit-phone', Input
-                    ).value = org.contact_phone
-                    self.query_one(
-                        '#org-edit-website', Input
-                    ).value = org.website
-                    # Habilita todos os inputs no formulário de edição
-                    for input_widget in edit_form.query(Input):
-                        input_widget.disabled = False
-
-                    edit_form.query_one(Button).disabled = False
-                    edit_form.remove_class('hidden')
+    def on_mount(self) -> None:
+        self._load_visible_tab()
+
+    @on(TabbedContent.TabActivated)
+    def _load_visible_tab(self) -> None:
+        """Carrega, na primeira vez que aparecem, os dados da aba aberta."""
+        main_tabs = self.query_one('#main-tabs', TabbedContent)
+        crud_tabs = main_tabs.get_pane(main_tabs.active).query_one(
+            TabbedContent
+        )
+        for group in TAB_GROUPS.get(crud_tabs.active, ()):
+            if group not in self._loaded and group not in self._loading:
+                self._start_loading(group)
+        for browser in crud_tabs.get_pane(crud_tabs.active).query(
+            EntityBrowser
+        ):
+            browser.load()
+
+    def _start_loading(self, group: str) -> None:
+        self._loading.add(group)
+        for selector in DATA_GROUPS[group]:
+            self.query_one(selector).loading = True
+        self._load_group(group, self._generations[group])
+
+    @work(thread=True, group='admin-data')
+    def _load_group(self, group: str, generation: int) -> None:
+        """Busca as opções de um grupo fora da thread da interface."""
+        repository, query = self._sources[group]
+        options = query_in_worker(self.app, repository, query)
+        self.app.call_from_thread(
+            self._group_loaded, group, generation, options
+        )
+
+    def _group_loaded(
+        self, group: str, generation: int, options: list[tuple[str, int]]
+    ) -> None:
+        if generation != self._generations[group]:
+            # O grupo foi alterado durante a busca: busca de novo
+            self._load_group(group, self._generations[group])
+            return
+        self._loading.discard(group)
+        self._loaded.add(group)
+        self._fill_group(group, options)
+
+    def _fill_group(self, group: str, options: list[tuple[str, int]]):
+        self._options[group] = {db_id: label for label, db_id in options}
+        self._render_group(group)
+
+    def _render_group(self, group: str) -> None:
+        """
+        Preenche todos os widgets do grupo com as mesmas opções, mantendo
+        o que estava escolhido se a opção continuar existindo.
+        """
+        ids = self._options[group]
+        for selector in DATA_GROUPS[group]:
+            widget = self.query_one(selector)
+            if isinstance(widget, Select):
+                self._render_select(widget, ids)
+            else:
+                selected = set(widget.selected)
+                widget.clear_options()
+                widget.add_options(
+                    [
+                        Selection(label, db_id, db_id in selected, str(db_id))
+                        for db_id, label in ids.items()
+                    ]
+                )
+            widget.loading = False
+
+    @staticmethod
+    def _render_select(select: Select, ids: dict[int, str]) -> None:
+        value = select.value
+        select.set_options([(label, db_id) for db_id, label in ids.items()])
+        if value in ids:
+            select.value = value
+
+    def _patch_option(
+        self, group: str, db_id: int, label: Optional[str] = None
+    ) -> None:
+        """
+        Insere, renomeia (`label`) ou remove (sem `label`) uma opção do
+        grupo, sem consultar o banco. As `SelectionList`s mudam só a opção
+        afetada; o `Select` não tem como, e é remontado. Grupos ainda não
+        exibidos ficam para quando a aba for aberta; um grupo em
+        carregamento é buscado de novo.
+        """
+        if group in self._loading:
+            self._generations[group] += 1
+        if group not in self._loaded:
+            return
+        ids = self._options[group]
+        existed = db_id in ids
+        if label is None:
+            ids.pop(db_id, None)
         else:
-            # Esconde o formulário e desabilita os inputs se nada for selecionado
+            ids[db_id] = label
+
+        for selector in DATA_GROUPS[group]:
+            widget = self.query_one(selector)
+            if isinstance(widget, Select):
+                self._render_select(widget, ids)
+            elif label is None:
+                if existed:
+                    widget.remove_option(str(db_id))
+            elif existed:
+                widget.replace_option_prompt(str(db_id), label)
+            else:
+                widget.add_option(Selection(label, db_id, id=str(db_id)))
+
+    def _entity_saved(self, entity: str, model) -> None:
+        """Reflete um registro criado ou alterado nas listas da tela."""
+        for selector in ENTITY_BROWSERS[entity]:
+            self.query_one(selector, EntityBrowser).upsert(model)
+        if entity in DATA_GROUPS:
+            self._patch_option(entity, model.id, model.name)
+
+    def _entity_deleted(self, entity: str, db_id: int) -> None:
+        """Tira um registro removido das listas da tela."""
+        for selector in ENTITY_BROWSERS[entity]:
+            self.query_one(selector, EntityBrowser).remove(db_id)
+        if entity in DATA_GROUPS:
+            self._patch_option(entity, db_id)
+
+    @on(EntityBrowser.Selected, '#org-edit-list')
+    def on_org_selection_changed(self, event: EntityBrowser.Selected):
+        self._data.run(
+            'select-org',
+            self._org_repo,
+            OrganizationRepository.get_by_id,
+            event.entity_id,
+        )
+
+    @on(EntityBrowser.Selected, '#proj-edit-list')
+    def on_proj_selection_changed(self, event: EntityBrowser.Selected):
+        # Limpa a seleção de habilidades anterior antes de preencher
+        self.query_one('#proj-edit-hab-list', SelectionList).deselect_all()
+        self._data.run(
+            'select-proj',
+            self._proj_repo,
+            self._fetch_project,
+            event.entity_id,
+        )
+
+    @staticmethod
+    @QueryCounter('AdminScreen.fetch_project', 3, max_repeats=1)
+    def _fetch_project(repo: ProjectRepository, proj_id: int):
+        """Busca o projeto com suas habilidades associadas."""
+        return repo.get_by_id_with_habilities(proj_id)
+
+    @on(EntityBrowser.Selected, '#user-edit-list')
+    def on_user_selection_changed(self, event: EntityBrowser.Selected):
+        self._data.run(
+            'select-user',
+            self._user_repo,
+            UserRepository.get_by_id,
+            event.entity_id,
+        )
+
+    def _show_org(self, org: Optional[Organization]) -> None:
+        """Preenche o formulário de edição com a organização escolhida."""
+        edit_form = self.query_one('#org-edit-form')
+        if not org:
+            # Registro removido: esconde o formulário e desabilita os inputs
             for input_widget in edit_form.query(Input):
                 input_widget.disabled = True
             edit_form.add_class('hidden')
+            return
 
-    @on(RadioSet.Changed, '#proj-edit-list')
-    def on_proj_selection_changed(self, event: RadioSet.Changed):
-        """Preenche o formulário de edição quando um projeto é selecionado."""
-        edit_form = self.query_one('#proj-edit-form')
-
-        # Ignoramos o evento de "desmarcar" onde `event.pressed` é None.
-        if event.pressed:
-            # Limpa a seleção de habilidades anterior antes de preencher
-            self.query_one('#proj-edit-hab-list', SelectionList).deselect_all()
-            proj_id = getattr(event.pressed, 'db_id', None)
-            if proj_id is not None:
-                # Usamos find_all_with_habilities para garantir que as habilidades venham juntas
-                all_projects = self._proj_repo.find_all_with_habilities()
-                proj = next((p for p in all_projects if p.id == proj_id), None)
-            if proj_id is not None:
-                # Busca o projeto com suas habilidades associadas
-                proj = self._proj_repo.get_by_id_with_habilities(proj_id)
-
-                if proj:
-                    self.query_one('#proj-edit-id-label', Label).update(
-                        f'[b]ID:[/b] {proj.id}'
-                    )
-                    self.query_one('#proj-edit-name', Input).value = proj.name
-                    self.query_one(
-                        '#proj-edit-description', Input
-                    ).value = proj.description
-                    self.query_one(
-                        '#proj-edit-org-select', Select
-                    ).value = proj.organization_id
-
-                    hab_list = self.query_one(
-                        '#proj-edit-hab-list', SelectionList
-                    )
-                    hab_list.deselect_all()
-                    for hability in proj.habilities:
-                        hab_list.select(hability.id)
-                    edit_form.remove_class('hidden')
-
-    @on(RadioSet.Changed, '#user-edit-list')
-    def on_user_selection_changed(self, event: RadioSet.Changed):
-        """Preenche o formulário de edição quando um usuário é selecionado."""
-        edit_form = self.query_one('#user-edit-form')
-
-        # Ignoramos o evento de "desmarcar" onde `event.pressed` é None.
-        if event.pressed:
-            user_id = getattr(event.pressed, 'db_id', None)
-            if user_id is not None:
-                user = self._user_repo.get_by_id(user_id)
-
-                if user:
-                    self.query_one('#user-edit-id-label', Label).update(
-                        f'[b]ID:[/b] {user.id}'
-                    )
-                    self.query_one('#user-edit-firstname', Input).value = (
-                        user.first_name or ''
-                    )
-                    self.query_one('#user-edit-lastname', Input).value = (
-                        user.last_name or ''
-                    )
-                    self.query_one(
-                        '#user-edit-email', Input
-                    ).value = user.email
-                    self.query_one(
-                        '#user-edit-role-select', Select
-                    ).value = user.role
-                    edit_form.remove_class('hidden')
+        self.query_one('#org-edit-id-label', Label).update(
+            f'[b]ID:[/b] {org.id}'
+        )
+        self.query_one('#org-edit-name', Input).value = org.name
+        self.query_one('#org-edit-description', Input).value = org.description
+        self.query_one('#org-edit-email', Input).value = org.contact_email
+        self.query_one('#org-edit-phone', Input).value = org.contact_phone
+        self.query_one('#org-edit-website', Input).value = org.website
+        # Habilita todos os inputs no formulário de edição
+        for input_widget in edit_form.query(Input):
+            input_widget.disabled = False
+
+        edit_form.query_one(Button).disabled = False
+        edit_form.remove_class('hidden')
+
+    def _show_proj(self, proj: Optional[Project]) -> None:
+        """Preenche o formulário de edição com o projeto selecionado."""
+        if not proj:
+            return
+
+        hab_list = self.query_one('#proj-edit-hab-list', SelectionList)
+        self.query_one('#proj-edit-id-label', Label).update(
+            f'[b]ID:[/b] {proj.id}'
+        )
+        self.query_one('#proj-edit-name', Input).value = proj.name
+        self.query_one(
+            '#proj-edit-description', Input
+        ).value = proj.description
+        self.query_one(
+            '#proj-edit-org-select', Select
+        ).value = proj.organization_id
+        for hability in proj.habilities:
+            hab_list.select(hability.id)
+        self.query_one('#proj-edit-form').remove_class('hidden')
+
+    def _show_user(self, user: Optional[User]) -> None:
+        """Preenche o formulário de edição com o usuário selecionado."""
+        if not user:
+            return
+
+        self.query_one('#user-edit-id-label', Label).update(
+            f'[b]ID:[/b] {user.id}'
+        )
+        self.query_one('#user-edit-firstname', Input).value = (
+            user.first_name or ''
+        )
+        self.query_one('#user-edit-lastname', Input).value = (
+            user.last_name or ''
+        )
+        self.query_one('#user-edit-email', Input).value = user.email
+        self.query_one('#user-edit-role-select', Select).value = user.role
+        self.query_one('#user-edit-form').remove_class('hidden')
+
+    @staticmethod
+    def _save_project(
+        repo: ProjectRepository, proj: Project, hability_ids: list[int]
+    ) -> Project:
+        # Busca os objetos Hability e os atribui ao projeto; a organização
+        # vai para a coluna das tabelas de projetos
+        proj.habilities = repo.hability_repo.find_by_ids(hability_ids)
+        proj.organization = repo.org_repo.get_by_id(proj.organization_id)
+        return repo.save(proj)
+
+    @staticmethod
+    def _update_project(
+        targets: tuple[UpdateProjectUseCase, HabilityRepository],
+        proj_id: int,
+        hability_ids: list[int],
+        **fields,
+    ) -> Optional[Project]:
+        use_case, hab_repo = targets
+        return use_case.execute(
+            id=proj_id, habilities=hab_repo.find_by_ids(hability_ids), **fields
+        )
+
+    @staticmethod
+    def _delete(repo, db_id: int) -> tuple[int, bool]:
+        return db_id, repo.delete(db_id)
 
     @on(Button.Pressed)
     def on_button_pressed(self, event: Button.Pressed):
-        output_label = self.query_one('#admin-output')
-
+        """
+        Valida o formulário e dispara a escrita em um worker; o resultado
+        chega em `on_data_result`.
+        """
         # --- Lógica de Organizações ---
         if event.button.id == 'save-org-button':
-            try:
-                org = Organization(
-                    name=self.query_one('#org-name').value,
-                    description=self.query_one('#org-description').value,
-                    contact_email=self.query_one('#org-email').value,
-                    contact_phone=self.query_one('#org-phone').value,
-                    website=self.query_one('#org-website').value,
-                )
-                self._org_repo.save(org)
-                self.notify('✅ Organização salva com sucesso!')
-                self._repopulate_org_radio_sets(clear_selection=True)
-                self._repopulate_org_selects()
-                for input_widget in self.query('Input'):
-                    if input_widget.id.startswith('org-'):
-                        input_widget.value = ''
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao salvar organização: {e}', severity='error'
-                )
+            org = Organization(
+                name=self.query_one('#org-name').value,
+                description=self.query_one('#org-description').value,
+                contact_email=self.query_one('#org-email').value,
+                contact_phone=self.query_one('#org-phone').value,
+                website=self.query_one('#org-website').value,
+            )
+            self._write(
+                'save-org', self._org_repo, OrganizationRepository.save, org
+            )
 
         elif event.button.id == 'update-org-button':
-            try:
-                radio_set = self.query_one('#org-edit-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhuma organização selecionada.')
-
-                org_id = getattr(radio_set.pressed_button, 'db_id', None)
-                updated_org = Organization(
-                    id=org_id,
-                    name=self.query_one('#org-edit-name').value,
-                    description=self.query_one('#org-edit-description').value,
-                    contact_email=self.query_one('#org-edit-email').value,
-                    contact_phone=self.query_one('#org-edit-phone').value,
-                    website=self.query_one('#org-edit-website').value,
-                )
-                self._org_repo.save(updated_org)
-                self.notify('✅ Organização atualizada com sucesso!')
-                self._repopulate_org_radio_sets(clear_selection=False)
-                self._repopulate_org_selects()
-                self.query_one('#org-edit-form').add_class('hidden')
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao atualizar organização: {e}', severity='error'
+            org_id = self.query_one(
+                '#org-edit-list', EntityBrowser
+            ).selected_id
+            if org_id is None:
+                self._write_failed(
+                    'update-org', 'Nenhuma organização selecionada.'
                 )
+                return
+            updated_org = Organization(
+                id=org_id,
+                name=self.query_one('#org-edit-name').value,
+                description=self.query_one('#org-edit-description').value,
+                contact_email=self.query_one('#org-edit-email').value,
+                contact_phone=self.query_one('#org-edit-phone').value,
+                website=self.query_one('#org-edit-website').value,
+            )
+            self._write(
+                'update-org',
+                self._org_repo,
+                OrganizationRepository.save,
+                updated_org,
+            )
 
         elif event.button.id == 'delete-org-button':
-            try:
-                radio_set = self.query_one('#org-delete-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhuma organização selecionada.')
-                org_id = getattr(radio_set.pressed_button, 'db_id', None)
-
-                deleted = self._org_repo.delete(org_id)
-                if deleted:
-                    self.notify('✅ Organização deletada com sucesso!')
-                    self._repopulate_org_radio_sets(clear_selection=True)
-                    self._repopulate_org_selects()
-                else:
-                    self.notify('⚠️ Organização não encontrada.')
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao deletar organização: {e}', severity='error'
+            org_id = self.query_one(
+                '#org-delete-list', EntityBrowser
+            ).selected_id
+            if org_id is None:
+                self._write_failed(
+                    'delete-org', 'Nenhuma organização selecionada.'
                 )
+                return
+            self._write('delete-org', self._org_repo, self._delete, org_id)
 
         # --- Lógica de Projetos ---
         elif event.button.id == 'save-proj-button':
-            try:
-                hab_list = self.query_one('#proj-hab-list', SelectionList)
-                selected_hability_ids = hab_list.selected
-
-                proj = Project(
-                    name=self.query_one('#proj-name').value,
-                    description=self.query_one('#proj-description').value,
-                    organization_id=self.query_one('#proj-org-select').value,
-                )
-                # Busca os objetos Hability e os atribui ao projeto
-                proj.habilities = self._hab_repo.find_by_ids(
-                    selected_hability_ids
-                )
-
-                self._proj_repo.save(proj)
-                self.notify('✅ Projeto salvo com sucesso!')
-                self._clear_and_repopulate_proj_lists()
-                for widget in self.query():
-                    if isinstance(widget, Input) and widget.id.startswith(
-                        'proj-'
-                    ):
-                        widget.value = ''
-                hab_list.deselect_all()
-            except Exception as e:
-                self.notify(f'❌ Erro ao salvar projeto: {e}', severity='error')
+            proj = Project(
+                name=self.query_one('#proj-name').value,
+                description=self.query_one('#proj-description').value,
+                organization_id=self.query_one('#proj-org-select').value,
+            )
+            self._write(
+                'save-proj',
+                self._proj_repo,
+                self._save_project,
+                proj,
+                list(self.query_one('#proj-hab-list', SelectionList).selected),
+            )
 
         elif event.button.id == 'update-proj-button':
-            try:
-                radio_set = self.query_one('#proj-edit-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhum projeto selecionado.')
-                proj_id = getattr(radio_set.pressed_button, 'db_id', None)
-
-                hab_list = self.query_one('#proj-edit-hab-list', SelectionList)
-
-                # Busca os objetos Hability a partir dos IDs selecionados
-                selected_habilities = self._hab_repo.find_by_ids(
-                    hab_list.selected
-                )
-
-                updated_proj = self._update_proj_uc.execute(
-                    id=proj_id,
-                    name=self.query_one('#proj-edit-name').value,
-                    description=self.query_one('#proj-edit-description').value,
-                    organization_id=self.query_one(
-                        '#proj-edit-org-select'
-                    ).value,
-                    habilities=selected_habilities,
-                )
-
-                if updated_proj:
-                    self.notify('✅ Projeto atualizado com sucesso!')
-                    self._clear_and_repopulate_proj_lists()
-                    self.query_one('#proj-edit-form').add_class('hidden')
-                else:
-                    self.notify(
-                        '❌ Erro ao atualizar projeto.', severity='error'
-                    )
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao atualizar projeto: {e}', severity='error'
+            proj_id = self.query_one(
+                '#proj-edit-list', EntityBrowser
+            ).selected_id
+            if proj_id is None:
+                self._write_failed(
+                    'update-proj', 'Nenhum projeto selecionado.'
                 )
+                return
+            hab_list = self.query_one('#proj-edit-hab-list', SelectionList)
+            self._write(
+                'update-proj',
+                (self._update_proj_uc, self._hab_repo),
+                self._update_project,
+                proj_id,
+                list(hab_list.selected),
+                name=self.query_one('#proj-edit-name').value,
+                description=self.query_one('#proj-edit-description').value,
+                organization_id=self.query_one('#proj-edit-org-select').value,
+            )
 
         elif event.button.id == 'delete-proj-button':
-            try:
-                radio_set = self.query_one('#proj-delete-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhum projeto selecionado.')
-                proj_id = getattr(radio_set.pressed_button, 'db_id', None)
-
-                deleted = self._proj_repo.delete(proj_id)
-                if deleted:
-                    self.notify('✅ Projeto deletado com sucesso!')
-                    self._clear_and_repopulate_proj_lists()
-                else:
-                    self.notify('⚠️ Projeto não encontrado.')
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao deletar projeto: {e}', severity='error'
+            proj_id = self.query_one(
+                '#proj-delete-list', EntityBrowser
+            ).selected_id
+            if proj_id is None:
+                self._write_failed(
+                    'delete-proj', 'Nenhum projeto selecionado.'
                 )
+                return
+            self._write('delete-proj', self._proj_repo, self._delete, proj_id)
 
         # --- Lógica de Usuários ---
         elif event.button.id == 'save-user-button':
-            try:
-                user, error = self._register_user_uc.execute(
-                    email=self.query_one('#user-email').value,
-                    password=self.query_one('#user-password').value,
-                )
-
-                if error is not None:
-                    raise Exception(str(error))
-
-                self.notify('✅ Usuário salvo com sucesso!')
-                self._clear_and_repopulate_user_lists()
-                self.query_one('#user-email', Input).value = ''
-                self.query_one('#user-password', Input).value = ''
-            except Exception as e:
-                self.notify(f'❌ Erro ao salvar usuário: {e}', severity='error')
+            self._write(
+                'save-user',
+                self._register_user_uc,
+                RegisterUserUseCase.execute,
+                email=self.query_one('#user-email').value,
+                password=self.query_one('#user-password').value,
+            )
 
         elif event.button.id == 'update-user-button':
-            try:
-                radio_set = self.query_one('#user-edit-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhum usuário selecionado.')
-                user_id = getattr(radio_set.pressed_button, 'db_id', None)
-
-                # A senha não é atualizada aqui, apenas outros dados
-
-                user = self._update_user_uc.execute(
-                    id=user_id,
-                    first_name=self.query_one('#user-edit-firstname').value,
-                    last_name=self.query_one('#user-edit-lastname').value,
-                    role=self.query_one('#user-edit-role-select').value,
+            user_id = self.query_one(
+                '#user-edit-list', EntityBrowser
+            ).selected_id
+            if user_id is None:
+                self._write_failed(
+                    'update-user', 'Nenhum usuário selecionado.'
                 )
-                if user is None:
-                    raise ValueError('Usuário não encontrado.')
-
-                self.notify('✅ Usuário atualizado com sucesso!')
-                self._clear_and_repopulate_user_lists()
-                self.query_one('#user-edit-form').add_class('hidden')
+                return
+
+            # A senha não é atualizada aqui, apenas outros dados
+            self._write(
+                'update-user',
+                self._update_user_uc,
+                UpdateUserUseCase.execute,
+                id=user_id,
+                first_name=self.query_one('#user-edit-firstname').value,
+                last_name=self.query_one('#user-edit-lastname').value,
+                role=self.query_one('#user-edit-role-select').value,
+            )
 
-            except Exception as e:
-                self.notify(
-                    f'❌ Erro ao atualizar usuário: {e}', severity='error'
+        elif event.button.id == 'delete-user-button':
+            user_id = self.query_one(
+                '#user-delete-list', EntityBrowser
+            ).selected_id
+            if user_id is None:
+                self._write_failed(
+                    'delete-user', 'Nenhum usuário selecionado.'
                 )
+                return
 
-        elif event.button.id == 'delete-user-button':
-            try:
-                radio_set = self.query_one('#user-delete-list', RadioSet)
-                if radio_set.pressed_button is None:
-                    raise ValueError('Nenhum usuário selecionado.')
-                user_id = getattr(radio_set.pressed_button, 'db_id', None)
-
-                # Adicionar verificação para não se auto-deletar
-                if self._user_logged and self._user_logged.id == user_id:
-                    self.notify(
-                        '❌ Você não pode deletar a si mesmo.', severity='error'
-                    )
-                    return
-
-                deleted = self._user_repo.delete(user_id)
-                if deleted:
-                    self.notify('✅ Usuário deletado com sucesso!')
-                    self._clear_and_repopulate_user_lists()
-                else:
-                    self.notify('⚠️ Usuário não encontrado.')
-            except Exception as e:
+            # Adicionar verificação para não se auto-deletar
+            if self._user_logged and self._user_logged.id == user_id:
                 self.notify(
-                    f'❌ Erro ao deletar usuário: {e}', severity='error'
+                    '❌ Você não pode deletar a si mesmo.', severity='error'
                 )
+                return
+
+            self._write('delete-user', self._user_repo, self._delete, user_id)
+
+    def _write(self, request: str, target, call, *args, **kwargs) -> None:
+        """Escritas não se cancelam entre si (`exclusive=False`)."""
+        self._data.run(request, target, call, *args, exclusive=False, **kwargs)
+
+    def _write_failed(self, request: str, error) -> None:
+        self.notify(
+            f'❌ Erro ao {WRITE_ACTIONS[request]}: {error}', severity='error'
+        )
+
+    @on(DataResult)
+    def on_data_result(self, message: DataResult) -> None:
+        request, result = message.request, message.result
+        if request.startswith('select-'):
+            if message.ok:
+                show = {
+                    'select-org': self._show_org,
+                    'select-proj': self._show_proj,
+                    'select-user': self._show_user,
+                }[request]
+                show(result)
+            else:
+                self.notify(f'❌ {message.error}', severity='error')
+            return
+
+        if not message.ok:
+            self._write_failed(request, message.error)
+
+        # --- Organizações ---
+        elif request == 'save-org':
+            self.notify('✅ Organização salva com sucesso!')
+            self._entity_saved('org', result)
+            for input_widget in self.query('Input'):
+                if input_widget.id.startswith('org-'):
+                    input_widget.value = ''
+
+        elif request == 'update-org':
+            self.notify('✅ Organização atualizada com sucesso!')
+            self._entity_saved('org', result)
+            self.query_one('#org-edit-form').add_class('hidden')
+
+        elif request == 'delete-org':
+            org_id, deleted = result
+            if deleted:
+                self.notify('✅ Organização deletada com sucesso!')
+                self._entity_deleted('org', org_id)
+            else:
+                self.notify('⚠️ Organização não encontrada.')
+
+        # --- Projetos ---
+        elif request == 'save-proj':
+            self.notify('✅ Projeto salvo com sucesso!')
+            self._entity_saved('proj', result)
+            for widget in self.query():
+                if isinstance(widget, Input) and widget.id.startswith('proj-'):
+                    widget.value = ''
+            self.query_one('#proj-hab-list', SelectionList).deselect_all()
+
+        elif request == 'update-proj':
+            if result:
+                self.notify('✅ Projeto atualizado com sucesso!')
+                self._entity_saved('proj', result)
+                self.query_one('#proj-edit-form').add_class('hidden')
+            else:
+                self.notify('❌ Erro ao atualizar projeto.', severity='error')
+
+        elif request == 'delete-proj':
+            proj_id, deleted = result
+            if deleted:
+                self.notify('✅ Projeto deletado com sucesso!')
+                self._entity_deleted('proj', proj_id)
+            else:
+                self.notify('⚠️ Projeto não encontrado.')
+
+        # --- Usuários ---
+        elif request == 'save-user':
+            user, error = result
+            if error is not None:
+                self._write_failed(request, error)
+                return
+            self.notify('✅ Usuário salvo com sucesso!')
+            self._entity_saved('user', user)
+            self.query_one('#user-email', Input).value = ''
+            self.query_one('#user-password', Input).value = ''
+
+        elif request == 'update-user':
+            if result is None:
+                self._write_failed(request, 'Usuário não encontrado.')
+                return
+            self.notify('✅ Usuário atualizado com sucesso!')
+            self._entity_saved('user', result)
+            self.query_one('#user-edit-form').add_class('hidden')
+
+        elif request == 'delete-user':
+            user_id, deleted = result
+            if deleted:
+                self.notify('✅ Usuário deletado com sucesso!')
+                self._entity_deleted('user', user_id)
+            else:
+                self.notify('⚠️ Usuário não encontrado.')
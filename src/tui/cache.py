@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class PageCache:
+    """
+    Cache LRU de páginas já carregadas, chaveado por (filtros, página).
+
+    Pode ser alimentado por workers em outras threads. `clear()` avança a
+    geração do cache: resultados de buscas iniciadas antes dela são
+    descartados em `put`, para que um prefetch em andamento não grave
+    dados anteriores a uma alteração.
+
+    >>> cache = PageCache(max_pages=2)
+    >>> cache.put(((), 1), 'p1'); cache.put(((), 2), 'p2')
+    >>> cache.get(((), 1))
+    'p1'
+    >>> cache.put(((), 3), 'p3')   # descarta a menos usada: a página 2
+    >>> cache.get(((), 2)) is None
+    True
+    """
+
+    def __init__(self, max_pages: int = 16):
+        self.max_pages = max_pages
+        self.generation = 0
+        self._pages: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+            return page
+
+    def put(
+        self, key: Hashable, page: Any, generation: Optional[int] = None
+    ) -> None:
+        """Guarda a página, a menos que o cache tenha sido limpo depois."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self.generation += 1
@@ -0,0 +1,37 @@
+from typing import Callable
+
+from textual.message import Message
+from textual.message_pump import MessagePump
+
+from src.events import Event, EventBus, bus
+
+
+class DomainEvent(Message):
+    """Um evento do barramento, entregue na fila de mensagens do widget."""
+
+    def __init__(self, event: Event):
+        self.event = event
+        super().__init__()
+
+
+def listen(
+    node: MessagePump, *event_types: type[Event], events: EventBus = bus
+) -> Callable[[], None]:
+    """
+    Inscreve `node` nos eventos e retorna a função que cancela as
+    inscrições (chamada ao desmontar). Os eventos chegam como
+    `DomainEvent`: `post_message` é seguro entre threads, então um evento
+    publicado num worker é tratado na thread da interface.
+    """
+    unsubscribes = [
+        events.subscribe(
+            event_type, lambda event: node.post_message(DomainEvent(event))
+        )
+        for event_type in event_types
+    ]
+
+    def stop() -> None:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    return stop
@@ -13,26 +13,28 @@ from textual.widgets import (
     Static,
 )
 
+from src.container import ServiceContainer
 from src.populate_db.users import PopulateRawDB
 from src.repositories import (
-    HabilityRepository,
+    CatalogRepository,
+    CatalogSnapshot,
     ProjectRepository,
     UserRepository,
 )
-from src.tui.project import ProjectScreen
-from src.tui.register import RegisterScreen
-from src.tui.user import UserScreen
-from src.use_cases import (
-    LoginUseCase,
-    ReplacePasswordUseCase,
-    UpdateUserUseCase,
-)
+from src.startup import timeline
+from src.tui.workers import DataAccess, DataResult, worker_connection
+from src.use_cases import LoginUseCase
 
 css_path = Path(__file__).parent / 'css' / 'styles.css'
 
 
 class ColaboraApp(App):
-    """Um aplicativo TUI para o Colabora."""
+    """
+    Um aplicativo TUI para o Colabora.
+
+    As telas são importadas quando abertas pela primeira vez, e as seeds
+    são carregadas em segundo plano depois que a tela de login aparece.
+    """
 
     TITLE = 'Colabora APP'
 
@@ -43,18 +45,35 @@ class ColaboraApp(App):
         ('q', 'quit()', 'Sair'),
     ]
 
-    SCREENS = {
-        'register': RegisterScreen,
-    }
-
     def __init__(self):
         super().__init__()
-        self.user_repository = UserRepository()
-        self.project_repository = ProjectRepository()
-        self.hability_repository = HabilityRepository()
-        self.login_use_case = LoginUseCase.factory()
-        self.update_user_use_case = UpdateUserUseCase.factory()
-        self.replace_password_use_case = ReplacePasswordUseCase.factory()
+        # Repositórios e casos de uso montados uma vez e compartilhados
+        # pelas telas
+        self.services = ServiceContainer()
+        self._data = DataAccess(self)
+
+    def on_mount(self) -> None:
+        # O login espera as seeds (ex.: o usuário admin das seeds)
+        self.query_one('#login-button', Button).disabled = True
+        self.call_after_refresh(self._after_first_paint)
+
+    def _after_first_paint(self) -> None:
+        timeline.mark('primeira pintura')
+        self._data.run('seed', None, self._populate)
+
+    @staticmethod
+    def _populate(_) -> CatalogSnapshot:
+        """
+        Abre o banco, carrega as seeds e valida o snapshot do catálogo
+        (refeito se o banco mudou), com a conexão do worker.
+        """
+        with worker_connection() as conn:
+            timeline.mark('banco aberto')
+            PopulateRawDB(connection=conn).run()
+            timeline.mark('seeds')
+            snapshot = CatalogRepository(ProjectRepository(conn)).refresh()
+        timeline.mark('catálogo')
+        return snapshot
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -102,34 +121,113 @@ class ColaboraApp(App):
         if event.button.id == 'login-button':
             email = self.query_one('#email-input').value
             password = self.query_one('#password-input').value
-
-            user, err_msg = self.login_use_case.execute(email, password)
-
-            if user:
-                self.push_screen(
-                    UserScreen(
-                        user=user,
-                        user_repository=self.user_repository,
-                        hability_repository=self.hability_repository,
-                        update_user_use_case=self.update_user_use_case,
-                        replace_password_use_case=self.replace_password_use_case,
-                    )
-                )
-            else:
-                self.notify(
-                    '⚠️  ' + err_msg,
-                    title='Erro ao fazer login',
-                    severity='error',
-                )
+            self._login(email, password)
 
         elif event.button.id == 'register-button':
-            self.push_screen('register')
+            from src.tui.register import RegisterScreen
+
+            self.push_screen(
+                RegisterScreen(self.services.register_user_use_case)
+            )
 
         elif event.button.id == 'view-projects-button':
+            from src.tui.project import ProjectScreen
+
             self.push_screen(
                 ProjectScreen(
                     user=None,  # Usuário não logado
-                    user_repository=self.user_repository,
-                    project_repository=self.project_repository,
+                    user_repository=self.services.user_repository,
+                    project_repository=self.services.project_repository,
+                    subscribe_use_case=self.services.subscribe_use_case,
+                    catalog_repository=self.services.catalog_repository,
                 )
             )
+
+    def _login(self, email: str, password: str) -> None:
+        """
+        Faz o login em um worker de thread: o scrypt e as consultas rodam
+        fora da interface, e o botão mostra um indicador de progresso.
+        """
+        self.query_one('#login-button', Button).loading = True
+        self._data.run(
+            'login',
+            (
+                self.services.login_use_case,
+                self.services.user_repository,
+                self.services.catalog_repository,
+            ),
+            self._login_and_load_profile,
+            email,
+            password,
+        )
+
+    @staticmethod
+    def _login_and_load_profile(
+        targets: tuple[LoginUseCase, UserRepository, CatalogRepository],
+        email: str,
+        password: str,
+    ) -> tuple:
+        """
+        Autentica e já carrega os dados da `UserScreen`. As habilidades
+        vêm do snapshot do catálogo, se ele ainda estiver válido.
+        """
+        login_use_case, user_repository, catalog_repository = targets
+        user, err_msg = login_use_case.execute(email, password)
+        if user is None:
+            return None, None, err_msg
+        return (
+            user_repository.get_by_id_with_all_relations(user.id),
+            catalog_repository.habilities_by_domain(),
+            None,
+        )
+
+    @on(DataResult)
+    def on_data_result(self, message: DataResult) -> None:
+        if message.request == 'seed':
+            self._seeded(message)
+            return
+        if message.request != 'login':
+            return
+        self.query_one('#login-button', Button).loading = False
+        if not message.ok:
+            self.notify(
+                f'❌ {message.error}',
+                title='Erro ao fazer login',
+                severity='error',
+            )
+            return
+
+        user, habilities_data, err_msg = message.result
+        if user:
+            from src.tui.user import UserScreen
+
+            self.push_screen(
+                UserScreen(
+                    user=user,
+                    user_repository=self.services.user_repository,
+                    hability_repository=self.services.hability_repository,
+                    update_user_use_case=self.services.update_user_use_case,
+                    replace_password_use_case=(
+                        self.services.replace_password_use_case
+                    ),
+                    habilities_data=habilities_data,
+                    services=self.services,
+                )
+            )
+        else:
+            self.notify(
+                '⚠️  ' + err_msg,
+                title='Erro ao fazer login',
+                severity='error',
+            )
+
+    def _seeded(self, message: DataResult) -> None:
+        self.query_one('#login-button', Button).disabled = False
+        if not message.ok:
+            self.notify(
+                f'❌ {message.error}',
+                title='Erro ao popular o banco',
+                severity='error',
+            )
+            return
+        self.services.catalog_repository.snapshot = message.result
@@ -0,0 +1,71 @@
+import unicodedata
+from bisect import bisect_left
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+def normalize(text: str) -> str:
+    """
+    Minúsculas e sem acentos, para a busca não depender deles.
+
+    >>> normalize('Análise de Dados')
+    'analise de dados'
+    """
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class PrefixIndex(Generic[T]):
+    """
+    Índice em memória para busca por prefixo de palavra.
+
+    Cada item entra uma vez por palavra do seu texto, como o sufixo que
+    começa nela ('análise de dados' -> 'analise de dados', 'de dados',
+    'dados'), numa lista ordenada. Uma busca é um `bisect` até o primeiro
+    sufixo >= termo, seguido das entradas que começam com o termo:
+    O(log n + resultados), sem percorrer todos os itens.
+
+    >>> index = PrefixIndex(['Python', 'Análise de Dados', 'Dados Abertos'])
+    >>> index.search('dad')
+    ['Análise de Dados', 'Dados Abertos']
+    >>> index.search('de da')
+    ['Análise de Dados']
+    >>> index.search('py', limit=1)
+    ['Python']
+    """
+
+    def __init__(
+        self, items: Iterable[T], key: Callable[[T], str] = str
+    ) -> None:
+        self._items: list[T] = []
+        self._keys: list[str] = []
+        entries: list[tuple[str, int]] = []
+        for position, item in enumerate(items):
+            text = normalize(key(item))
+            self._items.append(item)
+            self._keys.append(text)
+            words = text.split()
+            entries.extend(
+                (' '.join(words[i:]), position) for i in range(len(words))
+            )
+        entries.sort()
+        self._suffixes = [suffix for suffix, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, term: str, limit: Optional[int] = None) -> list[T]:
+        """Itens com alguma palavra começando por `term`, em ordem."""
+        term = ' '.join(normalize(term).split())
+        if not term:
+            return []
+        found: set[int] = set()
+        start = bisect_left(self._suffixes, term)
+        for i in range(start, len(self._suffixes)):
+            if not self._suffixes[i].startswith(term):
+                break
+            found.add(self._positions[i])
+        ordered = sorted(found, key=lambda p: (self._keys[p], p))
+        return [self._items[p] for p in ordered[:limit]]
@@ -1,22 +1,53 @@
+import sqlite3
+from functools import partial
+from math import ceil
 from typing import Optional
 
-from textual import on
+from loguru import logger
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
-    Collapsible,
     Footer,
     Header,
     Input,
+    OptionList,
     Static,
     TabbedContent,
     TabPane,
 )
+from textual.worker import get_current_worker
 
 from src.models import Project, User
-from src.repositories import ProjectRepository, UserRepository
+from src.repositories import (
+    CatalogRepository,
+    CatalogSnapshot,
+    ProjectRepository,
+    UserRepository,
+)
+from src.repositories.query_counter import QueryCounter
+from src.tui.cache import PageCache
+from src.tui.widgets import ProjectList
+from src.tui.workers import (
+    DataAccess,
+    DataResult,
+    query_in_worker,
+    worker_connection,
+)
+from src.use_cases import SubscribeToProjectUseCase
+
+# A lista é virtualizada: páginas grandes não criam mais widgets
+PER_PAGE = 100
+# Páginas mantidas em memória (as mais recentes) e vizinhas pré-carregadas
+CACHED_PAGES = 8
+PREFETCH_PAGES = 1
+# Espera (s) depois da última tecla antes de buscar, e tamanho dos lotes
+# em que os resultados chegam à lista
+SEARCH_DEBOUNCE = 0.3
+SEARCH_BATCH = 25
 
 
 class ProjectScreen(Screen):
@@ -29,24 +60,36 @@ class ProjectScreen(Screen):
         user: Optional[User],
         user_repository: UserRepository,
         project_repository: ProjectRepository,
+        subscribe_use_case: Optional[SubscribeToProjectUseCase] = None,
+        catalog_repository: Optional[CatalogRepository] = None,
     ):
         self.user = user
         self.user_id = user.id if user else None
         self._user_repo = user_repository
         self._project_repo = project_repository
+        self._subscribe_uc = subscribe_use_case or SubscribeToProjectUseCase(
+            user_repository
+        )
         self.all_projects: list[Project] = []  # projetos da página atual
         self.current_page: int = 1
-        self.per_page: int = 10
+        self.per_page: int = PER_PAGE
         self.total_pages: int = 1
+        # Filtros aplicados no banco; fazem parte da chave do cache
+        self.filters: tuple = ()
+        self._page_cache = PageCache(CACHED_PAGES)
+        self._search_timer: Optional[Timer] = None
+        # Sem usuário, as páginas vêm do snapshot do catálogo (se houver),
+        # sem consultar o banco; ele é revalidado depois, em um worker
+        self._catalog_repo = catalog_repository
+        self._catalog: Optional[CatalogSnapshot] = (
+            catalog_repository.snapshot
+            if catalog_repository is not None and user is None
+            else None
+        )
         super().__init__()
+        self._data = DataAccess(self)
 
     def compose(self) -> ComposeResult:
-        # Carrega os dados mais recentes ao compor a tela
-        if self.user_id:
-            self.user = self._user_repo.get_by_id_with_all_relations(
-                self.user_id
-            )
-
         yield Header(show_clock=True)
         with VerticalScroll(classes='bg with-border'):
             yield Static()  # Para funcionar o espaçamento
@@ -68,8 +111,10 @@ class ProjectScreen(Screen):
             )
             with TabbedContent(id='tabs'):
                 with TabPane('Todos os Projetos', id='all-projects-tab'):
-                    yield VerticalScroll(
-                        id='project-list-container', classes='container'
+                    yield ProjectList(
+                        user=self.user,
+                        id='project-list',
+                        classes='project-list',
                     )
                     with Container(classes='full-width h5 center'):
                         yield Static(
@@ -93,30 +138,167 @@ class ProjectScreen(Screen):
                             )
 
                 with TabPane('Meus Projetos', id='my-projects-tab'):
-                    yield VerticalScroll(
-                        id='my-projects-container', classes='container'
+                    yield ProjectList(
+                        user=self.user,
+                        id='my-projects-list',
+                        classes='project-list',
+                    )
+
+            if self.user:
+                # Um único botão, que age sobre o projeto destacado
+                with Container(classes='btn-save-pw'):
+                    yield Button(
+                        'Inscrever-se',
+                        variant='success',
+                        id='subscribe-button',
+                        classes='subscribe-button center',
+                        disabled=True,
                     )
 
         yield Footer()
 
     def on_mount(self) -> None:
-        """Popula a lista de projetos quando a tela é montada."""
-        self._update_my_projects_list()
+        """
+        Popula a lista de projetos quando a tela é montada. O usuário
+        recebido é exibido na hora; os dados mais recentes dele e os
+        projetos em que está inscrito chegam de um worker.
+        """
         self._load_projects_page()
+        if self._catalog is not None:
+            self._data.run(
+                'catalog', self._catalog_repo, CatalogRepository.refresh
+            )
+        if self.user_id:
+            self._data.run(
+                'user',
+                (self._user_repo, self._project_repo),
+                self._fetch_user,
+                self.user_id,
+            )
+
+    @staticmethod
+    def _fetch_user(
+        targets: tuple[UserRepository, ProjectRepository], user_id: int
+    ) -> tuple[Optional[User], list[Project]]:
+        user_repository, project_repository = targets
+        user = user_repository.get_by_id_with_all_relations(user_id)
+        if user is None:
+            return None, []
+        # Os projetos do usuário com as habilidades, para os cards
+        projects = project_repository.find_by_ids_with_all_relations(
+            [p.id for p in user.projects]
+        )
+        return user, projects
+
+    def _page_key(self, page: int) -> tuple:
+        return (self.filters, page, self.per_page)
+
+    @staticmethod
+    def _fetch_page(
+        source: ProjectRepository | CatalogSnapshot, key: tuple
+    ) -> dict:
+        filters, page, per_page = key
+        (search,) = filters or (None,)
+        if isinstance(source, CatalogSnapshot):
+            return source.page(page, per_page, search=search)
+        return source.find_all_with_habilities_paginated(
+            page, per_page, search=search
+        )
 
     def _load_projects_page(self) -> None:
-        """Carrega a página atual de projetos do repositório, com paginação."""
-        result = self._project_repo.find_all_with_habilities_paginated(
-            page=self.current_page,
-            per_page=self.per_page,
+        """
+        Exibe a página atual de projetos. Páginas já visitadas,
+        pré-carregadas ou do snapshot do catálogo aparecem na hora; as
+        demais são buscadas em um worker, com a lista em carregamento.
+        """
+        key = self._page_key(self.current_page)
+        result = self._page_cache.get(key)
+        if result is None and self._catalog is not None:
+            result = self._fetch_page(self._catalog, key)
+            self._page_cache.put(self._page_key(result['page']), result)
+        if result is None:
+            self.query_one('#project-list', ProjectList).loading = True
+            self.query_one('#pagination-info', Static).update('Carregando...')
+            self._data.run(
+                'page',
+                self._project_repo,
+                self._fetch_page_result,
+                key,
+                self._page_cache.generation,
+            )
+            return
+
+        self._data.cancel('page')
+        self._show_page(result)
+
+    @staticmethod
+    def _fetch_page_result(
+        repository: ProjectRepository, key: tuple, generation: int
+    ) -> tuple[tuple, dict, int]:
+        return key, ProjectScreen._fetch_page(repository, key), generation
+
+    def _page_loaded(self, key: tuple, result: dict, generation: int):
+        filters, _, per_page = key
+        self._page_cache.put(
+            (filters, result['page'], per_page), result, generation
         )
+        if key == self._page_key(self.current_page):
+            self._show_page(result)
 
+    def _show_page(self, result: dict) -> None:
+        self.query_one('#project-list', ProjectList).loading = False
         self.all_projects = result['data']
         self.total_pages = result['total_pages']
         self.current_page = result['page']  # garante que está consistente
 
         self._update_project_list(self.all_projects)
         self._update_pagination_info()
+        # Depois da pintura, para o worker não disputar a CPU com ela
+        self.call_after_refresh(self._prefetch_neighbours)
+
+    def _prefetch_neighbours(self) -> None:
+        """Dispara o carregamento das páginas vizinhas que não estão no cache."""
+        if self._catalog is not None:
+            return  # páginas do snapshot já estão em memória
+        pages = [
+            page
+            for offset in range(1, PREFETCH_PAGES + 1)
+            for page in (
+                self.current_page + offset,
+                self.current_page - offset,
+            )
+            if 1 <= page <= self.total_pages
+            and self._page_key(page) not in self._page_cache
+        ]
+        if pages:
+            self._prefetch_pages(
+                [self._page_key(page) for page in pages],
+                self._page_cache.generation,
+            )
+
+    @work(thread=True, exclusive=True, group='prefetch')
+    def _prefetch_pages(self, keys: list[tuple], generation: int) -> None:
+        """
+        Carrega as páginas em uma thread, com a conexão própria dela.
+        Em bancos em memória o prefetch é ignorado e a página é carregada
+        ao ser aberta.
+        """
+        with worker_connection() as conn:
+            if conn is None:
+                return
+
+            repository = ProjectRepository(db_connection=conn)
+            worker = get_current_worker()
+            for key in keys:
+                if worker.is_cancelled:
+                    return
+                try:
+                    result = self._fetch_page(repository, key)
+                except sqlite3.Error as error:
+                    # A página é carregada de novo quando for aberta
+                    logger.warning(f'Prefetch da página {key} falhou: {error}')
+                    return
+                self._page_cache.put(key, result, generation)
 
     def _update_pagination_info(self) -> None:
         """Atualiza o texto 'Página X/Y' e o estado dos botões."""
@@ -142,161 +324,239 @@ class ProjectScreen(Screen):
             self._load_projects_page()
 
     def _update_project_list(self, projects: list[Project]) -> None:
-        """Limpa e repopula o contêiner da lista de projetos."""
-        # This method is now only called once from on_mount
-        # The filtering logic will hide/show widgets instead of recreating them.
-        container = self.query_one('#project-list-container')
-        container.remove_children()
-        for project in projects:
-            container.mount(self._create_project_widget(project, prefix='all'))
-
-    def _update_my_projects_list(self) -> None:
-        """Popula a lista de projetos do usuário."""
-        container = self.query_one('#my-projects-container')
-        container.remove_children()
-        if self.user:
-            # Busca os projetos com as habilidades carregadas para evitar problemas
-            project_ids = [p.id for p in self.user.projects]
-            user_projects = self._project_repo.find_by_ids_with_all_relations(
-                project_ids
-            )
-            for project in user_projects:
-                container.mount(
-                    self._create_project_widget(project, prefix='my')
-                )
+        """Substitui os projetos exibidos na lista."""
+        self.query_one('#project-list', ProjectList).set_projects(projects)
 
     @on(Input.Changed, '#search-project')
-    def _filter_projects(self, event: Input.Changed) -> None:
-        """Filtra a lista de projetos com base no texto de busca."""
-        search_term = event.value.lower()
-        all_projects_container = self.query_one('#project-list-container')
-
-        # Filtra pela classe '.project-card' que é mais robusto
-        for collapsible in all_projects_container.query('.project-card'):
-            # Garante que estamos filtrando apenas os widgets da aba "Todos os Projetos"
-            if collapsible.id and collapsible.id.startswith('all_project_'):
-                project_id = int(collapsible.id.split('_')[-1])
-                project = next(
-                    (p for p in self.all_projects if p.id == project_id),
-                    None,
-                )
-                if project:
-                    matches = (
-                        search_term in project.name.lower()
-                        or search_term in project.description.lower()
-                    )
-                    collapsible.display = matches
-
-    @on(Button.Pressed)
-    def handle_subscription(self, event: Button.Pressed):
-        """Lida com a inscrição e desinscrição de projetos."""
-        if 'subscribe_btn' in event.button.id:
-            project_id = int(
-                event.button.id.split('_')[-1]
-            )  # Ex: 'my_subscribe_btn_2' -> '2'
-            project_to_toggle = self._project_repo.get_by_id(project_id)
-
-            if not project_to_toggle:
-                return
-
-            # Recarrega o usuário para garantir que temos o estado mais recente
-            self.user = self._user_repo.get_by_id_with_all_relations(
-                self.user_id
-            )
+    def _schedule_search(self, event: Input.Changed) -> None:
+        """Busca só quando o usuário para de digitar."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(
+            SEARCH_DEBOUNCE, partial(self._start_search, event.value.strip())
+        )
 
-            msg = ''
-            title = ''
-            if self.user.is_subscribed_to(project_to_toggle):
-                self.user.remove_project(project_to_toggle)
-                msg = 'Remoção realizada com sucesso.'
-                title = 'Cancelamento realizado'
-                # Atualiza os dois botões (se existirem) para 'Inscrever-se'
-                for btn in self.query(Button):
-                    if btn.id and btn.id.endswith(
-                        f'_subscribe_btn_{project_id}'
-                    ):
-                        btn.label = 'Inscrever-se'
-                        btn.variant = 'success'
-                # Remove o widget da aba "Meus Projetos"
-                my_project_widget = self.query(f'#my_project_{project_id}')
-                if my_project_widget:
-                    my_project_widget.first().remove()
-            else:
-                self.user.add_project(project_to_toggle)
-                msg = 'A organização entrará em contato com você.'
-                title = 'Inscrição realizada com sucesso'
-                # Atualiza os dois botões (se existirem) para 'Desinscrever-se'
-                for btn in self.query(Button):
-                    if btn.id and btn.id.endswith(
-                        f'_subscribe_btn_{project_id}'
-                    ):
-                        btn.label = 'Desinscrever-se'
-                        btn.variant = 'error'
-                # Adiciona o widget na aba "Meus Projetos"
-                my_projects_container = self.query_one(
-                    '#my-projects-container'
-                )
-                project_with_habilities = (
-                    self._project_repo.get_by_id_with_habilities(project_id)
-                )
-                my_projects_container.mount(
-                    self._create_project_widget(
-                        project_with_habilities, prefix='my'
+    def _start_search(self, term: str) -> None:
+        """Aplica o termo de busca, voltando para a primeira página."""
+        self._search_timer = None
+        filters = (term,) if term else ()
+        if filters == self.filters:
+            return
+        self.filters = filters
+        self.current_page = 1
+
+        key = self._page_key(1)
+        if key in self._page_cache or self._catalog is not None:
+            self.workers.cancel_group(self, 'search')
+            self._load_projects_page()
+            return
+
+        self._data.cancel('page')
+        self.query_one('#project-list', ProjectList).loading = False
+        self.query_one('#pagination-info', Static).update('Buscando...')
+        self._search_projects(key, self._page_cache.generation)
+
+    @work(thread=True, exclusive=True, group='search')
+    def _search_projects(self, key: tuple, generation: int) -> None:
+        """
+        Busca a página em lotes de `SEARCH_BATCH`, exibindo cada lote assim
+        que chega. Uma busca mais nova cancela esta.
+        """
+        filters, page, per_page = key
+        batches = ceil(per_page / SEARCH_BATCH)
+        worker = get_current_worker()
+        data = []
+        # Uma conexão para todos os lotes
+        with worker_connection():
+            for i in range(batches):
+                batch = (filters, (page - 1) * batches + i + 1, SEARCH_BATCH)
+                try:
+                    result = query_in_worker(
+                        self.app,
+                        self._project_repo,
+                        partial(self._fetch_page, key=batch),
                     )
+                except sqlite3.Error as error:
+                    if not worker.is_cancelled:
+                        self.app.call_from_thread(
+                            self._search_failed, key, error
+                        )
+                    return
+                if worker.is_cancelled:
+                    return
+                self.app.call_from_thread(
+                    self._show_search_batch, key, result['data'], i == 0
                 )
+                data += result['data']
+                if result['page'] >= result['total_pages']:
+                    break
+
+        page_result = {
+            'data': data,
+            'page': page,
+            'per_page': per_page,
+            'total': result['total'],
+            'total_pages': max(ceil(result['total'] / per_page), 1),
+        }
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(
+            self._finish_search, key, page_result, generation
+        )
 
-            # Salva o estado atualizado do usuário (com sua nova lista de projetos)
-            self._user_repo.save(self.user)
-            self.notify(msg, severity='information', title=title)
-
-    def _create_project_widget(
-        self, project: Project, prefix: str
-    ) -> Collapsible:
-        """Cria um widget Collapsible para um único projeto."""
-        children = [
-            Static(project.description, classes='text'),
-            Static('[bold]Habilidades Necessárias:[/bold]', classes='text'),
-        ]
-        for hability in project.habilities:
-            has_it = self.user.has_hability(hability) if self.user else False
-            icon = '✅' if has_it else '❌'
-            children.append(Static(f' {icon} {hability.name}', classes='text'))
-
-        if self.user:
-            user_has_any_hability = any(
-                self.user.has_hability(h) for h in project.habilities
-            )
+    def _show_search_batch(
+        self, key: tuple, projects: list[Project], first: bool
+    ) -> None:
+        if key != self._page_key(self.current_page):
+            return  # resultado de uma busca já substituída
+        project_list = self.query_one('#project-list', ProjectList)
+        if first:
+            project_list.set_projects(projects)
+        else:
+            project_list.add_projects(projects)
+
+    def _search_failed(self, key: tuple, error: sqlite3.Error) -> None:
+        if key == self._page_key(self.current_page):
+            self._update_pagination_info()
+        self.notify(str(error), severity='error', title='Erro na busca')
+
+    def _finish_search(self, key: tuple, result: dict, generation: int):
+        self._page_cache.put(key, result, generation)
+        if key != self._page_key(self.current_page):
+            return
+        self.all_projects = result['data']
+        self.total_pages = result['total_pages']
+        self._update_pagination_info()
+        self._prefetch_neighbours()
+
+    def _active_list(self) -> ProjectList:
+        """Lista da aba aberta."""
+        tabs = self.query_one('#tabs', TabbedContent)
+        if tabs.active == 'my-projects-tab':
+            return self.query_one('#my-projects-list', ProjectList)
+        return self.query_one('#project-list', ProjectList)
+
+    @on(OptionList.OptionHighlighted)
+    @on(TabbedContent.TabActivated)
+    def _update_subscribe_button(self) -> None:
+        """Ajusta o botão de inscrição ao projeto destacado."""
+        buttons = self.query('#subscribe-button')
+        if not buttons:
+            return
+        button = buttons.first(Button)
+        project_list = self._active_list()
+        project = project_list.highlighted_project
+
+        if project is None or not project_list.can_subscribe(project):
+            button.label = 'Inscrever-se'
+            button.variant = 'success'
+            button.disabled = True
+        elif self.user.is_subscribed_to(project):
+            button.label = 'Desinscrever-se'
+            button.variant = 'error'
+            button.disabled = False
+        else:
+            button.label = 'Inscrever-se'
+            button.variant = 'success'
+            button.disabled = False
+
+    @on(Button.Pressed, '#subscribe-button')
+    def handle_subscription(self, event: Button.Pressed):
+        """
+        Inscreve ou desinscreve o usuário do projeto destacado, em um
+        worker. O botão fica desabilitado até a escrita terminar.
+        """
+        project = self._active_list().highlighted_project
+        if project is None:
+            return
+
+        event.button.disabled = True
+        self._data.run(
+            'subscription',
+            self._subscribe_uc,
+            self._toggle_subscription,
+            self.user_id,
+            project,
+            self.user.is_subscribed_to(project),
+            exclusive=False,
+        )
 
-            if user_has_any_hability:
-                is_subscribed = self.user.is_subscribed_to(project)
-                children.append(
-                    Container(
-                        Button(
-                            'Desinscrever-se'
-                            if is_subscribed
-                            else 'Inscrever-se',
-                            variant='error' if is_subscribed else 'success',
-                            id=f'{prefix}_subscribe_btn_{project.id}',
-                            classes='subscribe-button center',
-                        ),
-                        classes='btn-save-pw mt',
-                    )
-                )
-            else:
-                children.append(
-                    Static(
-                        '\n[i]Você não tem ao menos uma habilidade solicitada.[/i]',
-                        classes='text-center warning',
-                    )
-                )
+    @staticmethod
+    @QueryCounter('ProjectScreen.toggle_subscription', 2)
+    def _toggle_subscription(
+        use_case: SubscribeToProjectUseCase,
+        user_id: int,
+        project: Project,
+        subscribed: bool,
+    ) -> tuple[Project, bool, Optional[str]]:
+        """Uma escrita (e uma leitura se a inscrição for negada)."""
+        if subscribed:
+            _, err = use_case.cancel(user_id, project.id)
+        else:
+            _, err = use_case.execute(user_id, project.id)
+        return project, subscribed, err
+
+    @on(DataResult)
+    def on_data_result(self, message: DataResult) -> None:
+        if message.request == 'page':
+            self.query_one('#project-list', ProjectList).loading = False
+        if not message.ok:
+            self.notify(str(message.error), severity='error', title='Erro')
+            self._update_pagination_info()
+            self._update_subscribe_button()
+        elif message.request == 'page':
+            self._page_loaded(*message.result)
+        elif message.request == 'user':
+            self._user_loaded(*message.result)
+        elif message.request == 'subscription':
+            self._subscription_done(*message.result)
+        elif message.request == 'catalog':
+            self._catalog_refreshed(message.result)
+
+    def _catalog_refreshed(self, snapshot: CatalogSnapshot) -> None:
+        """Troca o snapshot, se o banco mudou, e redesenha a página."""
+        self._catalog_repo.snapshot = snapshot
+        if snapshot is self._catalog:
+            return
+        self._catalog = snapshot
+        self._page_cache.clear()
+        self._load_projects_page()
 
-        collapsible = Collapsible(
-            *children,
-            title=project.name,
-            id=f'{prefix}_project_{project.id}',
-            classes='input-margin-sm project-card',
-        )
-        collapsible.border_subtitle = (
-            f'{len(project.habilities)} habilidades necessárias'
-        )
-        return collapsible
+    def _user_loaded(self, user: Optional[User], projects: list[Project]):
+        if user is None:
+            return
+        self.user = user
+        for project_list in self.query(ProjectList):
+            project_list.set_user(user)
+        self.query_one('#my-projects-list', ProjectList).set_projects(projects)
+        self._update_subscribe_button()
+
+    def _subscription_done(
+        self, project: Project, subscribed: bool, err: Optional[str]
+    ) -> None:
+        """O usuário em memória acompanha o banco, sem reler nada."""
+        if err:
+            self.notify(err, severity='error', title='Inscrição negada')
+            self._update_subscribe_button()
+            return
+
+        my_projects = self.query_one('#my-projects-list', ProjectList)
+        if subscribed:
+            self.user.remove_project(project)
+            msg = 'Remoção realizada com sucesso.'
+            title = 'Cancelamento realizado'
+            my_projects.remove_project(project.id)
+        else:
+            self.user.add_project(project)
+            msg = 'A organização entrará em contato com você.'
+            title = 'Inscrição realizada com sucesso'
+            my_projects.add_project(project)
+
+        # Páginas guardadas (ou em carregamento) são anteriores à inscrição
+        self._page_cache.clear()
+        self._prefetch_neighbours()
+
+        for project_list in self.query(ProjectList):
+            project_list.refresh_project(project.id)
+        self._update_subscribe_button()
+        self.notify(msg, severity='information', title=title)
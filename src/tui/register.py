@@ -1,15 +1,30 @@
+from typing import Optional
+
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Label, Markdown
 
+from src.tui.workers import DataAccess, DataResult
 from src.use_cases import RegisterUserUseCase
 
 
 class RegisterScreen(Screen):
     """Tela de registro de usuário."""
 
+    def __init__(
+        self,
+        register_user_use_case: Optional[RegisterUserUseCase] = None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._register_uc = (
+            register_user_use_case or RegisterUserUseCase.factory()
+        )
+        self._data = DataAccess(self)
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         with Container(classes='bg with-border center'):
@@ -55,7 +70,29 @@ class RegisterScreen(Screen):
             )
             return
 
-        user, err = RegisterUserUseCase.factory().execute(email, password)
+        self._register(email, password)
+
+    def _register(self, email: str, password: str) -> None:
+        """
+        Registra o usuário em um worker de thread: o hash da senha e a
+        escrita rodam fora da interface, e o botão mostra um indicador de
+        progresso enquanto isso.
+        """
+        self.query_one('#register-button-screen', Button).loading = True
+        self._data.run(
+            'register',
+            self._register_uc,
+            RegisterUserUseCase.execute,
+            email,
+            password,
+        )
+
+    @on(DataResult)
+    def on_data_result(self, message: DataResult) -> None:
+        if message.request != 'register':
+            return
+        self.query_one('#register-button-screen', Button).loading = False
+        user, err = message.result if message.ok else (None, message.error)
 
         if err:
             self.notify(
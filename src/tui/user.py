@@ -1,7 +1,10 @@
+from typing import Optional
+
 from loguru import logger
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
+from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import (
     Button,
@@ -15,16 +18,23 @@ from textual.widgets import (
     Switch,
 )
 
-from src.models import Role, User
-from src.repositories import (
-    HabilityRepository,
-    ProjectRepository,
-    UserRepository,
+from src.container import ServiceContainer
+from src.events import (
+    HabilityAdded,
+    HabilityRemoved,
+    SubscriptionCreated,
+    SubscriptionRemoved,
 )
-from src.tui.admin import AdminScreen
-from src.tui.project import ProjectScreen
+from src.models import Hability, Role, User
+from src.repositories import HabilityRepository, UserRepository
+from src.tui.events import DomainEvent, listen
+from src.tui.prefix_index import PrefixIndex
+from src.tui.workers import DataAccess, DataResult
 from src.use_cases import ReplacePasswordUseCase, UpdateUserUseCase
 
+# Máximo de habilidades exibidas por busca
+SEARCH_LIMIT = 30
+
 
 class UserScreen(Screen):
     """Tela de perfil do usuário."""
@@ -33,6 +43,11 @@ class UserScreen(Screen):
         ('l', 'logout', 'Logout'),
     ]
 
+    # Contadores do perfil: atualizados pelos switches e pelos eventos de
+    # domínio, sem reler o usuário do banco
+    projects_count = reactive(0, init=False)
+    habilities_count = reactive(0, init=False)
+
     def __init__(
         self,
         user: User,
@@ -40,25 +55,41 @@ class UserScreen(Screen):
         hability_repository: HabilityRepository,
         update_user_use_case: UpdateUserUseCase,
         replace_password_use_case: ReplacePasswordUseCase,
+        habilities_data: dict[str, list[Hability]],
+        services: Optional[ServiceContainer] = None,
     ) -> None:
-        found_user = user_repository.get_by_id_with_all_relations(user.id)
-
-        if found_user is None:
-            self.app.pop_screen()
-            return
-
-        self.user: User = found_user
+        # O usuário (com as relações) e as habilidades por domínio chegam
+        # prontos, carregados fora da interface (ex.: pelo worker do login):
+        # a tela abre sem consultar o banco
+        self.user: User = user
 
-        self.habilities_data = hability_repository.get_dict_by_domain()
+        self.habilities_data = habilities_data
         # Cria um mapa de nome da habilidade para o objeto Hability para fácil acesso
+        # e um índice por prefixo para a busca
         self.hability_map = {
             hability.name: hability
             for domain_habilities in self.habilities_data.values()
             for hability in domain_habilities
         }
+        self.hability_index = PrefixIndex(
+            self.hability_map.values(), key=lambda hability: hability.name
+        )
+        self._habilities_by_id = {
+            hability.id: hability for hability in self.hability_map.values()
+        }
+        self._built_domains: set[str] = set()
+        self._project_ids = {project.id for project in self.user.projects}
         self._update_user_uc = update_user_use_case
         self._replace_password_uc = replace_password_use_case
+        # Serviços repassados às telas abertas a partir do perfil
+        self._services = services or ServiceContainer()
+        self._stop_listening = None
         super().__init__()
+        self._data = DataAccess(self)
+        self.set_reactive(UserScreen.projects_count, len(self._project_ids))
+        self.set_reactive(
+            UserScreen.habilities_count, len(self.user.habilities)
+        )
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -118,7 +149,7 @@ class UserScreen(Screen):
                         classes='small-input text-center mb1',
                     )
                     yield Digits(
-                        f'{len(self.user.projects)}',
+                        f'{self.projects_count}',
                         id='projects-count',
                         classes='small-input text-center',
                     )
@@ -129,7 +160,7 @@ class UserScreen(Screen):
                         classes='small-input text-center mb1',
                     )
                     yield Digits(
-                        f'{len(self.user.habilities)}',
+                        f'{self.habilities_count}',
                         id='habilities-count',
                         classes='small-input text-center',
                     )
@@ -157,20 +188,23 @@ class UserScreen(Screen):
                 yield Label(
                     '[b]Selecione suas habilidades: [/]', classes='text'
                 )
-                with VerticalScroll(classes='center h-auto input-margin'):
-                    for domain in self.habilities_data.keys():
-                        with Collapsible(title=domain):
-                            for hability in self.habilities_data[domain]:
-                                yield Horizontal(
-                                    Switch(
-                                        value=self.user.has_hability(hability),
-                                        name=hability.name,
-                                    ),
-                                    Static(
-                                        hability.name, classes='label-switch'
-                                    ),
-                                    classes='container',
-                                )
+                yield Input(
+                    placeholder='🔎  Buscar habilidade...',
+                    id='hability-search',
+                    classes='input-margin-sm',
+                )
+                yield Container(id='hability-results', classes='h-auto hidden')
+                with VerticalScroll(
+                    id='hability-domains', classes='center h-auto input-margin'
+                ):
+                    # Os switches de um domínio só são montados quando ele
+                    # é expandido (`build_domain`)
+                    for domain, habilities in self.habilities_data.items():
+                        yield Collapsible(
+                            title=f'{domain} ({len(habilities)})',
+                            name=domain,
+                            classes='domain-section',
+                        )
 
             with Container(classes='buttons'):
                 yield Button(
@@ -190,28 +224,17 @@ class UserScreen(Screen):
     @on(Button.Pressed)
     def on_button_pressed(self, event: Button.Pressed):
         if event.button.id == 'save-button':
-
-            updated_user = self._update_user_uc.execute(
+            event.button.loading = True
+            self._data.run(
+                'save-profile',
+                self._update_user_uc,
+                UpdateUserUseCase.execute,
                 id=self.user.id,
                 first_name=self.query_one('#first-name').value,
                 last_name=self.query_one('#last-name').value,
                 birth_date=self.query_one('#birth-date').value,
-                habilities=self.user.habilities,
-            )
-
-            if updated_user:
-                self.user = updated_user
-
-            self.query_one('#projects-count').update(
-                f'{len(self.user.projects)}'
-            )
-            self.query_one('#habilities-count').update(
-                f'{len(self.user.habilities)}'
-            )
-            self.notify(
-                f'✅ alterações salvas com sucesso!',
-                title='🤓 ☝️  Informações salvas 💾',
-                severity='information',
+                habilities=list(self.user.habilities),
+                exclusive=False,
             )
 
         elif event.button.id == 'save-password-button':
@@ -223,32 +246,171 @@ class UserScreen(Screen):
                 self.query_one('#output-pw').update('As senhas não conferem!')
                 return
 
-            _, err = self._replace_password_uc.execute(
-                id=self.user.id, new_password=new_password
+            event.button.loading = True
+            self._data.run(
+                'replace-password',
+                self._replace_password_uc,
+                ReplacePasswordUseCase.execute,
+                id=self.user.id,
+                new_password=new_password,
+                exclusive=False,
             )
 
-            if err:
-                self.query_one('#output-pw').update(err)
-                return
-
-            self.query_one('#output-pw').update('Senha alterada com sucesso!')
-
         elif event.button.id == 'projects-button':
+            # Importadas só quando abertas, para não pesar no início do app
+            from src.tui.project import ProjectScreen
+
             self.app.push_screen(
                 ProjectScreen(
                     user=self.user,
-                    user_repository=UserRepository(),
-                    project_repository=ProjectRepository(),
+                    user_repository=self._services.user_repository,
+                    project_repository=self._services.project_repository,
+                    subscribe_use_case=self._services.subscribe_use_case,
                 )
             )
 
         elif event.button.id == 'admin-button':
-            self.app.push_screen(AdminScreen(user_logged=self.user))
+            from src.tui.admin import AdminScreen
+
+            self.app.push_screen(
+                AdminScreen(user_logged=self.user, services=self._services)
+            )
+
+    @on(DataResult)
+    def on_data_result(self, message: DataResult) -> None:
+        if message.request == 'save-profile':
+            self.query_one('#save-button', Button).loading = False
+            if not message.ok:
+                self.notify(
+                    f'❌ Erro ao salvar: {message.error}', severity='error'
+                )
+                return
+
+            updated_user = message.result
+            if updated_user:
+                self.user = updated_user
+                self._project_ids = {p.id for p in self.user.projects}
+                self.projects_count = len(self._project_ids)
+                self.habilities_count = len(self.user.habilities)
+
+            self.notify(
+                f'✅ alterações salvas com sucesso!',
+                title='🤓 ☝️  Informações salvas 💾',
+                severity='information',
+            )
+
+        elif message.request == 'replace-password':
+            self.query_one('#save-password-button', Button).loading = False
+            _, err = message.result if message.ok else (None, message.error)
+            if err:
+                self.query_one('#output-pw').update(str(err))
+                return
+
+            self.query_one('#output-pw').update('Senha alterada com sucesso!')
+
+    def on_mount(self) -> None:
+        self._stop_listening = listen(
+            self,
+            HabilityAdded,
+            HabilityRemoved,
+            SubscriptionCreated,
+            SubscriptionRemoved,
+        )
+
+    def on_unmount(self) -> None:
+        if self._stop_listening is not None:
+            self._stop_listening()
+
+    def watch_projects_count(self, count: int) -> None:
+        self.query_one('#projects-count', Digits).update(f'{count}')
+
+    def watch_habilities_count(self, count: int) -> None:
+        self.query_one('#habilities-count', Digits).update(f'{count}')
+
+    @on(DomainEvent)
+    def apply_domain_event(self, message: DomainEvent) -> None:
+        """
+        Reflete nos contadores as mudanças do usuário feitas em outras
+        telas (ex.: inscrições na `ProjectScreen`).
+        """
+        event = message.event
+        if event.user_id != self.user.id:
+            return
+        if isinstance(event, SubscriptionCreated):
+            self._project_ids.add(event.project_id)
+            self.projects_count = len(self._project_ids)
+        elif isinstance(event, SubscriptionRemoved):
+            self._project_ids.discard(event.project_id)
+            self.projects_count = len(self._project_ids)
+        else:
+            hability = self._habilities_by_id.get(event.hability_id)
+            added = isinstance(event, HabilityAdded)
+            if hability is None or self.user.has_hability(hability) == added:
+                return
+            if added:
+                self.user.add_hability(hability)
+            else:
+                self.user.remove_hability(hability)
+            self.habilities_count = len(self.user.habilities)
+            self._sync_switches(hability.name, added)
+
+    def _sync_switches(
+        self, hability_name: str, value: bool, source: Optional[Switch] = None
+    ) -> None:
+        """Põe os switches montados da habilidade no mesmo valor."""
+        for switch in self.query(Switch):
+            if switch is not source and switch.name == hability_name:
+                with switch.prevent(Switch.Changed):
+                    switch.value = value
 
     @on(Button.Pressed, '#logout-button')
     def action_logout(self) -> None:
         self.app.pop_screen()
 
+    def _switch_row(self, hability: Hability) -> Horizontal:
+        return Horizontal(
+            Switch(
+                value=self.user.has_hability(hability),
+                name=hability.name,
+            ),
+            Static(hability.name, classes='label-switch'),
+            classes='container',
+        )
+
+    @on(Collapsible.Expanded, '.domain-section')
+    def build_domain(self, event: Collapsible.Expanded) -> None:
+        """Monta os switches de um domínio na primeira vez que ele abre."""
+        domain = event.collapsible.name
+        if domain in self._built_domains:
+            return
+        self._built_domains.add(domain)
+        event.collapsible.query_one(Collapsible.Contents).mount_all(
+            self._switch_row(hability)
+            for hability in self.habilities_data[domain]
+        )
+
+    @on(Input.Changed, '#hability-search')
+    def search_habilities(self, event: Input.Changed) -> None:
+        """
+        Filtra as habilidades pelo índice em memória. Com a busca vazia,
+        volta a mostrar os domínios.
+        """
+        results = self.query_one('#hability-results', Container)
+        results.remove_children()
+        searching = bool(event.value.strip())
+        results.set_class(not searching, 'hidden')
+        self.query_one('#hability-domains').set_class(searching, 'hidden')
+        if not searching:
+            return
+
+        found = self.hability_index.search(event.value, limit=SEARCH_LIMIT)
+        if not found:
+            results.mount(
+                Label('Nenhuma habilidade encontrada.', classes='text')
+            )
+            return
+        results.mount_all(self._switch_row(hability) for hability in found)
+
     @on(Switch.Changed)
     def on_switch_changed(self, event: Switch.Changed) -> None:
         """Chamado quando o estado de um Switch de habilidade muda."""
@@ -261,3 +423,7 @@ class UserScreen(Screen):
                 self.user.add_hability(hability)
             else:  # Switch foi desativado
                 self.user.remove_hability(hability)
+
+            self.habilities_count = len(self.user.habilities)
+            # A mesma habilidade pode estar na busca e no seu domínio
+            self._sync_switches(hability_name, event.value, event.switch)
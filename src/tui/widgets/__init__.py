@@ -0,0 +1,2 @@
+from .entity_browser import EntityBrowser
+from .project_list import ProjectList
@@ -0,0 +1,257 @@
+import re
+import sqlite3
+from functools import partial
+from typing import Any, Callable, Optional
+
+from rich.text import Text
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.message import Message
+from textual.timer import Timer
+from textual.widgets import Button, DataTable, Input, Static
+from textual.worker import Worker, get_current_worker
+
+from src.repositories import BaseRepository
+from src.tui.workers import query_in_worker
+
+# Linhas por página: a tabela nunca tem mais que isso, qualquer que seja o
+# tamanho da tabela no banco
+PAGE_SIZE = 20
+SEARCH_DEBOUNCE = 0.3
+# '#123' vai direto para o registro de id 123
+JUMP_PATTERN = re.compile(r'#\s*(\d+)')
+
+
+class EntityBrowser(Vertical):
+    """
+    Tabela paginada dos registros de um repositório, para escolher um.
+
+    As páginas vêm de `find_keyset` (paginação por id, sem OFFSET) em um
+    worker, com busca no banco pelas `search_columns` do repositório.
+    Digitar `#<id>` na busca abre a página que começa nesse registro.
+    Escolher uma linha (Enter ou clique) posta `EntityBrowser.Selected`.
+    """
+
+    class Selected(Message):
+        """Um registro foi escolhido na tabela."""
+
+        def __init__(self, browser: 'EntityBrowser', entity_id: int):
+            self.browser = browser
+            self.entity_id = entity_id
+            super().__init__()
+
+        @property
+        def control(self) -> 'EntityBrowser':
+            return self.browser
+
+    def __init__(
+        self,
+        repository: BaseRepository,
+        columns: list[tuple[str, Callable[[Any], object]]],
+        page_size: int = PAGE_SIZE,
+        *,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+    ):
+        super().__init__(id=id, classes=classes)
+        self.repository = repository
+        self.columns = columns
+        self.page_size = page_size
+        self.selected_id: Optional[int] = None
+        self.loaded = False
+        self._search: Optional[str] = None
+        # A página atual são os ids depois de `_after_id`, até `_last_id`
+        self._after_id = 0
+        self._last_id = 0
+        self._has_next = False
+        self._search_timer: Optional[Timer] = None
+
+    def compose(self) -> ComposeResult:
+        yield Input(
+            placeholder='🔎  Buscar... (#id vai direto ao registro)',
+            classes='entity-search input-margin-sm',
+        )
+        yield DataTable(cursor_type='row', zebra_stripes=True)
+        with Horizontal(classes='entity-pager'):
+            yield Button('←', classes='entity-prev page-button')
+            yield Static('', classes='entity-info text-center')
+            yield Button('→', classes='entity-next page-button')
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns('ID', *(label for label, _ in self.columns))
+
+    def load(self) -> None:
+        """Carrega a primeira página, na primeira vez que é chamado."""
+        if not self.loaded:
+            self.loaded = True
+            self.loading = True
+            self._fetch(after_id=0)
+
+    def upsert(self, entity: Any) -> None:
+        """
+        Atualiza a linha de um registro alterado, ou acrescenta um registro
+        novo se ele cair na página atual, sem consultar o banco.
+        """
+        if not self.loaded:
+            return
+        table = self.query_one(DataTable)
+        key = str(entity.id)
+        cells = self._cells(entity)
+        if key in table.rows:
+            for column_key, value in zip(table.columns, cells):
+                table.update_cell(key, column_key, value)
+            return
+
+        # Não dá para saber, sem o banco, se o registro casa com a busca.
+        # Ids novos são os maiores: só entram no fim da última página.
+        if self._search or self._has_next:
+            return
+        if table.row_count >= self.page_size:
+            self._has_next = True
+            self.query_one('.entity-next', Button).disabled = False
+            return
+        table.add_row(*cells, key=key)
+        self._last_id = max(self._last_id, entity.id)
+
+    def remove(self, entity_id: int) -> None:
+        """Tira a linha de um registro removido, sem consultar o banco."""
+        if self.selected_id == entity_id:
+            self.selected_id = None
+        table = self.query_one(DataTable)
+        if str(entity_id) in table.rows:
+            table.remove_row(str(entity_id))
+
+    def jump_to(self, entity_id: int) -> None:
+        """Abre a página que começa no registro `entity_id`."""
+        self._search = None
+        self._fetch(after_id=entity_id - 1, highlight=entity_id)
+
+    @work(thread=True, exclusive=True, group='entity-page')
+    def _fetch(
+        self,
+        after_id: int = 0,
+        before_id: Optional[int] = None,
+        highlight: Optional[int] = None,
+    ) -> None:
+        # Um registro a mais diz se há outra página na mesma direção
+        query = partial(
+            type(self.repository).find_keyset,
+            after_id=after_id,
+            limit=self.page_size + 1,
+            search=self._search,
+            before_id=before_id,
+        )
+        worker = get_current_worker()
+        try:
+            rows = query_in_worker(self.app, self.repository, query)
+        except sqlite3.Error as error:
+            self.app.call_from_thread(
+                self._if_current, worker, self._show_error, error
+            )
+            return
+
+        if before_id is None:
+            has_prev = after_id > 0
+            has_next = len(rows) > self.page_size
+            rows = rows[: self.page_size]
+        else:
+            has_prev = len(rows) > self.page_size
+            has_next = True
+            rows = rows[-self.page_size :]
+            if rows:
+                after_id = rows[0].id - 1
+        self.app.call_from_thread(
+            self._if_current,
+            worker,
+            self._show_page,
+            rows,
+            after_id,
+            has_prev,
+            has_next,
+            highlight,
+        )
+
+    @staticmethod
+    def _if_current(worker: Worker, callback: Callable, *args) -> None:
+        # Na thread da interface, onde uma página ou busca mais nova
+        # cancela o worker: o resultado dele não sobrescreve o novo
+        if not worker.is_cancelled:
+            callback(*args)
+
+    def _show_error(self, error: sqlite3.Error) -> None:
+        self.loading = False
+        self.notify(str(error), severity='error', title='Erro')
+
+    def _show_page(
+        self,
+        rows: list,
+        after_id: int,
+        has_prev: bool,
+        has_next: bool,
+        highlight: Optional[int],
+    ) -> None:
+        self._after_id = after_id
+        self._last_id = rows[-1].id if rows else after_id
+        self._has_next = has_next
+        table = self.query_one(DataTable)
+        table.clear()
+        for row in rows:
+            table.add_row(*self._cells(row), key=str(row.id))
+        if highlight is not None and str(highlight) in table.rows:
+            table.move_cursor(row=table.get_row_index(str(highlight)))
+
+        info = 'Nenhum registro'
+        if rows:
+            info = f'#{rows[0].id} – #{rows[-1].id}'
+        if self._search:
+            info += f' · busca: {self._search}'
+        self.query_one('.entity-info', Static).update(Text(info))
+        self.query_one('.entity-prev', Button).disabled = not has_prev
+        self.query_one('.entity-next', Button).disabled = not (
+            has_next and rows
+        )
+        self.loading = False
+
+    def _cells(self, entity: Any) -> list:
+        return [
+            str(entity.id),
+            *(Text(str(render(entity) or '')) for _, render in self.columns),
+        ]
+
+    @on(Button.Pressed, '.entity-prev')
+    def _prev_page(self, event: Button.Pressed) -> None:
+        event.stop()
+        # Pelos ids guardados, e não pelas linhas: elas podem ter sido
+        # removidas todas
+        self._fetch(before_id=self._after_id + 1)
+
+    @on(Button.Pressed, '.entity-next')
+    def _next_page(self, event: Button.Pressed) -> None:
+        event.stop()
+        self._fetch(after_id=self._last_id)
+
+    @on(Input.Changed, '.entity-search')
+    def _schedule_search(self, event: Input.Changed) -> None:
+        event.stop()
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(
+            SEARCH_DEBOUNCE, partial(self._apply_search, event.value.strip())
+        )
+
+    def _apply_search(self, term: str) -> None:
+        self._search_timer = None
+        jump = JUMP_PATTERN.fullmatch(term)
+        if jump:
+            self.jump_to(int(jump.group(1)))
+            return
+        self._search = term or None
+        self._fetch(after_id=0)
+
+    @on(DataTable.RowSelected)
+    def _select_row(self, event: DataTable.RowSelected) -> None:
+        event.stop()
+        self.selected_id = int(event.row_key.value)
+        self.post_message(self.Selected(self, self.selected_id))
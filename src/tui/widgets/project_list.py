@@ -0,0 +1,138 @@
+from typing import Optional
+
+from textual import on
+from textual.markup import escape
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
+
+from src.models import Project, User
+
+
+class ProjectList(OptionList):
+    """
+    Lista virtualizada de projetos.
+
+    Cada projeto é uma opção de uma `OptionList`: só as linhas visíveis são
+    renderizadas e nenhum widget é criado por projeto. Os detalhes do card
+    (descrição e habilidades) só são montados quando ele é expandido com
+    Enter ou clique, e ficam em cache até o projeto mudar.
+    """
+
+    def __init__(self, *args, user: Optional[User] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+        self._projects: dict[int, Project] = {}
+        self._expanded: set[int] = set()
+        self._details: dict[int, str] = {}
+
+    @property
+    def highlighted_project(self) -> Optional[Project]:
+        option = self.highlighted_option
+        return self._projects.get(int(option.id)) if option else None
+
+    def set_projects(self, projects: list[Project]) -> None:
+        """Substitui os projetos exibidos (ex.: ao trocar de página)."""
+        self._projects = {project.id: project for project in projects}
+        self._expanded.clear()
+        self._details.clear()
+        self.set_options(
+            Option(self._summary(project), id=str(project.id))
+            for project in projects
+        )
+        if projects:
+            self.highlighted = 0
+
+    def add_project(self, project: Project) -> None:
+        if project.id in self._projects:
+            return
+        self._projects[project.id] = project
+        self.add_option(Option(self._summary(project), id=str(project.id)))
+
+    def add_projects(self, projects: list[Project]) -> None:
+        """Acrescenta projetos ao fim da lista (ex.: resultados de busca)."""
+        was_empty = not self._projects
+        projects = [p for p in projects if p.id not in self._projects]
+        self._projects.update((project.id, project) for project in projects)
+        self.add_options(
+            Option(self._summary(project), id=str(project.id))
+            for project in projects
+        )
+        if was_empty and projects:
+            self.highlighted = 0
+
+    def remove_project(self, project_id: int) -> None:
+        if self._projects.pop(project_id, None) is None:
+            return
+        self._expanded.discard(project_id)
+        self._details.pop(project_id, None)
+        self.remove_option(str(project_id))
+
+    def set_user(self, user: Optional[User]) -> None:
+        """Troca o usuário (ex.: recarregado do banco) e redesenha os cards."""
+        self.user = user
+        self._details.clear()
+        for project_id in self._projects:
+            self._render_prompt(project_id)
+
+    def refresh_project(self, project_id: int) -> None:
+        """Redesenha o card após uma mudança (ex.: inscrição)."""
+        if project_id not in self._projects:
+            return
+        self._details.pop(project_id, None)
+        self._render_prompt(project_id)
+
+    def toggle(self, project_id: int) -> None:
+        """Expande ou recolhe o card do projeto."""
+        if project_id in self._expanded:
+            self._expanded.remove(project_id)
+        else:
+            self._expanded.add(project_id)
+        self._render_prompt(project_id)
+
+    @on(OptionList.OptionSelected)
+    def _toggle_selected(self, event: OptionList.OptionSelected) -> None:
+        self.toggle(int(event.option_id))
+
+    def _render_prompt(self, project_id: int) -> None:
+        project = self._projects[project_id]
+        if project_id in self._expanded:
+            if project_id not in self._details:
+                self._details[project_id] = self._detail(project)
+            prompt = self._details[project_id]
+        else:
+            prompt = self._summary(project)
+        self.replace_option_prompt(str(project_id), prompt)
+
+    def _summary(self, project: Project) -> str:
+        subscribed = (
+            '  [green]✔ inscrito[/]'
+            if self.user and self.user.is_subscribed_to(project)
+            else ''
+        )
+        return (
+            f'▶ [b]{escape(project.name)}[/]  [dim]· {len(project.habilities)} '
+            f'habilidades necessárias[/]{subscribed}'
+        )
+
+    def _detail(self, project: Project) -> str:
+        lines = [
+            self._summary(project).replace('▶', '▼', 1),
+            f'   {escape(project.description or "")}',
+            '   [b]Habilidades Necessárias:[/b]',
+        ]
+        for hability in project.habilities:
+            has_it = self.user.has_hability(hability) if self.user else False
+            lines.append(
+                f"     {'✅' if has_it else '❌'} {escape(hability.name)}"
+            )
+        if self.user and not self.can_subscribe(project):
+            lines.append(
+                '   [i]Você não tem ao menos uma habilidade solicitada.[/i]'
+            )
+        return '\n'.join(lines) + '\n'
+
+    def can_subscribe(self, project: Project) -> bool:
+        """O usuário precisa ter ao menos uma das habilidades do projeto."""
+        return bool(self.user) and any(
+            self.user.has_hability(h) for h in project.habilities
+        )
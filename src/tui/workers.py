@@ -0,0 +1,195 @@
+"""
+Consultas feitas por workers de thread do Textual.
+
+Uma conexão SQLite não deve ser usada por duas threads ao mesmo tempo:
+cada worker abre a sua (`Database.thread_connection`) e a fecha ao
+terminar. Bancos em memória não podem ser abertos por outra conexão;
+nesse caso a consulta volta para a thread da interface.
+"""
+import copy
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from textual.app import App
+from textual.dom import DOMNode
+from textual.message import Message
+from textual.worker import Worker, get_current_worker
+
+from src.repositories import BaseRepository
+from src.repositories.database import Database
+
+R = TypeVar('R')
+T = TypeVar('T')
+
+# Por thread: quantos `worker_connection` estão abertos, a conexão deles
+# e as cópias já ligadas a ela (`bind_to_connection`)
+_scopes = threading.local()
+
+
+@contextmanager
+def worker_connection() -> Iterator[Optional[sqlite3.Connection]]:
+    """
+    Conexão da thread atual, ou None se o banco estiver em memória. Ela é
+    fechada quando o `with` mais externo da thread termina: um worker com
+    várias consultas usa uma só conexão, e nenhuma fica aberta depois.
+    As cópias ligadas a ela por `bind_to_connection` também valem até lá.
+    """
+    database = Database()
+    conn = database.thread_connection()
+    if conn is database.connection:
+        yield None
+        return
+    depth = getattr(_scopes, 'depth', 0)
+    if depth == 0:
+        _scopes.conn, _scopes.bound = conn, {}
+    _scopes.depth = depth + 1
+    try:
+        yield conn
+    finally:
+        _scopes.depth = depth
+        if depth == 0:
+            _scopes.conn = _scopes.bound = None
+            database.close_thread_connection()
+
+
+def query_in_worker(app: App, repository: R, query: Callable[[R], T]) -> T:
+    """
+    Roda `query` de dentro de um worker de thread, sobre uma cópia de
+    `repository` ligada à conexão da thread. Em bancos em memória, roda
+    com o próprio `repository` na thread da interface.
+    """
+    with worker_connection() as conn:
+        if conn is None:
+            return app.call_from_thread(query, repository)
+        return query(bind_to_connection(repository, conn))
+
+
+def bind_to_connection(
+    target: R, conn: sqlite3.Connection, _memo: Optional[dict] = None
+) -> R:
+    """
+    Retorna `target` (um repositório, um caso de uso ou uma tupla deles)
+    com os repositórios trocados por cópias ligadas a `conn`. Objetos que
+    guardam repositórios são copiados raso: a cópia referencia os mesmos
+    atributos mutáveis (ex.: o lock, os baldes e os contadores do
+    `LoginThrottle`), mas atribuições a atributos imutáveis da cópia não
+    chegam ao original. Os demais objetos são os mesmos.
+
+    Dentro de um `worker_connection` com `conn`, as cópias são guardadas
+    até a conexão fechar: um worker que faz várias chamadas com o mesmo
+    alvo monta os repositórios uma vez só.
+    """
+    memo = _memo
+    if memo is None:
+        if getattr(_scopes, 'conn', None) is conn:
+            memo = _scopes.bound
+        else:
+            memo = {}
+    if id(target) in memo:
+        return memo[id(target)][1]
+    # O alvo fica guardado junto, para que o seu id não seja reutilizado
+    # por outro objeto enquanto a entrada existir
+    memo[id(target)] = (target, target)  # referências circulares
+
+    bound = target
+    if isinstance(target, BaseRepository):
+        bound = type(target)(db_connection=conn)
+    elif isinstance(target, tuple):
+        items = tuple(bind_to_connection(item, conn, memo) for item in target)
+        if any(new is not old for new, old in zip(items, target)):
+            bound = items
+    elif type(target).__module__.startswith('src.') and hasattr(
+        target, '__dict__'
+    ):
+        changed = {}
+        for name, value in vars(target).items():
+            new = bind_to_connection(value, conn, memo)
+            if new is not value:
+                changed[name] = new
+        if changed:
+            bound = copy.copy(target)
+            vars(bound).update(changed)
+
+    memo[id(target)] = (target, bound)
+    return bound
+
+
+class DataResult(Message):
+    """Resultado (ou erro) de uma chamada feita por `DataAccess.run`."""
+
+    bubble = False  # só a tela que fez o pedido o trata
+
+    def __init__(
+        self,
+        request: str,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        self.request = request
+        self.result = result
+        self.error = error
+        super().__init__()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DataAccess:
+    """
+    Fachada de acesso a dados de uma tela: roda chamadas a repositórios e
+    casos de uso em workers de thread, cada um com a sua conexão, e
+    entrega o resultado à tela como uma mensagem `DataResult`.
+
+    Cada pedido tem um nome (`request`). Por padrão um pedido novo cancela
+    o anterior de mesmo nome; escritas passam `exclusive=False`, para que
+    nenhuma tenha o resultado descartado. Os workers pertencem à tela:
+    ao sair dela, o Textual os cancela e os resultados que chegarem
+    depois são descartados.
+    """
+
+    def __init__(self, node: DOMNode):
+        self._node = node
+
+    def run(
+        self,
+        request: str,
+        target: R,
+        call: Callable[..., T],
+        *args: Any,
+        exclusive: bool = True,
+        **kwargs: Any,
+    ) -> Worker:
+        """Roda `call(target, *args, **kwargs)` em um worker de thread."""
+        return self._node.run_worker(
+            partial(
+                self._call, request, target, partial(call, **kwargs), args
+            ),
+            name=request,
+            group=f'data:{request}',
+            thread=True,
+            exclusive=exclusive,
+        )
+
+    def cancel(self, request: str) -> None:
+        self._node.workers.cancel_group(self._node, f'data:{request}')
+
+    def _call(
+        self, request: str, target: R, call: Callable[..., T], args: tuple
+    ) -> None:
+        try:
+            with worker_connection() as conn:
+                if conn is None:
+                    result = self._node.app.call_from_thread(
+                        call, target, *args
+                    )
+                else:
+                    result = call(bind_to_connection(target, conn), *args)
+            message = DataResult(request, result)
+        except Exception as error:
+            message = DataResult(request, error=error)
+        if not get_current_worker().is_cancelled:
+            self._node.post_message(message)
@@ -1,5 +1,6 @@
 from .login import LoginUseCase
 from .register import RegisterUserUseCase
 from .replace_password import ReplacePasswordUseCase
+from .subscribe import SubscribeToProjectUseCase
 from .update_project import UpdateProjectUseCase
 from .update_user import UpdateUserUseCase
@@ -1,8 +1,12 @@
+import sqlite3
+from math import ceil
 from typing import Optional
 
+from loguru import logger
+
 from src.models.users import User
-from src.repositories import UserRepository
-from src.security import PasswordManager
+from src.repositories import LoginAttemptRepository, UserRepository
+from src.security import LoginThrottle, PasswordManager
 
 
 class LoginUseCase:
@@ -10,25 +14,80 @@ class LoginUseCase:
         self,
         user_repository: UserRepository,
         password_manager: PasswordManager,
+        throttle: Optional[LoginThrottle] = None,
     ):
         self.user_repository = user_repository
         self.password_manager = password_manager
+        self.throttle = throttle
 
     def execute(
         self, email: str, password: str
     ) -> tuple[Optional[User], Optional[str]]:
+        err = self._check_throttle(email)
+        if err:
+            return None, err
+
         user = self.user_repository.get_by_email(email)
 
         msg = 'Credenciais inválidas.'
 
         if user is None:
+            self._record(email, success=False, persist=False)
             return None, msg
 
         if self.password_manager.check_password(password, user):
+            if self.password_manager.needs_rehash(user):
+                new_hash, new_salt = self.password_manager.hash_password(
+                    password
+                )
+                self._store_rehash(user, new_hash, new_salt)
+            self._record(email, success=True)
             return user, None
         else:
+            self._record(email, success=False)
             return None, msg
 
+    def _check_throttle(self, email: str) -> Optional[str]:
+        """Rejeita a tentativa antes de qualquer derivação de chave."""
+        if self.throttle is None:
+            return None
+        allowed, retry_after = self.throttle.check(email)
+        if allowed:
+            return None
+        return (
+            'Muitas tentativas de login. '
+            f'Tente novamente em {ceil(retry_after)}s.'
+        )
+
+    def _record(self, email: str, success: bool, persist: bool = True) -> None:
+        if self.throttle is None:
+            return
+        if success:
+            self.throttle.record_success(email)
+        else:
+            self.throttle.record_failure(email, persist=persist)
+
+    def _store_rehash(self, user: User, new_hash, new_salt) -> None:
+        """
+        Regrava a senha com os parâmetros atuais quando o hash armazenado
+        está no formato antigo ou com custo desatualizado. Se a escrita
+        falhar (ex.: banco travado), o login segue com o hash antigo, que
+        é regravado numa próxima vez.
+        """
+        try:
+            self.user_repository.update_password(user.id, new_hash, new_salt)
+        except sqlite3.Error as e:
+            logger.warning(
+                f'Senha do user_id {user.id} não foi regravada: {e}'
+            )
+            return
+        user.password = new_hash
+        user.salt = new_salt
+
     @staticmethod
     def factory():
-        return LoginUseCase(UserRepository(), PasswordManager())
+        return LoginUseCase(
+            UserRepository(),
+            PasswordManager(),
+            LoginThrottle(LoginAttemptRepository()),
+        )
@@ -1,10 +1,18 @@
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
-from src.models import User
+from src.models import Role, User
 from src.repositories import UserRepository
 from src.security import PasswordManager
 from src.validators import email_validator, password_validator
 
+# Campos opcionais aceitos no registro em lote
+BULK_OPTIONAL_FIELDS = (
+    'first_name',
+    'last_name',
+    'birth_date',
+    'phone',
+)
+
 
 class RegisterUserUseCase:
     def __init__(
@@ -22,22 +30,125 @@ class RegisterUserUseCase:
     def execute(
         self, email: str, password: str
     ) -> tuple[Optional[User], Optional[Exception]]:
+        err = self._validate(email, password)
+        if err:
+            return None, err
+
+        hash_password, salt = self._password_manager.hash_password(password)
+        return self._create_user(email, hash_password, salt), None
+
+    async def execute_async(
+        self, email: str, password: str
+    ) -> tuple[Optional[User], Optional[Exception]]:
+        """
+        Igual a `execute`, mas o hash da senha (scrypt) roda fora do event
+        loop, para não congelar a interface.
+        """
+        err = self._validate(email, password)
+        if err:
+            return None, err
+
+        hash_password, salt = await self._password_manager.hash_password_async(
+            password
+        )
+        return self._create_user(email, hash_password, salt), None
+
+    def execute_many(
+        self,
+        records: Iterable[dict],
+        max_workers: Optional[int] = None,
+        allow_roles: bool = False,
+    ) -> tuple[list[User], list[dict]]:
+        """
+        Registra vários usuários de uma vez (ex.: planilha de voluntários).
+
+        Cada registro traz `email` e `password` e, opcionalmente,
+        `first_name`, `last_name`, `birth_date` e `phone`. O `role` só é
+        aceito com `allow_roles=True`, que cabe a chamadas de
+        administradores; sem isso, linhas com um papel diferente de
+        `Role.USER` vão para o relatório de erros. Valida tudo primeiro,
+        verifica e-mails já cadastrados em uma única query, gera os hashes
+        em paralelo e insere todos em uma transação.
 
+        Retorna os usuários criados e um relatório de erros por linha:
+        `{'row': índice, 'email': ..., 'error': ValueError(...)}`.
+        """
+        records = list(records)
+        errors: list[dict] = []
+        valid_rows: list[tuple[int, dict]] = []
+        seen_emails: set[str] = set()
+
+        for row, record in enumerate(records):
+            email = record.get('email')
+            err = self._validate_format(email, record.get('password'))
+            if err is None and not allow_roles:
+                if record.get('role', Role.USER) != Role.USER:
+                    err = ValueError('Papel não permitido no registro')
+            if err is None and email in seen_emails:
+                err = ValueError('E-mail duplicado no lote')
+            if err:
+                errors.append({'row': row, 'email': email, 'error': err})
+                continue
+            seen_emails.add(email)
+            valid_rows.append((row, record))
+
+        existing = self._user_repository.find_existing_emails(
+            [record['email'] for _, record in valid_rows]
+        )
+        to_create = []
+        for row, record in valid_rows:
+            if record['email'] in existing:
+                errors.append(
+                    {
+                        'row': row,
+                        'email': record['email'],
+                        'error': ValueError('Usuário já existe'),
+                    }
+                )
+            else:
+                to_create.append(record)
+
+        hashes = self._password_manager.hash_passwords(
+            [record['password'] for record in to_create], max_workers
+        )
+        fields = BULK_OPTIONAL_FIELDS + (('role',) if allow_roles else ())
+        users = [
+            User(
+                email=record['email'],
+                password=hash_password,
+                salt=salt,
+                **{key: record[key] for key in fields if key in record},
+            )
+            for record, (hash_password, salt) in zip(to_create, hashes)
+        ]
+
+        self._user_repository.save_many(users)
+        errors.sort(key=lambda error: error['row'])
+        return users, errors
+
+    def _validate(self, email: str, password: str) -> Optional[Exception]:
         if self._user_repository.exists(email):
-            return None, ValueError('Usuário já existe')
+            return ValueError('Usuário já existe')
+
+        return self._validate_format(email, password)
 
+    def _validate_format(
+        self, email: str, password: str
+    ) -> Optional[Exception]:
         valid, msg = self._email_validator(email)
         if not valid:
-            return None, ValueError(msg)
+            return ValueError(msg)
 
         valid, msg = self._password_validator(password)
         if not valid:
-            return None, ValueError(msg)
+            return ValueError(msg)
 
-        hash_password, salt = self._password_manager.hash_password(password)
+        return None
+
+    def _create_user(self, email: str, hash_password, salt) -> User:
         user = User(email=email, password=hash_password, salt=salt)
         self._user_repository.save(user)
-        return user, None
+        return user
 
     @staticmethod
     def factory():
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from src.events import EventBus, SubscriptionCreated, SubscriptionRemoved, bus
+from src.repositories import UserRepository
+
+NO_SHARED_HABILITY = 'Você não tem ao menos uma habilidade solicitada.'
+
+
+class SubscribeToProjectUseCase:
+    """
+    Caso de uso para inscrever um usuário em um projeto (e cancelar a
+    inscrição). A regra de ter ao menos uma habilidade pedida pelo projeto
+    é verificada no próprio INSERT. Cada inscrição criada ou removida é
+    publicada no barramento de eventos.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        events: Optional[EventBus] = None,
+    ):
+        self._user_repository = user_repository
+        self._events = events or bus
+
+    def execute(
+        self, user_id: int, project_id: int
+    ) -> tuple[bool, str | None]:
+        if self._user_repository.subscribe(user_id, project_id):
+            self._events.publish(SubscriptionCreated(user_id, project_id))
+            return True, None
+
+        # Nada inserido: ou já estava inscrito, ou falta a habilidade
+        if self._user_repository.is_subscribed(user_id, project_id):
+            return True, None
+        return False, NO_SHARED_HABILITY
+
+    def cancel(self, user_id: int, project_id: int) -> tuple[bool, None]:
+        if self._user_repository.unsubscribe(user_id, project_id):
+            self._events.publish(SubscriptionRemoved(user_id, project_id))
+        return True, None
+
+    @staticmethod
+    def factory():
+        return SubscribeToProjectUseCase(UserRepository())
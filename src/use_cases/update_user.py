@@ -1,10 +1,18 @@
+from typing import Optional
+
+from src.events import EventBus, HabilityAdded, HabilityRemoved, bus
 from src.models import User
 from src.repositories import UserRepository
 
 
 class UpdateUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        events: Optional[EventBus] = None,
+    ):
         self._user_repository = user_repository
+        self._events = events or bus
 
     def execute(self, id: int, **kwargs) -> User | None:
         if id is None:
@@ -18,10 +26,18 @@ class UpdateUserUseCase:
             # Caso de borda: usuário deletado entre as verificações.
             return
 
+        before = {h.id for h in user.habilities}
         user.update(**kwargs)
 
         self._user_repository.save(user)
 
+        # Publica só a diferença de habilidades, depois de gravada
+        after = {h.id for h in user.habilities}
+        for hability_id in sorted(after - before):
+            self._events.publish(HabilityAdded(id, hability_id))
+        for hability_id in sorted(before - after):
+            self._events.publish(HabilityRemoved(id, hability_id))
+
         return user
 
     @staticmethod